@@ -1,19 +1,55 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Request, Response, g, request, jsonify, send_file, stream_with_context
 from flask_cors import CORS
 from blockchain_handler import BlockchainHandler
+from zkp_engine import ProofEngine
+from blob_store import BlobStore
+from archive_hashing import hash_archive_entries, iter_archive_entries
+from certificate_codec import ID_BYTES
+from merkle import normalize_hash
+from request_profiler import RequestProfiler
+from rpc_pool import RPCPool
+import metrics
 import hashlib
+import hmac
 import json
 import os
+import threading
+import time
 from datetime import datetime
 from werkzeug.utils import secure_filename
 
+class CertificateRequest(Request):
+    """Request that lifts the upload size limit for archive verification and batch uploads only"""
+
+    @property
+    def max_content_length(self):
+        if self.endpoint == 'verify_archive':
+            return MAX_ARCHIVE_SIZE
+        if self.endpoint == 'upload_certificates_batch':
+            return MAX_BATCH_UPLOAD_SIZE
+        return super().max_content_length
+
 app = Flask(__name__)
+app.request_class = CertificateRequest
 CORS(app)  # Enable CORS for frontend communication
 
 # Configuration
 UPLOAD_FOLDER = 'uploads'
 ALLOWED_EXTENSIONS = {'pdf', 'png', 'jpg', 'jpeg'}
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+MAX_BULK_VERIFY_ITEMS = 5000
+
+# Batch uploads: total request size (each file is still held to MAX_FILE_SIZE)
+MAX_BATCH_UPLOAD_SIZE = int(os.environ.get('MAX_BATCH_UPLOAD_SIZE', str(512 * 1024 * 1024)))
+
+# Archive (ZIP/tar) verification: total upload size, files per archive,
+# hashes per chain lookup batch and hashing threads (0 = one per CPU)
+MAX_ARCHIVE_SIZE = int(os.environ.get('MAX_ARCHIVE_SIZE', str(512 * 1024 * 1024)))
+MAX_ARCHIVE_ENTRIES = 10000
+ARCHIVE_VERIFY_BATCH = 500
+HASH_WORKERS = int(os.environ.get('HASH_WORKERS', '0'))
 
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE
@@ -21,50 +57,524 @@ app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE
 # Create upload folder if it doesn't exist
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
+# Uploaded files are stored once per content hash under uploads/ab/cd/<hash>
+blob_store = BlobStore(UPLOAD_FOLDER)
+
 # Initialize blockchain handler
 # Update these values after deploying the contract
 CONTRACT_ADDRESS = None  # Will be loaded from deployment file
 CONTRACT_ABI_PATH = "deployments/contract_abi.json"
 
+# Comma-separated node URLs serving the same chain. With several, reads are
+# balanced and hedged across all of them and transactions go to the first.
+BLOCKCHAIN_PROVIDERS = [
+    url.strip() for url in os.environ.get('BLOCKCHAIN_PROVIDERS', 'http://127.0.0.1:7545').split(',') if url.strip()
+]
+
+# Local SQLite index answering verification reads (empty string disables it)
+CERTIFICATE_INDEX_PATH = os.environ.get('CERTIFICATE_INDEX_PATH', 'deployments/certificate_index.db')
+INDEX_CONFIRMATIONS = int(os.environ.get('INDEX_CONFIRMATIONS', '0'))
+
+# Zero-knowledge proof worker processes (0 = one per CPU)
+ZKP_WORKERS = int(os.environ.get('ZKP_WORKERS', '0'))
+MAX_ZKP_VERIFY_BATCH = 256
+
+# In-memory filter answering lookups of never-stored certificates locally
+EXISTENCE_FILTER = os.environ.get('EXISTENCE_FILTER', 'true').lower() in ('1', 'true', 'yes')
+EXISTENCE_FILTER_CAPACITY = int(os.environ.get('EXISTENCE_FILTER_CAPACITY', '100000'))
+
+# In-memory search index over holder, institution, type and issue date
+SEARCH_INDEX = os.environ.get('SEARCH_INDEX', 'true').lower() in ('1', 'true', 'yes')
+
+# Change feed: seconds between polls for live subscribers, seconds between
+# SSE keep-alive comments
+CHANGE_FEED_POLL_INTERVAL = float(os.environ.get('CHANGE_FEED_POLL_INTERVAL', '2.0'))
+SSE_KEEPALIVE_INTERVAL = 15.0
+
+# HTTP caching of GET verification resources: stored certificates never
+# change, while "not found" may stop being true with the next block.
+# Bump CERTIFICATE_RESOURCE_VERSION when the response body format changes.
+VERIFIED_MAX_AGE = 31536000
+NOT_FOUND_MAX_AGE = int(os.environ.get('NOT_FOUND_MAX_AGE', '5'))
+CERTIFICATE_RESOURCE_VERSION = 1
+
+# Request profiling, enabled by setting PROFILING_TOKEN. Requests sending the
+# token in X-Profile-Token are profiled, as is a PROFILE_SAMPLE_RATE share of
+# all requests; requests over SLOW_REQUEST_THRESHOLD seconds are captured
+# with their stacks and RPC timings, the last SLOW_REQUEST_BUFFER are kept.
+PROFILING_TOKEN = os.environ.get('PROFILING_TOKEN', '')
+PROFILE_SAMPLE_RATE = float(os.environ.get('PROFILE_SAMPLE_RATE', '0'))
+SLOW_REQUEST_THRESHOLD = float(os.environ.get('SLOW_REQUEST_THRESHOLD', '1.0'))
+SLOW_REQUEST_BUFFER = int(os.environ.get('SLOW_REQUEST_BUFFER', '100'))
+PROFILE_SAMPLE_INTERVAL = 0.005
+
+# Off-chain inclusion proofs for Merkle-batched anchoring
+MERKLE_PROOF_DB_PATH = os.environ.get('MERKLE_PROOF_DB_PATH', 'deployments/merkle_proofs.db')
+
+# Backoff between attempts to reach the node when it is not up yet
+INIT_RETRY_INITIAL = 1.0
+INIT_RETRY_MAX = 30.0
+
 blockchain = None
+proof_engine = None
+proof_engine_lock = threading.Lock()
+
+# Deployment record and ABI, read from disk once (before fork under serve.py)
+deployment_info = None
+contract_abi = None
+
+# Background connection per process, see start_blockchain_init
+blockchain_init_lock = threading.Lock()
+blockchain_init_pid = None
+
+# Cold-start measurements exposed on /metrics
+startup_timings = {}
+
+request_profiler = RequestProfiler(
+    sample_rate=PROFILE_SAMPLE_RATE,
+    slow_threshold=SLOW_REQUEST_THRESHOLD,
+    interval=PROFILE_SAMPLE_INTERVAL,
+    capacity=SLOW_REQUEST_BUFFER
+) if PROFILING_TOKEN else None
+
+def load_deployment():
+    """Read the deployed contract's address and ABI (no network access)
+
+    Returns:
+        True if a deployment record was found
+    """
+    global deployment_info, contract_abi, CONTRACT_ADDRESS
+
+    if not os.path.exists("deployments/CertificateVerifier.json"):
+        return False
+
+    with open("deployments/CertificateVerifier.json", 'r') as f:
+        deployment_info = json.load(f)
+    with open(CONTRACT_ABI_PATH, 'r') as f:
+        contract_abi = json.load(f)
+
+    CONTRACT_ADDRESS = deployment_info['address']
+    return True
 
 def init_blockchain():
     """Initialize blockchain connection"""
-    global blockchain, CONTRACT_ADDRESS
+    global blockchain
 
     try:
         # Try to load deployed contract info
-        if os.path.exists("deployments/CertificateVerifier.json"):
-            with open("deployments/CertificateVerifier.json", 'r') as f:
-                contract_info = json.load(f)
-                CONTRACT_ADDRESS = contract_info['address']
-
-            blockchain = BlockchainHandler(
-                provider_url="http://127.0.0.1:7545",
+        if deployment_info is not None or load_deployment():
+            handler = BlockchainHandler(
+                provider_url=BLOCKCHAIN_PROVIDERS,
                 contract_address=CONTRACT_ADDRESS,
-                contract_abi_path=CONTRACT_ABI_PATH
+                contract_abi=contract_abi
             )
+            if CERTIFICATE_INDEX_PATH:
+                handler.enable_index(
+                    CERTIFICATE_INDEX_PATH,
+                    start_block=deployment_info.get('deploymentBlock', 0),
+                    confirmations=INDEX_CONFIRMATIONS
+                )
+            if EXISTENCE_FILTER:
+                handler.enable_existence_filter(
+                    start_block=deployment_info.get('deploymentBlock', 0),
+                    capacity=EXISTENCE_FILTER_CAPACITY
+                )
+            handler.enable_change_feed(
+                start_block=deployment_info.get('deploymentBlock', 0),
+                confirmations=INDEX_CONFIRMATIONS,
+                poll_interval=CHANGE_FEED_POLL_INTERVAL
+            )
+            if SEARCH_INDEX:
+                handler.enable_search_index()
+            if MERKLE_PROOF_DB_PATH and handler.has_contract_function('anchorMerkleRoot'):
+                handler.enable_merkle_store(MERKLE_PROOF_DB_PATH)
+
+            # Publish only once fully set up, requests may be running already
+            blockchain = handler
             print("✓ Blockchain handler initialized successfully")
             return True
         else:
             print("⚠ Contract not deployed yet. Please run deployment first.")
-            blockchain = BlockchainHandler(provider_url="http://127.0.0.1:7545")
+            blockchain = BlockchainHandler(provider_url=BLOCKCHAIN_PROVIDERS)
             return False
     except Exception as e:
         print(f"✗ Error initializing blockchain: {str(e)}")
         return False
 
+def init_blockchain_with_retry():
+    """Call init_blockchain until the node is reachable, backing off exponentially"""
+    started = time.perf_counter()
+    delay = INIT_RETRY_INITIAL
+    attempts = 0
+
+    while True:
+        attempts += 1
+        init_blockchain()
+        if blockchain is not None:
+            break
+        print(f"⚠ Blockchain not reachable, retrying in {delay:.0f}s")
+        time.sleep(delay)
+        delay = min(delay * 2, INIT_RETRY_MAX)
+
+    startup_timings['blockchainInitSeconds'] = time.perf_counter() - started
+    startup_timings['blockchainInitAttempts'] = attempts
+    print(f"✓ Process {os.getpid()} connected in {startup_timings['blockchainInitSeconds']:.3f}s "
+          f"({attempts} attempt{'s' if attempts > 1 else ''})")
+
+def start_blockchain_init():
+    """Connect to the node in the background, once per process
+
+    Requests are served meanwhile; those needing the chain answer
+    "Blockchain not initialized" until the connection is up.
+    """
+    global blockchain_init_pid
+
+    with blockchain_init_lock:
+        if blockchain is not None or blockchain_init_pid == os.getpid():
+            return
+        blockchain_init_pid = os.getpid()
+
+    threading.Thread(target=init_blockchain_with_retry, name='blockchain-init', daemon=True).start()
+
+def get_proof_engine():
+    """Start the proof engine's worker pool on first use"""
+    global proof_engine
+    with proof_engine_lock:
+        if proof_engine is None:
+            proof_engine = ProofEngine(workers=ZKP_WORKERS or None)
+        return proof_engine
+
 def allowed_file(filename):
     """Check if file extension is allowed"""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+def certificate_id_error(cert_id):
+    """Reason the loaded contract cannot store a certificate ID, None if it can"""
+    if blockchain.compact_layout and len(cert_id.encode('utf-8')) > ID_BYTES:
+        return f'Certificate ID must be at most {ID_BYTES} bytes (UTF-8)'
+    return None
+
+def save_and_hash(file):
+    """Stream an uploaded file into the blob store while hashing it in the same pass
+
+    Chunks are written to a temporary file inside the store, which is linked
+    into place under its hash once the upload is complete (or dropped if the
+    same content is already stored), so only a few chunks of the document
+    are held in memory.
+
+    Returns:
+        Hex string of the file's SHA-256 hash
+    """
+    fd, tmp_path = blob_store.create_temp()
+    try:
+        with os.fdopen(fd, 'wb') as tmp:
+            cert_hash = blockchain.generate_certificate_hash_from_stream(file.stream, sink=tmp)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    blob_store.commit(tmp_path, cert_hash)
+    return cert_hash
+
+def uploaded_size(file):
+    """Size in bytes of an uploaded file part, leaving its stream at the start"""
+    file.stream.seek(0, os.SEEK_END)
+    size = file.stream.tell()
+    file.stream.seek(0)
+    return size
+
+def same_hash(a, b):
+    """Whether two hex certificate hashes are equal, whatever their spelling"""
+    try:
+        return normalize_hash(a) == normalize_hash(b)
+    except ValueError:
+        return False
+
+def is_truthy(value):
+    """Interpret a query string or form flag such as ?async=true"""
+    return value is not None and value.lower() in ('1', 'true', 'yes')
+
+def parse_min_block(value):
+    """Parse the optional minBlock consistency parameter (raises TypeError or ValueError)"""
+    if value is None or value == '':
+        return None
+    min_block = int(value)
+    if min_block < 0:
+        raise ValueError('minBlock must not be negative')
+    return min_block
+
+def parse_from_block(value):
+    """Parse a change feed from_block cursor (raises ValueError)"""
+    from_block = int(value)
+    if from_block < 0:
+        raise ValueError('from_block must not be negative')
+    return from_block
+
+def sse_event(event, data, event_id=None):
+    """Format one Server-Sent Events message"""
+    lines = [] if event_id is None else [f'id: {event_id}']
+    lines.append(f'event: {event}')
+    lines.append(f'data: {json.dumps(data)}')
+    return '\n'.join(lines) + '\n\n'
+
+def certificate_etag(kind, value):
+    """Strong ETag of a GET verification resource
+
+    Derived only from the contract address and the lookup key, which fully
+    determine a stored certificate, so conditional requests are answered
+    without a lookup.
+    """
+    key = f'{CERTIFICATE_RESOURCE_VERSION}:{CONTRACT_ADDRESS}:{kind}:{value}'
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()[:32]
+
+def certificate_resource(kind, value, lookup):
+    """Serve a verification result as a cacheable GET resource
+
+    Found certificates get a strong ETag and an immutable one-year
+    Cache-Control; misses are 404s cacheable for NOT_FOUND_MAX_AGE seconds.
+    A matching If-None-Match is a 304 that never reaches the blockchain handler.
+    """
+    etag = certificate_etag(kind, value)
+
+    # Only an exact tag counts: "*" must not turn a certificate that does not exist into a 304
+    if not request.if_none_match.star_tag and request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        cert_data = lookup(value)
+        if cert_data is None:
+            response = jsonify({'verified': False, 'message': 'Certificate not found'})
+            response.status_code = 404
+            response.cache_control.public = True
+            response.cache_control.max_age = NOT_FOUND_MAX_AGE
+            return response
+
+        response = jsonify({
+            'verified': True,
+            'message': 'Certificate verified successfully',
+            'certificate': cert_data
+        })
+
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = VERIFIED_MAX_AGE
+    response.cache_control.immutable = True
+    return response
+
+def verify_archive_entries(stream, min_block=None):
+    """Yield a verification report for every file in a ZIP or tar archive
+
+    Entries are hashed in a thread pool as they are read and looked up on
+    chain ARCHIVE_VERIFY_BATCH hashes at a time. Reports keep archive order.
+    """
+    hashed = hash_archive_entries(
+        iter_archive_entries(stream, MAX_FILE_SIZE),
+        workers=HASH_WORKERS or None
+    )
+
+    def verify(batch):
+        lookups = blockchain.verify_certificates_bulk(
+            [('hash', cert_hash) for _, cert_hash, _ in batch if cert_hash is not None],
+            min_block=min_block
+        )
+        for name, cert_hash, error in batch:
+            report = {'file': name, 'certificateHash': cert_hash, 'verified': False}
+            cert_data = lookups.get(('hash', cert_hash)) if error is None else None
+
+            if error is not None:
+                report['error'] = error
+            elif isinstance(cert_data, Exception):
+                report['error'] = str(cert_data)
+            elif cert_data is None:
+                report['message'] = 'Certificate not found or has been tampered with'
+            else:
+                report.update({'verified': True, 'certificate': cert_data})
+            yield report
+
+    batch = []
+    for count, entry in enumerate(hashed, start=1):
+        if count > MAX_ARCHIVE_ENTRIES:
+            raise ValueError(f'At most {MAX_ARCHIVE_ENTRIES} files per archive')
+        batch.append(entry)
+        if len(batch) >= ARCHIVE_VERIFY_BATCH:
+            yield from verify(batch)
+            batch = []
+
+    if batch:
+        yield from verify(batch)
+
+def parse_bulk_keys(items):
+    """Map bulk verification items to ('id' | 'hash', value) keys, None if invalid"""
+    keys = []
+    for item in items:
+        if isinstance(item, dict) and item.get('certificateId'):
+            keys.append(('id', str(item['certificateId'])))
+        elif isinstance(item, dict) and item.get('certificateHash'):
+            keys.append(('hash', str(item['certificateHash'])))
+        else:
+            keys.append(None)
+    return keys
+
+def bulk_verification_response(keys, lookups):
+    """Build the bulk verification response body, one result per key in order"""
+    results = []
+    for key in keys:
+        if key is None:
+            results.append({'verified': False, 'error': 'Item needs a certificateId or certificateHash'})
+            continue
+
+        kind, value = key
+        result = {'certificateId' if kind == 'id' else 'certificateHash': value}
+        cert_data = lookups.get(key)
+
+        if isinstance(cert_data, Exception):
+            result.update({'verified': False, 'error': str(cert_data)})
+        elif cert_data is None:
+            result.update({'verified': False, 'message': 'Certificate not found'})
+        else:
+            result.update({'verified': True, 'certificate': cert_data})
+
+        results.append(result)
+
+    return {
+        'success': True,
+        'count': len(results),
+        'verifiedCount': sum(1 for r in results if r['verified']),
+        'results': results
+    }
+
+def collect_cache_metrics():
+    """Expose verification cache statistics to the metrics registry"""
+    if blockchain is None:
+        return []
+
+    samples = []
+    if blockchain.existence_filter is not None:
+        filter_stats = blockchain.existence_filter.stats()
+        samples += [
+            ('existence_filter_checks_total', 'counter', 'Lookups checked against the existence filter', filter_stats['checks']),
+            ('existence_filter_negatives_total', 'counter', 'Lookups answered locally as certainly not stored', filter_stats['definiteNegatives']),
+            ('existence_filter_size_bytes', 'gauge', 'Memory held by the existence filter bit arrays', filter_stats['sizeBytes'])
+        ]
+
+    if blockchain.cache is None:
+        return samples
+
+    stats = blockchain.cache.stats()
+    return samples + [
+        ('verification_cache_hits_total', 'counter', 'Positive verification results served from cache', stats['hits']),
+        ('verification_cache_negative_hits_total', 'counter', 'Negative verification results served from cache', stats['negativeHits']),
+        ('verification_cache_misses_total', 'counter', 'Verification lookups not answered by the cache', stats['misses']),
+        ('verification_cache_evictions_total', 'counter', 'Entries evicted from the verification cache', stats['evictions']),
+        ('verification_cache_hit_ratio', 'gauge', 'Share of verification lookups answered by the cache', stats['hitRate']),
+        ('verification_cache_entries', 'gauge', 'Entries held by the verification cache', stats['entries']),
+        ('verification_cache_size_bytes', 'gauge', 'Estimated memory held by the verification cache', stats['sizeBytes'])
+    ]
+
+metrics.registry.register_collector(collect_cache_metrics)
+
+def collect_rpc_pool_metrics():
+    """Expose RPC endpoint pool statistics to the metrics registry"""
+    if blockchain is None or not isinstance(blockchain.web3.provider, RPCPool):
+        return []
+
+    stats = blockchain.web3.provider.stats()
+    return [
+        ('rpc_pool_reads_total', 'counter', 'Read requests sent through the endpoint pool', stats['reads']),
+        ('rpc_pool_hedges_total', 'counter', 'Reads hedged to a second endpoint after the hedge delay', stats['hedges']),
+        ('rpc_pool_hedge_wins_total', 'counter', 'Hedged reads answered first by the hedge', stats['hedgeWins']),
+        ('rpc_pool_failovers_total', 'counter', 'Reads retried on another endpoint after a transport error', stats['failovers']),
+        ('rpc_pool_endpoints', 'gauge', 'Endpoints configured in the pool', len(stats['endpoints'])),
+        ('rpc_pool_endpoints_available', 'gauge', 'Endpoints whose circuit breaker is closed',
+         sum(1 for endpoint in stats['endpoints'] if endpoint['state'] == 'closed'))
+    ]
+
+metrics.registry.register_collector(collect_rpc_pool_metrics)
+
+def collect_startup_metrics():
+    """Expose cold-start timings to the metrics registry"""
+    samples = []
+    if 'preloadSeconds' in startup_timings:
+        samples.append(('app_preload_seconds', 'gauge', 'Time to import the app and read the deployment before fork', startup_timings['preloadSeconds']))
+    if 'blockchainInitSeconds' in startup_timings:
+        samples.append(('blockchain_init_seconds', 'gauge', 'Time this process took to connect to the node', startup_timings['blockchainInitSeconds']))
+        samples.append(('blockchain_init_attempts', 'gauge', 'Connection attempts needed to reach the node', startup_timings['blockchainInitAttempts']))
+    return samples
+
+metrics.registry.register_collector(collect_startup_metrics)
+
+def has_profiling_token():
+    """Whether the request carries the profiling token"""
+    token = request.headers.get('X-Profile-Token')
+    return bool(PROFILING_TOKEN) and token is not None and hmac.compare_digest(token, PROFILING_TOKEN)
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+    if request_profiler is not None:
+        endpoint = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+        g.request_profile = request_profiler.begin(f'{request.method} {endpoint}', force=has_profiling_token())
+    start_blockchain_init()
+
+@app.after_request
+def record_request_timing(response):
+    started = g.pop('request_started', None)
+    if started is not None:
+        endpoint = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+        metrics.http_duration.observe(
+            time.perf_counter() - started, endpoint, request.method, response.status_code
+        )
+
+    # Ends before a streamed body is sent, so long-lived streams are not "slow"
+    profile = g.pop('request_profile', None)
+    if profile is not None:
+        request_profiler.end(profile, response.status_code)
+    return response
+
+@app.teardown_request
+def end_request_profile(error):
+    # Only reached with a profile still open when the view raised
+    profile = g.pop('request_profile', None)
+    if profile is not None:
+        request_profiler.end(profile, 500)
+
+@app.route('/metrics')
+def get_metrics():
+    """Prometheus metrics endpoint"""
+    return Response(metrics.registry.render(), mimetype='text/plain; version=0.0.4')
+
+@app.route('/api/admin/profiles', methods=['GET', 'DELETE'])
+def get_request_profiles():
+    """Slow and sampled request captures (requires the X-Profile-Token header)
+
+    ``?format=collapsed`` returns all captured samples as collapsed stacks
+    for flamegraph.pl or speedscope; DELETE empties the buffer.
+    """
+    if request_profiler is None:
+        return jsonify({'error': 'Profiling is not enabled'}), 404
+    if not has_profiling_token():
+        return jsonify({'error': 'Invalid or missing X-Profile-Token'}), 403
+
+    if request.method == 'DELETE':
+        request_profiler.clear()
+        return jsonify({'success': True})
+
+    if request.args.get('format') == 'collapsed':
+        return Response(request_profiler.collapsed_stacks(), mimetype='text/plain')
+
+    captures = request_profiler.captures()
+    return jsonify({
+        'slowThresholdSeconds': request_profiler.slow_threshold,
+        'sampleRate': request_profiler.sample_rate,
+        'count': len(captures),
+        'captures': captures
+    })
+
 @app.route('/')
 def index():
     """Health check endpoint"""
     return jsonify({
         'status': 'ok',
         'message': 'Certificate Verifier API is running',
-        'blockchain_connected': blockchain is not None and blockchain.web3.is_connected(),
+        'blockchain_connected': blockchain is not None and blockchain.is_connected(),
         'contract_loaded': blockchain is not None and blockchain.contract is not None
     })
 
@@ -80,9 +590,27 @@ def get_blockchain_info():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/cache/stats', methods=['GET'])
+def get_cache_stats():
+    """Get verification cache hit/miss counters"""
+    if blockchain is None:
+        return jsonify({'error': 'Blockchain not initialized'}), 500
+
+    filter_stats = blockchain.existence_filter.stats() if blockchain.existence_filter is not None else None
+
+    if blockchain.cache is None:
+        return jsonify({'enabled': False, 'existenceFilter': filter_stats})
+
+    return jsonify({'enabled': True, **blockchain.cache.stats(), 'existenceFilter': filter_stats})
+
 @app.route('/api/certificate/upload', methods=['POST'])
 def upload_certificate():
-    """Upload and store certificate"""
+    """Upload and store certificate
+
+    With ``async=true`` (query string or form field) the request returns
+    202 as soon as the transaction is submitted; follow it at
+    /api/certificate/jobs/<transactionHash>.
+    """
     if blockchain is None or blockchain.contract is None:
         return jsonify({'error': 'Blockchain not initialized'}), 500
 
@@ -110,22 +638,44 @@ def upload_certificate():
         if not all([cert_id, holder_name, cert_type, issue_date_str]):
             return jsonify({'error': 'Missing required fields'}), 400
 
+        id_error = certificate_id_error(cert_id)
+        if id_error is not None:
+            return jsonify({'error': id_error}), 400
+
         # Convert issue date to timestamp
         try:
             issue_date = int(datetime.fromisoformat(issue_date_str).timestamp())
         except:
             return jsonify({'error': 'Invalid date format'}), 400
 
-        # Read file data and generate hash
-        file_data = file.read()
-        cert_hash = blockchain.generate_certificate_hash(file_data)
+        # Save file and generate hash in one streaming pass
+        filename = secure_filename(file.filename)
+        cert_hash = save_and_hash(file)
+
+        if is_truthy(request.args.get('async') or request.form.get('async')):
+            # The file is only served once the issuance has been mined successfully
+            job = blockchain.store_certificate_async(
+                cert_id,
+                cert_hash,
+                holder_name,
+                cert_type,
+                institution,
+                issue_date,
+                on_stored=lambda receipt: blob_store.attach(cert_id, cert_hash, filename)
+            )
 
-        # Save file
-        filename = secure_filename(f"{cert_id}_{file.filename}")
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+            if job is None:
+                return jsonify({'error': 'Failed to submit certificate to blockchain'}), 500
 
-        with open(filepath, 'wb') as f:
-            f.write(file_data)
+            return jsonify({
+                'success': True,
+                'message': 'Certificate submitted, transaction pending',
+                'certificateId': cert_id,
+                'certificateHash': cert_hash,
+                'transactionHash': job['transactionHash'],
+                'status': job['status'],
+                'statusUrl': f"/api/certificate/jobs/{job['transactionHash']}"
+            }), 202
 
         # Store on blockchain
         tx_receipt = blockchain.store_certificate(
@@ -140,6 +690,8 @@ def upload_certificate():
         if tx_receipt is None:
             return jsonify({'error': 'Failed to store certificate on blockchain'}), 500
 
+        blob_store.attach(cert_id, cert_hash, filename)
+
         return jsonify({
             'success': True,
             'message': 'Certificate stored successfully',
@@ -153,6 +705,186 @@ def upload_certificate():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/certificate/jobs/<tx_hash>', methods=['GET'])
+def get_issuance_job(tx_hash):
+    """Get the status of an asynchronously submitted certificate"""
+    if blockchain is None:
+        return jsonify({'error': 'Blockchain not initialized'}), 500
+
+    try:
+        try:
+            job = blockchain.get_transaction_status(tx_hash)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        if job is None:
+            return jsonify({'error': 'Transaction not found'}), 404
+        return jsonify(job)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/certificates/upload/batch', methods=['POST'])
+def upload_certificates_batch():
+    """Upload and store many certificates in one pipelined batch
+
+    Expects multipart form data with repeated ``files`` parts and a
+    ``metadata`` field holding a JSON list of objects (certificateId,
+    holderName, certificateType, institution, issueDate), one per file
+    and in the same order.
+    """
+    if blockchain is None or blockchain.contract is None:
+        return jsonify({'error': 'Blockchain not initialized'}), 500
+
+    try:
+        files = request.files.getlist('files')
+        if not files:
+            return jsonify({'error': 'No files provided'}), 400
+
+        try:
+            metadata = json.loads(request.form.get('metadata', ''))
+        except ValueError:
+            return jsonify({'error': 'Invalid metadata JSON'}), 400
+
+        if not isinstance(metadata, list) or len(metadata) != len(files):
+            return jsonify({'error': 'Metadata must be a list with one entry per file'}), 400
+
+        results = [None] * len(files)
+        to_store = []
+        positions = []
+
+        for i, (file, meta) in enumerate(zip(files, metadata)):
+            if not isinstance(meta, dict):
+                results[i] = {'success': False, 'certificateId': None,
+                              'error': 'Metadata entry must be an object'}
+                continue
+
+            cert_id = meta.get('certificateId')
+
+            if file.filename == '' or not allowed_file(file.filename):
+                results[i] = {'success': False, 'certificateId': cert_id,
+                              'error': 'File type not allowed'}
+                continue
+
+            if uploaded_size(file) > MAX_FILE_SIZE:
+                results[i] = {'success': False, 'certificateId': cert_id,
+                              'error': f'File larger than {MAX_FILE_SIZE // (1024 * 1024)}MB'}
+                continue
+
+            holder_name = meta.get('holderName')
+            cert_type = meta.get('certificateType')
+            institution = meta.get('institution', 'Unknown Institution')
+            issue_date_str = meta.get('issueDate')
+
+            if not all([cert_id, holder_name, cert_type, issue_date_str]):
+                results[i] = {'success': False, 'certificateId': cert_id,
+                              'error': 'Missing required fields'}
+                continue
+
+            if not all(isinstance(value, str) for value in (cert_id, holder_name, cert_type, institution,
+                                                             issue_date_str)):
+                results[i] = {'success': False, 'certificateId': cert_id,
+                              'error': 'Metadata fields must be strings'}
+                continue
+
+            id_error = certificate_id_error(cert_id)
+            if id_error is not None:
+                results[i] = {'success': False, 'certificateId': cert_id, 'error': id_error}
+                continue
+
+            try:
+                issue_date = int(datetime.fromisoformat(issue_date_str).timestamp())
+            except (TypeError, ValueError):
+                results[i] = {'success': False, 'certificateId': cert_id,
+                              'error': 'Invalid date format'}
+                continue
+
+            cert_hash = save_and_hash(file)
+
+            to_store.append({
+                'certificateId': cert_id,
+                'certificateHash': cert_hash,
+                'holderName': holder_name,
+                'certificateType': cert_type,
+                'institution': institution,
+                'issueDate': issue_date
+            })
+            positions.append(i)
+
+        if to_store:
+            stored_results = blockchain.store_certificates_batch(to_store)
+            for i, cert, result in zip(positions, to_store, stored_results):
+                results[i] = result
+                if result['success']:
+                    blob_store.attach(cert['certificateId'], cert['certificateHash'],
+                                      secure_filename(files[i].filename))
+
+        for i, file in enumerate(files):
+            results[i]['filename'] = file.filename
+
+        stored = sum(1 for r in results if r['success'])
+
+        return jsonify({
+            'success': stored == len(results),
+            'message': f'Stored {stored} of {len(results)} certificates',
+            'stored': stored,
+            'failed': len(results) - stored,
+            'results': results
+        })
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/certificates/<cert_id>/file', methods=['GET'])
+def get_certificate_file(cert_id):
+    """Download the file uploaded for a certificate
+
+    Files are content addressed and never change, so responses carry the
+    blob hash as ETag and may be cached indefinitely.
+    """
+    try:
+        stored = blob_store.get(cert_id)
+
+        if stored is None or not os.path.exists(stored['path']):
+            return jsonify({'error': 'No file stored for this certificate'}), 404
+
+        response = send_file(
+            stored['path'],
+            download_name=stored['filename'],
+            etag=stored['blobHash'],
+            conditional=True,
+            max_age=31536000
+        )
+        response.cache_control.immutable = True
+        return response
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/certificates/id/<path:cert_id>', methods=['GET'])
+def get_certificate(cert_id):
+    """Verify a certificate by ID as an HTTP-cacheable resource
+
+    IDs may contain "/" and may equal the names of sibling routes such as
+    ``list`` or ``search``.
+    """
+    if blockchain is None or blockchain.contract is None:
+        return jsonify({'error': 'Blockchain not initialized'}), 500
+
+    try:
+        return certificate_resource('id', cert_id, blockchain.verify_certificate_by_id)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/certificates/by-hash/<cert_hash>', methods=['GET'])
+def get_certificate_by_hash(cert_hash):
+    """Verify a certificate by hash as an HTTP-cacheable resource"""
+    if blockchain is None or blockchain.contract is None:
+        return jsonify({'error': 'Blockchain not initialized'}), 500
+
+    try:
+        return certificate_resource('hash', cert_hash, blockchain.verify_certificate_by_hash)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/certificate/verify/id', methods=['POST'])
 def verify_by_id():
     """Verify certificate by ID"""
@@ -166,7 +898,12 @@ def verify_by_id():
         if not cert_id:
             return jsonify({'error': 'Certificate ID is required'}), 400
 
-        cert_data = blockchain.verify_certificate_by_id(cert_id)
+        try:
+            min_block = parse_min_block(data.get('minBlock'))
+        except (TypeError, ValueError):
+            return jsonify({'error': 'Invalid minBlock'}), 400
+
+        cert_data = blockchain.verify_certificate_by_id(cert_id, min_block=min_block)
 
         if cert_data is None:
             return jsonify({
@@ -196,7 +933,12 @@ def verify_by_hash():
         if not cert_hash:
             return jsonify({'error': 'Certificate hash is required'}), 400
 
-        cert_data = blockchain.verify_certificate_by_hash(cert_hash)
+        try:
+            min_block = parse_min_block(data.get('minBlock'))
+        except (TypeError, ValueError):
+            return jsonify({'error': 'Invalid minBlock'}), 400
+
+        cert_data = blockchain.verify_certificate_by_hash(cert_hash, min_block=min_block)
 
         if cert_data is None:
             return jsonify({
@@ -228,12 +970,16 @@ def verify_by_file():
         if file.filename == '':
             return jsonify({'error': 'No file selected'}), 400
 
-        # Generate hash from file
-        file_data = file.read()
-        cert_hash = blockchain.generate_certificate_hash(file_data)
+        try:
+            min_block = parse_min_block(request.form.get('minBlock'))
+        except ValueError:
+            return jsonify({'error': 'Invalid minBlock'}), 400
+
+        # Generate hash from file without buffering it in memory
+        cert_hash = blockchain.generate_certificate_hash_from_stream(file.stream)
 
         # Verify using hash
-        cert_data = blockchain.verify_certificate_by_hash(cert_hash)
+        cert_data = blockchain.verify_certificate_by_hash(cert_hash, min_block=min_block)
 
         if cert_data is None:
             return jsonify({
@@ -251,52 +997,515 @@ def verify_by_file():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/certificates/verify/bulk', methods=['POST'])
+def verify_bulk():
+    """Verify a mixed list of certificate IDs and hashes in one call
+
+    Expects ``{"items": [{"certificateId": "..."}, {"certificateHash": "..."}]}``.
+    Duplicates are looked up once; results are returned in input order.
+    """
+    if blockchain is None or blockchain.contract is None:
+        return jsonify({'error': 'Blockchain not initialized'}), 500
+
+    try:
+        data = request.get_json()
+        items = data.get('items')
+
+        if not isinstance(items, list) or not items:
+            return jsonify({'error': 'A non-empty list of items is required'}), 400
+
+        if len(items) > MAX_BULK_VERIFY_ITEMS:
+            return jsonify({'error': f'At most {MAX_BULK_VERIFY_ITEMS} items per call'}), 400
+
+        try:
+            min_block = parse_min_block(data.get('minBlock'))
+        except (TypeError, ValueError):
+            return jsonify({'error': 'Invalid minBlock'}), 400
+
+        keys = parse_bulk_keys(items)
+        lookups = blockchain.verify_certificates_bulk([k for k in keys if k is not None], min_block=min_block)
+
+        return jsonify(bulk_verification_response(keys, lookups))
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/certificates/verify/archive', methods=['POST'])
+def verify_archive():
+    """Verify every certificate file in an uploaded ZIP or tar archive
+
+    The archive is read in place, never extracted to disk. ``?format=ndjson``
+    (or ``Accept: application/x-ndjson``) streams one report per file as it
+    is verified instead of a single JSON document.
+    """
+    if blockchain is None or blockchain.contract is None:
+        return jsonify({'error': 'Blockchain not initialized'}), 500
+
+    try:
+        if 'archive' not in request.files:
+            return jsonify({'error': 'No archive provided'}), 400
+
+        archive = request.files['archive']
+
+        if archive.filename == '':
+            return jsonify({'error': 'No archive selected'}), 400
+
+        try:
+            min_block = parse_min_block(request.form.get('minBlock'))
+        except ValueError:
+            return jsonify({'error': 'Invalid minBlock'}), 400
+
+        streaming = request.args.get('format') == 'ndjson' or \
+            request.accept_mimetypes.best == 'application/x-ndjson'
+
+        if streaming:
+            def generate():
+                try:
+                    for report in verify_archive_entries(archive.stream, min_block):
+                        yield json.dumps(report) + '\n'
+                except Exception as e:
+                    yield json.dumps({'error': str(e)}) + '\n'
+
+            return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+        try:
+            reports = list(verify_archive_entries(archive.stream, min_block))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        return jsonify({
+            'success': True,
+            'fileCount': len(reports),
+            'verifiedCount': sum(1 for r in reports if r['verified']),
+            'errorCount': sum(1 for r in reports if 'error' in r),
+            'results': reports
+        })
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/certificates/anchor/batch', methods=['POST'])
+def anchor_certificates_batch():
+    """Anchor a batch of certificates on chain as a single Merkle root
+
+    Accepts either multipart form data with repeated ``files`` parts, or a
+    JSON body ``{"certificateHashes": [...]}``. Inclusion proofs are kept
+    off chain and used by /api/certificate/verify/merkle.
+    """
+    if blockchain is None or blockchain.contract is None:
+        return jsonify({'error': 'Blockchain not initialized'}), 500
+
+    if blockchain.merkle_store is None:
+        return jsonify({'error': 'Merkle anchoring not enabled for this contract'}), 500
+
+    try:
+        items = []
+        if request.files:
+            for file in request.files.getlist('files'):
+                cert_hash = blockchain.generate_certificate_hash_from_stream(file.stream)
+                items.append({'filename': file.filename, 'certificateHash': cert_hash})
+        else:
+            data = request.get_json(silent=True) or {}
+            items = [{'certificateHash': h} for h in data.get('certificateHashes', [])]
+
+        if not items:
+            return jsonify({'error': 'No certificates provided'}), 400
+
+        try:
+            for item in items:
+                normalize_hash(item['certificateHash'])
+        except (AttributeError, ValueError):
+            return jsonify({'error': 'Invalid certificate hash'}), 400
+
+        anchor = blockchain.anchor_certificate_batch([item['certificateHash'] for item in items])
+
+        if anchor is None:
+            return jsonify({'error': 'Failed to anchor certificate batch on blockchain'}), 500
+
+        for leaf_index, item in enumerate(items):
+            item['leafIndex'] = leaf_index
+
+        return jsonify({
+            'success': True,
+            'message': f"Anchored {anchor['leafCount']} certificates",
+            **anchor,
+            'certificates': items
+        })
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/certificate/verify/merkle', methods=['POST'])
+def verify_by_merkle_proof():
+    """Verify a certificate against an anchored Merkle root
+
+    Accepts a JSON body with ``certificateHash`` and an optional ``proof``
+    (``{"siblings": [...], "path": n}``), or multipart form data with a
+    ``file`` and optional ``proof`` JSON field. Without a proof the stored
+    one is used.
+    """
+    if blockchain is None or blockchain.contract is None:
+        return jsonify({'error': 'Blockchain not initialized'}), 500
+
+    try:
+        if 'file' in request.files:
+            cert_hash = blockchain.generate_certificate_hash_from_stream(request.files['file'].stream)
+            proof = json.loads(request.form['proof']) if request.form.get('proof') else None
+        else:
+            data = request.get_json(silent=True) or {}
+            cert_hash = data.get('certificateHash')
+            proof = data.get('proof')
+
+        if not cert_hash:
+            return jsonify({'error': 'Certificate hash is required'}), 400
+
+        try:
+            normalize_hash(cert_hash)
+        except ValueError:
+            return jsonify({'error': 'Invalid certificate hash'}), 400
+
+        cert_data = blockchain.verify_certificate_by_merkle_proof(cert_hash, proof)
+
+        if cert_data is None:
+            return jsonify({
+                'verified': False,
+                'message': 'Certificate not found in any anchored batch'
+            })
+
+        return jsonify({
+            'verified': True,
+            'message': 'Certificate verified against anchored Merkle root',
+            'certificate': cert_data
+        })
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/certificates/list', methods=['GET'])
 def list_certificates():
-    """Get all certificates"""
+    """Get all certificates
+
+    Query parameters:
+        cursor: Resume position returned as ``nextCursor`` by a previous page
+        limit: Page size (default 100, max 1000); enables pagination
+        format: ``ndjson`` streams one certificate per line instead
+
+    Without cursor, limit or format the full registry is returned in the
+    same shape as before, streamed one chunk of certificates at a time.
+    """
     if blockchain is None or blockchain.contract is None:
         return jsonify({'error': 'Blockchain not initialized'}), 500
 
     try:
-        certificates = blockchain.get_all_certificates()
+        try:
+            cursor = int(request.args.get('cursor') or 0)
+            limit = int(request.args.get('limit') or DEFAULT_PAGE_SIZE)
+        except ValueError:
+            return jsonify({'error': 'Invalid cursor or limit'}), 400
+
+        if cursor < 0 or limit < 1:
+            return jsonify({'error': 'Invalid cursor or limit'}), 400
+
+        streaming = request.args.get('format') == 'ndjson' or \
+            request.accept_mimetypes.best == 'application/x-ndjson'
+
+        if streaming:
+            def generate():
+                for cert in blockchain.iter_certificates(start=cursor):
+                    yield json.dumps(cert) + '\n'
+
+            return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+        if 'cursor' in request.args or 'limit' in request.args:
+            certificates, next_cursor, total = blockchain.get_certificates_page(
+                cursor, min(limit, MAX_PAGE_SIZE)
+            )
+            return jsonify({
+                'count': len(certificates),
+                'total': total,
+                'certificates': certificates,
+                'nextCursor': str(next_cursor) if next_cursor is not None else None
+            })
+
+        certificates = blockchain.iter_certificates()
+        # Read the first chunk up front, so an unreachable node still gets a 500
+        first = next(certificates, None)
+
+        def generate():
+            yield '{"certificates": ['
+            count = 0
+            if first is not None:
+                yield json.dumps(first)
+                count = 1
+                for cert in certificates:
+                    yield ', ' + json.dumps(cert)
+                    count += 1
+            yield '], "count": ' + str(count) + '}\n'
+
+        return Response(stream_with_context(generate()), mimetype='application/json')
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/certificates/search', methods=['GET'])
+def search_certificates():
+    """Search certificates by holder, institution, type and issue date
+
+    Query parameters (all optional, combined with AND):
+        holder: Case-insensitive prefix of the holder name
+        institution: Case-insensitive prefix of the institution
+        type: Exact certificate type
+        issued_from, issued_to: Issue date range, inclusive, in Unix seconds
+        cursor: Resume position returned as ``nextCursor`` by a previous page
+        limit: Page size (default 100, max 1000)
+
+    Results come in registry order, like /api/certificates/list.
+    """
+    if blockchain is None or blockchain.search_index is None:
+        return jsonify({'error': 'Search index not initialized'}), 500
+
+    try:
+        try:
+            cursor = int(request.args.get('cursor') or 0)
+            limit = int(request.args.get('limit') or DEFAULT_PAGE_SIZE)
+            issued_from = request.args.get('issued_from')
+            issued_to = request.args.get('issued_to')
+            issued_from = int(issued_from) if issued_from else None
+            issued_to = int(issued_to) if issued_to else None
+        except ValueError:
+            return jsonify({'error': 'Invalid cursor, limit or issue date'}), 400
+
+        if cursor < 0 or limit < 1:
+            return jsonify({'error': 'Invalid cursor, limit or issue date'}), 400
+
+        certificates, next_cursor = blockchain.search_certificates(
+            holder=request.args.get('holder', '').strip() or None,
+            institution=request.args.get('institution', '').strip() or None,
+            cert_type=request.args.get('type') or None,
+            issued_from=issued_from,
+            issued_to=issued_to,
+            cursor=cursor,
+            limit=min(limit, MAX_PAGE_SIZE)
+        )
+        return jsonify({
+            'count': len(certificates),
+            'certificates': certificates,
+            'nextCursor': str(next_cursor) if next_cursor is not None else None
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/certificates/changes', methods=['GET'])
+def get_certificate_changes():
+    """Get certificates stored since a block, for mirrors of the registry
+
+    Query parameters:
+        from_block: First block to include (default: the deployment block);
+            pass the previous response's ``nextBlock`` to resume
+        limit: Certificates per page (default 100, max 1000); pages end on
+            block boundaries
+    """
+    if blockchain is None or blockchain.change_feed is None:
+        return jsonify({'error': 'Blockchain not initialized'}), 500
+
+    try:
+        try:
+            from_block = parse_from_block(request.args.get('from_block') or 0)
+            limit = int(request.args.get('limit') or DEFAULT_PAGE_SIZE)
+        except ValueError:
+            return jsonify({'error': 'Invalid from_block or limit'}), 400
+
+        if limit < 1:
+            return jsonify({'error': 'Invalid from_block or limit'}), 400
+
+        certificates, next_block, head = blockchain.change_feed.since(from_block, min(limit, MAX_PAGE_SIZE))
         return jsonify({
             'count': len(certificates),
-            'certificates': certificates
+            'certificates': certificates,
+            'nextBlock': next_block,
+            'latestBlock': head,
+            'complete': next_block > head
         })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/certificates/changes/stream', methods=['GET'])
+def stream_certificate_changes():
+    """Push newly stored certificates as Server-Sent Events
+
+    Each certificate is a ``certificate`` event. A ``checkpoint`` event,
+    whose event id is the last block it covers, follows every block range,
+    so a reconnecting EventSource resumes through ``Last-Event-ID``
+    (certificates after the last checkpoint may be delivered again).
+    ``?from_block=N`` replays history from block N before going live.
+    """
+    if blockchain is None or blockchain.change_feed is None:
+        return jsonify({'error': 'Blockchain not initialized'}), 500
+
+    try:
+        if request.headers.get('Last-Event-ID'):
+            from_block = parse_from_block(request.headers['Last-Event-ID']) + 1
+        elif request.args.get('from_block'):
+            from_block = parse_from_block(request.args['from_block'])
+        else:
+            from_block = None
+    except ValueError:
+        return jsonify({'error': 'Invalid from_block or Last-Event-ID'}), 400
+
+    feed = blockchain.change_feed
+
+    def generate():
+        subscription = feed.subscribe()
+        try:
+            yield 'retry: 5000\n\n'
+
+            # Catch up to where the live updates start, one page at a time
+            next_block = from_block if from_block is not None else subscription.position + 1
+            while next_block <= subscription.position:
+                certificates, next_block, _ = feed.since(next_block, MAX_PAGE_SIZE, subscription.position)
+                for cert in certificates:
+                    yield sse_event('certificate', cert)
+                yield sse_event('checkpoint', {'block': next_block - 1}, next_block - 1)
+
+            while True:
+                update = subscription.get(timeout=SSE_KEEPALIVE_INTERVAL)
+                if update is None:
+                    if subscription.closed:
+                        return
+                    yield ': keep-alive\n\n'
+                    continue
+
+                to_block, certificates = update
+                for cert in certificates:
+                    yield sse_event('certificate', cert)
+                yield sse_event('checkpoint', {'block': to_block}, to_block)
+        except Exception as e:
+            yield sse_event('error', {'error': str(e)})
+        finally:
+            feed.unsubscribe(subscription)
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
 @app.route('/api/zkp/generate', methods=['POST'])
 def generate_zkp():
-    """Generate zero-knowledge proof (simplified version)"""
+    """Generate a zero-knowledge proof of possession of a certificate
+
+    Expects multipart form data with ``certificateId`` and the certificate
+    ``file``. The proof shows the prover holds the document recorded for
+    the certificate without revealing it; the document must hash to the
+    certificate's hash on chain and is not stored.
+    """
+    if blockchain is None or blockchain.contract is None:
+        return jsonify({'error': 'Blockchain not initialized'}), 500
+
     try:
-        data = request.get_json()
-        cert_id = data.get('certificateId')
+        cert_id = request.form.get('certificateId')
 
         if not cert_id:
             return jsonify({'error': 'Certificate ID is required'}), 400
 
-        # In a real implementation, this would use a ZKP library
-        # For now, we'll return a mock proof
-        mock_proof = {
-            'proof': hashlib.sha256(f"{cert_id}_proof".encode()).hexdigest(),
-            'publicInputs': {
-                'certificateId': cert_id,
-                'timestamp': int(datetime.now().timestamp())
-            },
-            'proofSize': 192,  # bytes
-            'generationTime': '< 1ms'
-        }
+        if 'file' not in request.files:
+            return jsonify({'error': 'Certificate file is required'}), 400
+
+        document = request.files['file'].read()
+
+        cert_data = blockchain.verify_certificate_by_id(cert_id)
+        if cert_data is None:
+            return jsonify({'error': 'Certificate not found'}), 404
+
+        if not same_hash(blockchain.generate_certificate_hash(document), cert_data['certificateHash']):
+            return jsonify({'error': 'File does not match the certificate on record'}), 400
+
+        proof = get_proof_engine().generate(cert_id, document)
 
         return jsonify({
             'success': True,
-            'zkProof': mock_proof,
+            'zkProof': {
+                'proof': proof['proof'],
+                'publicInputs': proof['publicInputs'],
+                'proofSize': proof['proofSize'],
+                'scheme': proof['scheme'],
+                'generationTime': f"{proof['generationMs']:.2f}ms",
+                'cached': proof['cached']
+            },
             'message': 'Zero-knowledge proof generated successfully'
         })
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/zkp/verify', methods=['POST'])
+def verify_zkp():
+    """Verify one or more zero-knowledge proofs in a single call
+
+    Expects ``{"proofs": [{"proof": "...", "publicInputs": {...}}, ...]}``
+    as returned in ``zkProof`` by /api/zkp/generate. Each proof's
+    commitment must match the one derived from the certificate's document
+    held in the blob store, whose hash must be the one on chain, so a
+    proof only verifies for the document that was issued.
+    """
+    if blockchain is None or blockchain.contract is None:
+        return jsonify({'error': 'Blockchain not initialized'}), 500
+
+    try:
+        data = request.get_json()
+        proofs = data.get('proofs')
+
+        if not isinstance(proofs, list) or not proofs:
+            return jsonify({'error': 'A non-empty list of proofs is required'}), 400
+
+        if len(proofs) > MAX_ZKP_VERIFY_BATCH:
+            return jsonify({'error': f'At most {MAX_ZKP_VERIFY_BATCH} proofs per call'}), 400
+
+        started = time.perf_counter()
+
+        cert_ids = []
+        for p in proofs:
+            public_inputs = p.get('publicInputs') if isinstance(p, dict) else None
+            cert_id = public_inputs.get('certificateId') if isinstance(public_inputs, dict) else None
+            cert_ids.append(cert_id if isinstance(cert_id, str) and cert_id else None)
+
+        records = blockchain.verify_certificates_bulk([('id', cert_id) for cert_id in cert_ids if cert_id])
+
+        results = [None] * len(proofs)
+        items, positions = [], []
+        for i, (p, cert_id) in enumerate(zip(proofs, cert_ids)):
+            if cert_id is None:
+                results[i] = {'valid': False, 'error': 'Malformed proof or public inputs'}
+                continue
+            record = records.get(('id', cert_id))
+            if isinstance(record, Exception):
+                results[i] = {'valid': False, 'error': str(record)}
+            elif record is None:
+                results[i] = {'valid': False, 'error': 'Certificate not found'}
+            else:
+                stored = blob_store.get(cert_id)
+                if stored is None or not same_hash(stored['blobHash'], record['certificateHash']):
+                    results[i] = {'valid': False, 'error': 'No document on record for this certificate'}
+                    continue
+                items.append((p.get('proof'), p['publicInputs'], stored['path']))
+                positions.append(i)
+
+        for i, (valid, error) in zip(positions, get_proof_engine().verify_batch(items)):
+            results[i] = {'valid': valid}
+            if error:
+                results[i]['error'] = error
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        return jsonify({
+            'success': True,
+            'allValid': all(r['valid'] for r in results),
+            'results': results,
+            'verificationTime': f"{elapsed_ms:.2f}ms"
+        })
+
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 if __name__ == '__main__':
     print("\n" + "="*60)
     print("🎓 Certificate Verifier API Server")
@@ -309,13 +1518,29 @@ if __name__ == '__main__':
     print("   API will be available at: http://127.0.0.1:5000")
     print("\n📚 Available endpoints:")
     print("   GET  /                          - Health check")
+    print("   GET  /metrics                   - Prometheus metrics")
     print("   GET  /api/blockchain/info       - Get blockchain info")
+    print("   GET  /api/cache/stats           - Verification cache statistics")
+    print("   GET  /api/admin/profiles        - Slow request captures (X-Profile-Token)")
     print("   POST /api/certificate/upload    - Upload certificate")
+    print("   GET  /api/certificate/jobs/<tx> - Async upload status")
+    print("   POST /api/certificates/upload/batch - Upload certificates in batch")
+    print("   GET  /api/certificates/<id>/file - Download a certificate's file")
+    print("   GET  /api/certificates/id/<id>  - Verify by ID (cacheable, ETag)")
+    print("   GET  /api/certificates/by-hash/<hash> - Verify by hash (cacheable, ETag)")
     print("   POST /api/certificate/verify/id - Verify by ID")
     print("   POST /api/certificate/verify/hash - Verify by hash")
     print("   POST /api/certificate/verify/file - Verify by file")
-    print("   GET  /api/certificates/list     - List all certificates")
+    print("   POST /api/certificates/verify/bulk - Verify many IDs/hashes at once")
+    print("   POST /api/certificates/verify/archive - Verify every file in a ZIP/tar")
+    print("   POST /api/certificates/anchor/batch - Anchor a batch as one Merkle root")
+    print("   POST /api/certificate/verify/merkle - Verify by Merkle proof")
+    print("   GET  /api/certificates/list     - List certificates (?cursor=&limit=, ?format=ndjson)")
+    print("   GET  /api/certificates/search   - Search (?holder=&institution=&type=&issued_from=&issued_to=)")
+    print("   GET  /api/certificates/changes  - Certificates stored since a block (?from_block=)")
+    print("   GET  /api/certificates/changes/stream - Live certificates as Server-Sent Events")
     print("   POST /api/zkp/generate          - Generate ZK proof")
+    print("   POST /api/zkp/verify            - Verify ZK proofs in batch")
     print("\n" + "="*60 + "\n")
 
     app.run(host='127.0.0.1', port=5000, debug=True)
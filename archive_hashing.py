@@ -0,0 +1,98 @@
+import hashlib
+import os
+import tarfile
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _skip_entry(name):
+    """Ignore OS metadata that archivers add alongside the real files"""
+    base = os.path.basename(name.rstrip('/'))
+    return name.startswith('__MACOSX/') or base.startswith('.') or not base
+
+
+def iter_archive_entries(stream, max_entry_size):
+    """
+    Read the regular files of a ZIP or tar archive without extracting to disk
+
+    ZIP archives are read through the central directory (the stream must be
+    seekable); tar archives, compressed or not, are read as a single
+    forward-only stream.
+
+    Args:
+        stream: Binary file-like object holding the archive
+        max_entry_size: Entries larger than this are reported, not read
+
+    Yields:
+        Tuples of (name, data, error); data is None when error is set
+
+    Raises:
+        ValueError: If the stream is neither a ZIP nor a tar archive
+    """
+    if zipfile.is_zipfile(stream):
+        stream.seek(0)
+        with zipfile.ZipFile(stream) as archive:
+            for info in archive.infolist():
+                if info.is_dir() or _skip_entry(info.filename):
+                    continue
+                if info.file_size > max_entry_size:
+                    yield info.filename, None, 'File too large'
+                    continue
+                yield info.filename, archive.read(info), None
+        return
+
+    stream.seek(0)
+    try:
+        archive = tarfile.open(fileobj=stream, mode='r|*')
+    except tarfile.TarError:
+        raise ValueError('Unsupported archive format (expected ZIP or tar)')
+
+    with archive:
+        for member in archive:
+            if not member.isfile() or _skip_entry(member.name):
+                continue
+            if member.size > max_entry_size:
+                yield member.name, None, 'File too large'
+                continue
+            yield member.name, archive.extractfile(member).read(), None
+
+
+def _sha256_hex(data):
+    # hashlib releases the GIL while hashing buffers of more than 2 KiB
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_archive_entries(entries, workers=None, max_in_flight=None):
+    """
+    Hash archive entries in a thread pool while the archive is still being read
+
+    Reading stays sequential (tar streams cannot be read out of order); each
+    entry is handed to a worker as soon as it is read, and at most
+    max_in_flight entries are held in memory at once.
+
+    Args:
+        entries: Iterable of (name, data, error) from iter_archive_entries
+        workers: Hashing threads (default: CPU count)
+        max_in_flight: Entries read ahead of the oldest unfinished hash
+            (default: twice the number of workers)
+
+    Yields:
+        Tuples of (name, certificate_hash, error) in archive order
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 2
+    pending = deque()
+
+    def resolve(name, future, error):
+        return name, future.result() if future is not None else None, error
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for name, data, error in entries:
+            future = pool.submit(_sha256_hex, data) if error is None else None
+            pending.append((name, future, error))
+            if len(pending) >= max_in_flight:
+                yield resolve(*pending.popleft())
+
+        while pending:
+            yield resolve(*pending.popleft())
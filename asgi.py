@@ -0,0 +1,239 @@
+"""
+ASGI entry point: asyncio serving mode
+
+Certificate verification (by ID, by hash and bulk) is served natively on the
+event loop by AsyncBlockchainHandler, so thousands of in-flight requests are
+multiplexed over a few keep-alive connections to the node in one process.
+Every other route, including CORS preflight, is passed to the Flask app
+through asgiref's WSGI adapter, so routes and JSON responses are the same as
+with app.py. Delegated requests run on a pool of WSGI_THREADS threads, so a
+long one (an SSE stream, a large upload, a wait for mining) only holds its
+own thread.
+
+Usage:
+    uvicorn asgi:app --host 127.0.0.1 --port 5000
+"""
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from asgiref.wsgi import WsgiToAsgi, WsgiToAsgiInstance
+
+import app as flask_app
+import metrics
+from async_blockchain_handler import AsyncBlockchainHandler
+
+# Threads serving requests delegated to Flask
+WSGI_THREADS = int(os.environ.get('WSGI_THREADS', '64'))
+wsgi_executor = ThreadPoolExecutor(max_workers=WSGI_THREADS, thread_name_prefix='wsgi')
+
+
+class ThreadPoolWsgiInstance(WsgiToAsgiInstance):
+    """
+    WsgiToAsgiInstance running the WSGI app on wsgi_executor
+
+    asgiref's adapter is thread-sensitive, so every request it wraps runs
+    on one shared thread, one after another.
+    """
+
+    run_wsgi_app = sync_to_async(WsgiToAsgiInstance.__dict__['run_wsgi_app'].func, thread_sensitive=False,
+                                 executor=wsgi_executor)
+
+
+class ThreadPoolWsgiToAsgi(WsgiToAsgi):
+    async def __call__(self, scope, receive, send):
+        await ThreadPoolWsgiInstance(self.wsgi_application)(scope, receive, send)
+
+
+wsgi_app = ThreadPoolWsgiToAsgi(flask_app.app)
+async_blockchain = None
+
+
+def json_response(body, status=200):
+    return status, json.dumps(body).encode()
+
+
+def parse_body(data):
+    """Return the request JSON object or raise ValueError"""
+    payload = json.loads(data or b'null')
+    if not isinstance(payload, dict):
+        raise ValueError('Request body must be a JSON object')
+    return payload
+
+
+async def verify_by_id(data):
+    """Verify certificate by ID"""
+    cert_id = data.get('certificateId')
+
+    if not cert_id:
+        return json_response({'error': 'Certificate ID is required'}, 400)
+
+    try:
+        min_block = flask_app.parse_min_block(data.get('minBlock'))
+    except (TypeError, ValueError):
+        return json_response({'error': 'Invalid minBlock'}, 400)
+
+    cert_data = await async_blockchain.verify_certificate_by_id(cert_id, min_block=min_block)
+
+    if cert_data is None:
+        return json_response({
+            'verified': False,
+            'message': 'Certificate not found'
+        })
+
+    return json_response({
+        'verified': True,
+        'message': 'Certificate verified successfully',
+        'certificate': cert_data
+    })
+
+
+async def verify_by_hash(data):
+    """Verify certificate by hash"""
+    cert_hash = data.get('certificateHash')
+
+    if not cert_hash:
+        return json_response({'error': 'Certificate hash is required'}, 400)
+
+    try:
+        min_block = flask_app.parse_min_block(data.get('minBlock'))
+    except (TypeError, ValueError):
+        return json_response({'error': 'Invalid minBlock'}, 400)
+
+    cert_data = await async_blockchain.verify_certificate_by_hash(cert_hash, min_block=min_block)
+
+    if cert_data is None:
+        return json_response({
+            'verified': False,
+            'message': 'Certificate not found'
+        })
+
+    return json_response({
+        'verified': True,
+        'message': 'Certificate verified successfully',
+        'certificate': cert_data
+    })
+
+
+async def verify_bulk(data):
+    """Verify a mixed list of certificate IDs and hashes in one call"""
+    items = data.get('items')
+
+    if not isinstance(items, list) or not items:
+        return json_response({'error': 'A non-empty list of items is required'}, 400)
+
+    if len(items) > flask_app.MAX_BULK_VERIFY_ITEMS:
+        return json_response({'error': f'At most {flask_app.MAX_BULK_VERIFY_ITEMS} items per call'}, 400)
+
+    try:
+        min_block = flask_app.parse_min_block(data.get('minBlock'))
+    except (TypeError, ValueError):
+        return json_response({'error': 'Invalid minBlock'}, 400)
+
+    keys = flask_app.parse_bulk_keys(items)
+    lookups = await async_blockchain.verify_certificates_bulk(
+        [k for k in keys if k is not None], min_block=min_block
+    )
+
+    return json_response(flask_app.bulk_verification_response(keys, lookups))
+
+
+# (method, path) -> handler taking the parsed JSON body
+ROUTES = {
+    ('POST', '/api/certificate/verify/id'): verify_by_id,
+    ('POST', '/api/certificate/verify/hash'): verify_by_hash,
+    ('POST', '/api/certificates/verify/bulk'): verify_bulk
+}
+
+
+async def read_body(receive, limit):
+    """Read the whole request body, or None if it exceeds limit bytes"""
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        chunk = message.get('body', b'')
+        size += len(chunk)
+        if size > limit:
+            return None
+        chunks.append(chunk)
+        if not message.get('more_body', False):
+            return b''.join(chunks)
+
+
+async def lifespan(receive, send):
+    global async_blockchain
+
+    while True:
+        message = await receive()
+
+        if message['type'] == 'lifespan.startup':
+            # The Flask app (used for every non-native route) connects synchronously
+            await asyncio.to_thread(flask_app.init_blockchain)
+
+            if flask_app.CONTRACT_ADDRESS:
+                # Native routes stay on the primary node; only the Flask handler pools endpoints
+                handler = AsyncBlockchainHandler(
+                    provider_url=flask_app.BLOCKCHAIN_PROVIDERS[0],
+                    contract_address=flask_app.CONTRACT_ADDRESS,
+                    contract_abi_path=flask_app.CONTRACT_ABI_PATH
+                )
+                try:
+                    await handler.connect()
+                    async_blockchain = handler
+                except Exception as e:
+                    print(f"✗ Error initializing async handler, serving all routes through Flask: {str(e)}")
+
+            await send({'type': 'lifespan.startup.complete'})
+
+        elif message['type'] == 'lifespan.shutdown':
+            if async_blockchain is not None:
+                await async_blockchain.close()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def app(scope, receive, send):
+    if scope['type'] == 'lifespan':
+        await lifespan(receive, send)
+        return
+
+    handler = ROUTES.get((scope.get('method'), scope.get('path'))) if scope['type'] == 'http' else None
+
+    if handler is None or async_blockchain is None or async_blockchain.contract is None:
+        await wsgi_app(scope, receive, send)
+        return
+
+    started = time.perf_counter()
+    body = await read_body(receive, flask_app.app.config['MAX_CONTENT_LENGTH'])
+
+    if body is None:
+        status, payload = json_response({'error': 'Request body too large'}, 413)
+    else:
+        try:
+            data = parse_body(body)
+        except ValueError:
+            data = None
+            status, payload = json_response({'error': 'Invalid JSON body'}, 400)
+
+        if data is not None:
+            try:
+                status, payload = await handler(data)
+            except Exception as e:
+                status, payload = json_response({'error': str(e)}, 500)
+
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [
+            (b'content-type', b'application/json'),
+            (b'content-length', str(len(payload)).encode()),
+            (b'access-control-allow-origin', b'*')
+        ]
+    })
+    await send({'type': 'http.response.body', 'body': payload})
+
+    metrics.http_duration.observe(time.perf_counter() - started, scope['path'], scope['method'], status)
@@ -0,0 +1,235 @@
+from web3 import AsyncWeb3, AsyncHTTPProvider
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+import asyncio
+import json
+import time
+import metrics
+from blockchain_handler import BlockchainHandler
+from certificate_codec import encode_certificate_hash, encode_certificate_id, uses_compact_layout
+from verification_cache import VerificationCache
+
+class AsyncBlockchainHandler:
+    """
+    Asyncio counterpart to BlockchainHandler for the verification read path.
+
+    Built on AsyncWeb3 over a single pooled aiohttp session, so any number of
+    concurrent verifications share pool_size keep-alive connections to the
+    node. Concurrent lookups of the same certificate are coalesced into one
+    eth_call. Issuance and anchoring stay on the synchronous handler.
+    """
+
+    def __init__(self, provider_url="http://127.0.0.1:7545", contract_address=None, contract_abi_path=None,
+                 cache_max_bytes=16 * 1024 * 1024, block_refresh_interval=1.0, pool_size=20, request_timeout=30):
+        """
+        Configure the handler; call connect() from the event loop before use
+
+        Args:
+            provider_url: URL of the Ganache RPC server (default: http://127.0.0.1:7545)
+            contract_address: Address of the deployed contract
+            contract_abi_path: Path to the contract ABI JSON file
+            cache_max_bytes: Memory budget of the verification result cache,
+                0 disables caching (default: 16 MB)
+            block_refresh_interval: Seconds a known block number is reused
+                before asking the node again (default: 1.0)
+            pool_size: Keep-alive HTTP connections kept open to the node (default: 20)
+            request_timeout: Seconds before an RPC request times out (default: 30)
+        """
+        self.provider_url = provider_url
+        self.contract_address = contract_address
+        self.contract_abi_path = contract_abi_path
+        self.cache = VerificationCache(cache_max_bytes) if cache_max_bytes else None
+        self.block_refresh_interval = block_refresh_interval
+        self.pool_size = pool_size
+        self.request_timeout = request_timeout
+
+        self.web3 = None
+        self.contract = None
+        self.compact_layout = False
+        self.session = None
+        self.chain_id = None
+
+        self._block_number = None
+        self._block_checked_at = 0.0
+        self._block_lock = None
+        self._inflight = {}
+
+    async def connect(self):
+        """Open the connection pool, check the node and load the contract"""
+        self.session = ClientSession(
+            connector=TCPConnector(limit=self.pool_size),
+            timeout=ClientTimeout(total=self.request_timeout)
+        )
+        provider = AsyncHTTPProvider(self.provider_url)
+        await provider.cache_async_session(self.session)
+
+        self.web3 = AsyncWeb3(provider)
+        self.web3.middleware_onion.add(metrics.async_rpc_metrics_middleware, 'rpc_metrics')
+        self._block_lock = asyncio.Lock()
+
+        if not await self.web3.is_connected():
+            await self.close()
+            raise Exception(f"Failed to connect to Ganache at {self.provider_url}")
+
+        self.chain_id = await self.web3.eth.chain_id
+        print(f"✓ Async handler connected to Ganache at {self.provider_url}")
+
+        if self.contract_address and self.contract_abi_path:
+            self.load_contract(self.contract_address, self.contract_abi_path)
+
+    async def close(self):
+        """Close the pooled connections to the node"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def load_contract(self, contract_address, contract_abi_path):
+        """Load the smart contract using address and ABI"""
+        try:
+            with open(contract_abi_path, 'r') as f:
+                contract_abi = json.load(f)
+
+            self.contract_address = AsyncWeb3.to_checksum_address(contract_address)
+            self.contract = self.web3.eth.contract(
+                address=self.contract_address,
+                abi=contract_abi
+            )
+            self.compact_layout = uses_compact_layout(self.contract)
+            return True
+        except Exception as e:
+            print(f"✗ Error loading contract: {str(e)}")
+            return False
+
+    async def _current_block(self):
+        """Latest block number, refreshed at most every block_refresh_interval seconds"""
+        if self._block_number is None or time.monotonic() - self._block_checked_at >= self.block_refresh_interval:
+            async with self._block_lock:
+                # Another task may have refreshed it while we waited
+                if self._block_number is None or \
+                        time.monotonic() - self._block_checked_at >= self.block_refresh_interval:
+                    self._block_number = await self.web3.eth.block_number
+                    self._block_checked_at = time.monotonic()
+        return self._block_number
+
+    async def _single_flight(self, key, lookup):
+        """Share one in-flight lookup between all tasks asking for the same key"""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(lookup())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # shield: a cancelled request must not cancel the lookup for the others
+        return await asyncio.shield(future)
+
+    async def _cached_lookup(self, key, min_block, lookup):
+        """Async version of BlockchainHandler._cached_lookup; returns cert_data"""
+        if self.cache is None:
+            return await self._single_flight(key, lookup)
+
+        current_block = await self._current_block()
+        found, cert_data = self.cache.get(key, current_block, min_block)
+        if found:
+            return cert_data
+
+        cert_data = await self._single_flight(key, lookup)
+        if cert_data is not None:
+            self.cache.put_hit(key, cert_data)
+        else:
+            self.cache.put_miss(key, current_block)
+        return cert_data
+
+    def _canonical_key(self, key):
+        """Cache key for a lookup; see BlockchainHandler._canonical_hash"""
+        kind, value = key
+        if kind == 'hash' and self.compact_layout:
+            return kind, encode_certificate_hash(value).hex()
+        return key
+
+    async def _lookup_by_id(self, cert_id):
+        if self.compact_layout:
+            cert_id = encode_certificate_id(cert_id)
+        result = await self.contract.functions.verifyCertificateById(cert_id).call()
+        if not result[0]:  # exists flag
+            return None
+        return BlockchainHandler._cert_from_id_result(result)
+
+    async def _lookup_by_hash(self, cert_hash):
+        if self.compact_layout:
+            cert_hash = encode_certificate_hash(cert_hash)
+        result = await self.contract.functions.verifyCertificateByHash(cert_hash).call()
+        if not result[0]:  # exists flag
+            return None
+        return BlockchainHandler._cert_from_hash_result(result)
+
+    def _lookup_for(self, key):
+        kind, value = key
+        if kind == 'id':
+            return lambda: self._lookup_by_id(value)
+        return lambda: self._lookup_by_hash(value)
+
+    async def verify_certificate_by_id(self, cert_id, min_block=None):
+        """
+        Verify certificate by ID
+
+        Args:
+            cert_id: Certificate ID to verify
+            min_block: Oldest block the answer must reflect (optional)
+
+        Returns:
+            Dictionary with certificate details if found, None otherwise
+        """
+        if not self.contract:
+            print("✗ Contract not loaded")
+            return None
+
+        key = ('id', cert_id)
+        try:
+            return await self._cached_lookup(key, min_block, self._lookup_for(key))
+        except Exception as e:
+            print(f"✗ Error verifying certificate: {str(e)}")
+            return None
+
+    async def verify_certificate_by_hash(self, cert_hash, min_block=None):
+        """
+        Verify certificate by hash
+
+        Args:
+            cert_hash: Certificate hash to verify
+            min_block: Oldest block the answer must reflect (optional)
+
+        Returns:
+            Dictionary with certificate details if found, None otherwise
+        """
+        if not self.contract:
+            print("✗ Contract not loaded")
+            return None
+
+        try:
+            key = self._canonical_key(('hash', cert_hash))
+            return await self._cached_lookup(key, min_block, self._lookup_for(key))
+        except Exception as e:
+            print(f"✗ Error verifying certificate by hash: {str(e)}")
+            return None
+
+    async def verify_certificates_bulk(self, keys, min_block=None):
+        """
+        Verify many certificates by ID and/or hash concurrently
+
+        Args:
+            keys: List of ('id', cert_id) or ('hash', cert_hash) tuples
+            min_block: Oldest block the answers must reflect (optional)
+
+        Returns:
+            Dict mapping each distinct key to a certificate dict, None if not
+            found, or an Exception if that lookup failed
+        """
+        if not self.contract:
+            print("✗ Contract not loaded")
+            return {key: Exception('Contract not loaded') for key in keys}
+
+        async def lookup(key):
+            key = self._canonical_key(key)
+            return await self._cached_lookup(key, min_block, self._lookup_for(key))
+
+        unique = list(dict.fromkeys(keys))
+        outcomes = await asyncio.gather(*(lookup(key) for key in unique), return_exceptions=True)
+        return dict(zip(unique, outcomes))
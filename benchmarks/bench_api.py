@@ -0,0 +1,169 @@
+"""
+Benchmark: API latency, throughput and RPC cost against an in-process chain
+
+Deploys CertificateVerifier to eth-tester, pre-populates the registry and
+drives every endpoint through the Flask test client at the requested
+concurrency. Results are printed as JSON so runs can be diffed in CI.
+
+Usage:
+    python benchmarks/bench_api.py --registry-size 1000 --requests 200 --concurrency 8
+    python benchmarks/bench_api.py --endpoints verify_id,verify_hash --output bench.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from local_chain import DEFAULT_ARTIFACT, deploy_local_handler, populate, synthetic_certificate
+
+import app as app_module
+from blob_store import BlobStore
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def make_scenarios(registry_size, upload_offset):
+    """Request builders per endpoint; each takes a request number and a test client"""
+
+    def upload(n, client):
+        cert = synthetic_certificate(upload_offset + n)
+        return client.post('/api/certificate/upload', data={
+            'file': (io.BytesIO(cert['content']), f"{cert['certificateId']}.pdf"),
+            'certificateId': cert['certificateId'],
+            'holderName': cert['holderName'],
+            'certificateType': cert['certificateType'],
+            'institution': cert['institution'],
+            'issueDate': '2024-06-01'
+        }, content_type='multipart/form-data')
+
+    def verify_id(n, client):
+        cert = synthetic_certificate(n % registry_size)
+        return client.post('/api/certificate/verify/id', json={'certificateId': cert['certificateId']})
+
+    def verify_hash(n, client):
+        cert = synthetic_certificate(n % registry_size)
+        return client.post('/api/certificate/verify/hash', json={'certificateHash': cert['certificateHash']})
+
+    def verify_file(n, client):
+        cert = synthetic_certificate(n % registry_size)
+        return client.post('/api/certificate/verify/file', data={
+            'file': (io.BytesIO(cert['content']), f"{cert['certificateId']}.pdf")
+        }, content_type='multipart/form-data')
+
+    def list_all(n, client):
+        return client.get('/api/certificates/list')
+
+    def zkp_generate(n, client):
+        cert = synthetic_certificate(n % registry_size)
+        return client.post('/api/zkp/generate', json={'certificateId': cert['certificateId']})
+
+    return {
+        'upload': upload,
+        'verify_id': verify_id,
+        'verify_hash': verify_hash,
+        'verify_file': verify_file,
+        'list': list_all,
+        'zkp_generate': zkp_generate
+    }
+
+
+def run_scenario(build_request, total, concurrency, provider):
+    latencies = []
+    errors = 0
+
+    def worker(numbers):
+        client = app_module.app.test_client()
+        samples = []
+        failed = 0
+        for n in numbers:
+            started = time.perf_counter()
+            response = build_request(n, client)
+            samples.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                failed += 1
+        return samples, failed
+
+    shards = [range(i, total, concurrency) for i in range(concurrency)]
+    provider.reset_counters()
+    started = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for samples, failed in pool.map(worker, shards):
+            latencies.extend(samples)
+            errors += failed
+
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+
+    return {
+        'requests': total,
+        'errors': errors,
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 3),
+        'p95_ms': round(percentile(latencies, 0.95) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 3),
+        'throughput_rps': round(total / elapsed, 2),
+        'rpc_calls_per_request': round(provider.calls / total, 3),
+        'rpc_calls_by_method': dict(provider.calls_by_method)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--artifact', default=DEFAULT_ARTIFACT)
+    parser.add_argument('--registry-size', type=int, default=500)
+    parser.add_argument('--requests', type=int, default=200, help='Requests per endpoint')
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--cache-mb', type=int, default=16, help='Verification cache size, 0 disables it')
+    parser.add_argument('--endpoints', default='upload,verify_id,verify_hash,verify_file,list,zkp_generate')
+    parser.add_argument('--output', help='Write the JSON report to this file as well')
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        handler, provider = deploy_local_handler(args.artifact, cache_max_bytes=args.cache_mb * 1024 * 1024)
+        populate(handler, args.registry_size)
+
+    app_module.blockchain = handler
+    app_module.blob_store = BlobStore(tempfile.mkdtemp(prefix='bench-uploads-'))
+
+    scenarios = make_scenarios(args.registry_size, upload_offset=args.registry_size)
+    report = {
+        'config': {
+            'registrySize': args.registry_size,
+            'requestsPerEndpoint': args.requests,
+            'concurrency': args.concurrency,
+            'cacheMb': args.cache_mb
+        },
+        'endpoints': {}
+    }
+
+    for name in args.endpoints.split(','):
+        # Handler and API log every lookup; keep that out of the measurements
+        with contextlib.redirect_stdout(io.StringIO()):
+            report['endpoints'][name] = run_scenario(scenarios[name], args.requests, args.concurrency, provider)
+
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    report['peak_rss_kb'] = peak_rss // 1024 if sys.platform == 'darwin' else peak_rss
+
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+
+
+if __name__ == '__main__':
+    main()
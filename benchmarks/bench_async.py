@@ -0,0 +1,140 @@
+"""
+Benchmark: synchronous vs asyncio verification under concurrency
+
+Deploys CertificateVerifier to a local chain (Ganache or `npx hardhat node`),
+stores a number of certificates, then verifies random IDs at increasing
+concurrency through:
+
+  - sync:   BlockchainHandler, one thread per in-flight request (how the
+            Flask app serves requests)
+  - async:  AsyncBlockchainHandler, one task per in-flight request on a
+            single event loop
+
+Both use the same number of pooled connections to the node and have their
+result caches disabled, so every request costs one eth_call. Reports
+latency percentiles, throughput and the threads each mode needed.
+
+Usage:
+    npx hardhat compile
+    python benchmarks/bench_async.py --count 200 --requests 5000 --concurrency 10,100,1000
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from async_blockchain_handler import AsyncBlockchainHandler
+from blockchain_handler import BlockchainHandler
+from local_chain import DEFAULT_ARTIFACT, deploy, populate
+
+
+def percentile(sorted_values, pct):
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def summarize(mode, concurrency, latencies, elapsed, threads):
+    latencies.sort()
+    return {
+        'mode': mode,
+        'concurrency': concurrency,
+        'requests': len(latencies),
+        'p50_ms': round(percentile(latencies, 50) * 1000, 2),
+        'p95_ms': round(percentile(latencies, 95) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 2),
+        'throughput_rps': round(len(latencies) / elapsed, 1),
+        'peak_threads': threads
+    }
+
+
+def run_sync(handler, cert_ids, concurrency):
+    peak_threads = threading.active_count()
+
+    def verify(cert_id):
+        nonlocal peak_threads
+        started = time.perf_counter()
+        handler.verify_certificate_by_id(cert_id)
+        peak_threads = max(peak_threads, threading.active_count())
+        return time.perf_counter() - started
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = list(pool.map(verify, cert_ids))
+    return latencies, time.perf_counter() - started, peak_threads
+
+
+async def run_async(handler, cert_ids, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def verify(cert_id):
+        async with semaphore:
+            started = time.perf_counter()
+            await handler.verify_certificate_by_id(cert_id)
+            return time.perf_counter() - started
+
+    started = time.perf_counter()
+    latencies = await asyncio.gather(*(verify(cert_id) for cert_id in cert_ids))
+    return list(latencies), time.perf_counter() - started, threading.active_count()
+
+
+async def connect_async(args, address, abi):
+    handler = AsyncBlockchainHandler(
+        provider_url=args.provider_url,
+        cache_max_bytes=0,
+        pool_size=args.pool_size
+    )
+    await handler.connect()
+    handler.contract = handler.web3.eth.contract(address=address, abi=abi)
+    return handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--provider-url', default='http://127.0.0.1:7545')
+    parser.add_argument('--artifact', default=DEFAULT_ARTIFACT)
+    parser.add_argument('--count', type=int, default=200)
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--concurrency', default='10,100,1000')
+    parser.add_argument('--pool-size', type=int, default=20)
+    args = parser.parse_args()
+
+    handler = BlockchainHandler(provider_url=args.provider_url, cache_max_bytes=0, pool_size=args.pool_size)
+    deploy(handler, args.artifact)
+    populate(handler, args.count)
+
+    with open(args.artifact, 'r') as f:
+        abi = json.load(f)['abi']
+
+    cert_ids = [f"BENCH-{random.randrange(args.count):07d}" for _ in range(args.requests)]
+
+    loop = asyncio.new_event_loop()
+    async_handler = loop.run_until_complete(connect_async(args, handler.contract_address, abi))
+
+    results = []
+    # The handlers log every verification; keep the report readable
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for concurrency in (int(c) for c in args.concurrency.split(',')):
+            results.append(summarize('sync', concurrency, *run_sync(handler, cert_ids, concurrency)))
+            results.append(summarize('async', concurrency,
+                                     *loop.run_until_complete(run_async(async_handler, cert_ids, concurrency))))
+
+    loop.run_until_complete(async_handler.close())
+    loop.close()
+
+    print(json.dumps({
+        'certificates': args.count,
+        'pool_size': args.pool_size,
+        'results': results
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark: mirroring the registry by re-listing vs. the change feed
+
+Stores a registry of certificates, then repeatedly adds a few new ones and
+brings a mirror up to date, either by re-reading the full list or by asking
+the change feed for certificates since the mirror's last block. Reports
+time and RPC calls per sync, against an in-process eth-tester chain.
+
+Usage:
+    python benchmarks/bench_change_feed.py --registry 2000 --new 10 --rounds 5
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from local_chain import DEFAULT_ARTIFACT, deploy_local_handler, populate, synthetic_certificate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--artifact', default=DEFAULT_ARTIFACT)
+    parser.add_argument('--registry', type=int, default=2000, help='Certificates stored before measuring')
+    parser.add_argument('--new', type=int, default=10, help='Certificates added between syncs')
+    parser.add_argument('--rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        handler, provider = deploy_local_handler(args.artifact)
+        populate(handler, args.registry)
+        handler.enable_change_feed()
+
+    mirror_block = handler.web3.eth.block_number
+    offset = args.registry
+    full, incremental = [], []
+
+    for _ in range(args.rounds):
+        with contextlib.redirect_stdout(io.StringIO()):
+            handler.store_certificates_batch([
+                {key: value for key, value in synthetic_certificate(i).items() if key != 'content'}
+                for i in range(offset, offset + args.new)
+            ])
+        offset += args.new
+
+        provider.reset_counters()
+        started = time.perf_counter()
+        listed = sum(1 for _ in handler.iter_certificates())
+        full.append({'seconds': time.perf_counter() - started, 'rpc_calls': provider.calls, 'certificates': listed})
+
+        provider.reset_counters()
+        started = time.perf_counter()
+        certificates, next_block, _ = handler.change_feed.since(mirror_block + 1)
+        incremental.append({
+            'seconds': time.perf_counter() - started,
+            'rpc_calls': provider.calls,
+            'certificates': len(certificates)
+        })
+        mirror_block = next_block - 1
+
+    def summary(runs):
+        return {
+            'seconds_avg': round(sum(r['seconds'] for r in runs) / len(runs), 4),
+            'rpc_calls_avg': round(sum(r['rpc_calls'] for r in runs) / len(runs), 1),
+            'certificates_per_sync': runs[-1]['certificates']
+        }
+
+    print(json.dumps({
+        'registry': args.registry,
+        'new_per_sync': args.new,
+        'full_list': summary(full),
+        'change_feed': summary(incremental)
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
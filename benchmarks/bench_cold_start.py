@@ -0,0 +1,79 @@
+"""
+Benchmark: server cold-start time
+
+Starts the server as a subprocess several times and reports how long it
+takes until the health check first answers, and until it reports the
+blockchain connected. Run it with the node up and with it down to see that
+the server still starts (blockchain_connected simply stays false).
+
+Usage:
+    python benchmarks/bench_cold_start.py --runs 5
+    python benchmarks/bench_cold_start.py --command "python app.py"
+"""
+import argparse
+import json
+import os
+import shlex
+import subprocess
+import sys
+import time
+
+import requests
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+
+def wait_for(url, deadline, predicate):
+    while time.perf_counter() < deadline:
+        try:
+            response = requests.get(url, timeout=1)
+            if response.status_code == 200 and predicate(response.json()):
+                return time.perf_counter()
+        except (requests.RequestException, ValueError):
+            pass
+        time.sleep(0.02)
+    return None
+
+
+def measure(command, url, timeout):
+    started = time.perf_counter()
+    process = subprocess.Popen(command, cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        deadline = started + timeout
+        first_response = wait_for(url, deadline, lambda body: True)
+        connected = wait_for(url, deadline, lambda body: body.get('blockchain_connected')) \
+            if first_response is not None else None
+    finally:
+        process.terminate()
+        process.wait()
+
+    def seconds(moment):
+        return round(moment - started, 3) if moment is not None else None
+
+    return {'first_response_seconds': seconds(first_response), 'connected_seconds': seconds(connected)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--command', default=f'{sys.executable} serve.py --bind 127.0.0.1:5055 --workers 4')
+    parser.add_argument('--url', default='http://127.0.0.1:5055/')
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--timeout', type=float, default=60.0)
+    args = parser.parse_args()
+
+    runs = [measure(shlex.split(args.command), args.url, args.timeout) for _ in range(args.runs)]
+
+    def median(key):
+        values = sorted(r[key] for r in runs if r[key] is not None)
+        return values[len(values) // 2] if values else None
+
+    print(json.dumps({
+        'command': args.command,
+        'runs': runs,
+        'median_first_response_seconds': median('first_response_seconds'),
+        'median_connected_seconds': median('connected_seconds')
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark: certificate issuance from many threads at once
+
+Issues certificates through BlockchainHandler.store_certificate from an
+increasing number of threads sharing one account, against an in-process
+eth-tester chain. Reports throughput, failures and how many RPC calls
+each issuance cost. With node-assigned nonces concurrent stores collide;
+with the transaction submitter every store should succeed.
+
+Usage:
+    python benchmarks/bench_concurrent_issuance.py --certificates 400 --threads 1,8,32
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from local_chain import DEFAULT_ARTIFACT, deploy_local_handler, synthetic_certificate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--artifact', default=DEFAULT_ARTIFACT)
+    parser.add_argument('--certificates', type=int, default=400, help='Certificates issued per thread count')
+    parser.add_argument('--threads', default='1,8,32')
+    args = parser.parse_args()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        handler, provider = deploy_local_handler(args.artifact)
+
+    results = []
+    offset = 0
+    for threads in (int(t) for t in args.threads.split(',')):
+        certificates = [synthetic_certificate(i) for i in range(offset, offset + args.certificates)]
+        offset += args.certificates
+
+        def issue(cert):
+            receipt = handler.store_certificate(
+                cert['certificateId'], cert['certificateHash'], cert['holderName'],
+                cert['certificateType'], cert['institution'], cert['issueDate']
+            )
+            return receipt is not None and receipt.status == 1
+
+        provider.reset_counters()
+        # The handler logs every store; keep that out of the measurements
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                outcomes = list(pool.map(issue, certificates))
+            elapsed = time.perf_counter() - started
+
+        results.append({
+            'threads': threads,
+            'issued': sum(outcomes),
+            'failed': len(outcomes) - sum(outcomes),
+            'seconds': round(elapsed, 3),
+            'certificates_per_second': round(len(outcomes) / elapsed, 1),
+            'rpc_calls_per_certificate': round(provider.calls / len(outcomes), 2),
+            'estimate_gas_calls': provider.calls_by_method.get('eth_estimateGas', 0)
+        })
+
+    print(json.dumps({'results': results}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
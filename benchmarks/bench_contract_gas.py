@@ -0,0 +1,78 @@
+"""
+Benchmark: on-chain cost of the string and compact bytes32 contract layouts
+
+Deploys CertificateVerifier and CertificateVerifierV2 side by side on an
+in-process eth-tester chain, stores the same certificates in both and
+reports gas and calldata per store, how many stores fit in one block, and
+the gas of an ID and a hash verification call.
+
+Usage:
+    python benchmarks/bench_contract_gas.py --certificates 50 --block-gas-limit 30000000
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from local_chain import artifact_path, deploy_local_handler, synthetic_certificate
+
+CONTRACTS = ('CertificateVerifier', 'CertificateVerifierV2')
+
+
+def measure(contract_name, certificates, block_gas_limit):
+    with contextlib.redirect_stdout(io.StringIO()):
+        handler, _ = deploy_local_handler(artifact_path(contract_name), contract_name, cache_max_bytes=0)
+
+        gas, calldata = [], []
+        for cert in certificates:
+            receipt = handler.store_certificate(
+                cert['certificateId'], cert['certificateHash'], cert['holderName'],
+                cert['certificateType'], cert['institution'], cert['issueDate']
+            )
+            if receipt is None or receipt.status != 1:
+                raise RuntimeError(f"{contract_name}: storing {cert['certificateId']} failed")
+            gas.append(receipt.gasUsed)
+            calldata.append(len(handler.web3.eth.get_transaction(receipt.transactionHash)['input']))
+
+    sample = certificates[-1]
+    functions = handler.contract.functions
+    verify_id_gas = functions.verifyCertificateById(handler._id_arg(sample['certificateId'])).estimate_gas()
+    verify_hash_gas = functions.verifyCertificateByHash(handler._hash_arg(sample['certificateHash'])).estimate_gas()
+
+    avg_gas = sum(gas) / len(gas)
+    return {
+        'contract': contract_name,
+        'compact_layout': handler.compact_layout,
+        'store_gas_avg': round(avg_gas),
+        'store_gas_max': max(gas),
+        'store_calldata_bytes_avg': round(sum(calldata) / len(calldata), 1),
+        'stores_per_block': int(block_gas_limit // avg_gas),
+        'verify_by_id_gas': verify_id_gas,
+        'verify_by_hash_gas': verify_hash_gas
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--certificates', type=int, default=50, help='Certificates stored per contract')
+    parser.add_argument('--block-gas-limit', type=int, default=30000000)
+    args = parser.parse_args()
+
+    certificates = [synthetic_certificate(i) for i in range(args.certificates)]
+    for cert in certificates:
+        cert.pop('content')
+
+    results = [measure(name, certificates, args.block_gas_limit) for name in CONTRACTS]
+    baseline, compact = results
+    print(json.dumps({
+        'results': results,
+        'store_gas_saved_pct': round(100 * (1 - compact['store_gas_avg'] / baseline['store_gas_avg']), 1)
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark: RPC round trips needed to list the certificate registry
+
+Deploys CertificateVerifier to a local chain (Ganache or `npx hardhat node`),
+stores a number of certificates and compares the three read paths used by
+BlockchainHandler.get_all_certificates:
+
+  - legacy:  one getCertificateByIndex eth_call per certificate
+  - batch:   getCertificateByIndex calls packed into JSON-RPC batches
+  - range:   getCertificatesRange(start, count) bulk getter
+
+Usage:
+    npx hardhat compile
+    python benchmarks/bench_list_certificates.py --count 2000 --chunk-size 500
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from blockchain_handler import BlockchainHandler
+from local_chain import DEFAULT_ARTIFACT, deploy, populate
+
+
+def count_round_trips(handler):
+    """Instrument a handler so every HTTP round trip to the node is counted"""
+    counter = {'round_trips': 0}
+
+    def counting_middleware(make_request, w3):
+        def middleware(method, params):
+            counter['round_trips'] += 1
+            return make_request(method, params)
+        return middleware
+
+    handler.web3.middleware_onion.add(counting_middleware, 'round_trip_counter')
+
+    rpc_batch = handler._rpc_batch
+
+    def counting_rpc_batch(calls):
+        counter['round_trips'] += 1
+        return rpc_batch(calls)
+
+    handler._rpc_batch = counting_rpc_batch
+    return counter
+
+
+def measure(counter, label, fn):
+    counter['round_trips'] = 0
+    started = time.perf_counter()
+    certificates = fn()
+    elapsed = time.perf_counter() - started
+    return {
+        'mode': label,
+        'certificates': len(certificates),
+        'round_trips': counter['round_trips'],
+        'seconds': round(elapsed, 4)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--provider-url', default='http://127.0.0.1:7545')
+    parser.add_argument('--artifact', default=DEFAULT_ARTIFACT)
+    parser.add_argument('--count', type=int, default=2000)
+    parser.add_argument('--chunk-size', type=int, default=500)
+    args = parser.parse_args()
+
+    handler = BlockchainHandler(provider_url=args.provider_url, read_chunk_size=args.chunk_size)
+    deploy(handler, args.artifact)
+    populate(handler, args.count)
+
+    counter = count_round_trips(handler)
+    count = handler.contract.functions.getCertificateCount().call()
+
+    def legacy():
+        return [handler.contract.functions.getCertificateByIndex(i).call() for i in range(count)]
+
+    def batched():
+        certificates = []
+        for start in range(0, count, args.chunk_size):
+            certificates.extend(handler._fetch_range_via_batch(start, min(args.chunk_size, count - start)))
+        return certificates
+
+    def ranged():
+        certificates = []
+        for start in range(0, count, args.chunk_size):
+            certificates.extend(handler._fetch_range_via_getter(start, min(args.chunk_size, count - start)))
+        return certificates
+
+    results = [
+        measure(counter, 'legacy', legacy),
+        measure(counter, 'batch', batched),
+        measure(counter, 'range', ranged),
+        measure(counter, 'get_all_certificates', handler.get_all_certificates)
+    ]
+
+    print(json.dumps({'count': count, 'chunk_size': args.chunk_size, 'results': results}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark: Merkle-batched anchoring cost off chain
+
+For each batch size, reports tree build time, proof size and the
+throughput of local proof verification. Anchoring itself is a single
+anchorMerkleRoot transaction regardless of batch size.
+
+Usage:
+    python benchmarks/bench_merkle.py --sizes 10000,100000,1000000 --verify-samples 20000
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from merkle import MerkleTree, verify_proof
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='10000,100000,1000000')
+    parser.add_argument('--verify-samples', type=int, default=20000)
+    args = parser.parse_args()
+
+    results = []
+    for size in (int(s) for s in args.sizes.split(',')):
+        hashes = [hashlib.sha256(i.to_bytes(8, 'big')).hexdigest() for i in range(size)]
+
+        started = time.perf_counter()
+        tree = MerkleTree(hashes)
+        build_seconds = time.perf_counter() - started
+
+        samples = [random.randrange(size) for _ in range(min(args.verify_samples, size))]
+        proofs = [(hashes[i], *tree.proof(i)) for i in samples]
+        proof_bytes = [len(siblings) * 32 + (max(1, (len(siblings) + 7) // 8)) for _, siblings, _ in proofs]
+
+        started = time.perf_counter()
+        for cert_hash, siblings, path in proofs:
+            assert verify_proof(cert_hash, siblings, path, tree.root)
+        verify_seconds = time.perf_counter() - started
+
+        results.append({
+            'leaves': size,
+            'depth': len(tree.levels) - 1,
+            'build_seconds': round(build_seconds, 3),
+            'build_leaves_per_second': round(size / build_seconds),
+            'proof_bytes_max': max(proof_bytes),
+            'proof_bytes_avg': round(sum(proof_bytes) / len(proof_bytes), 1),
+            'verify_proofs_per_second': round(len(proofs) / verify_seconds)
+        })
+        del tree
+
+    print(json.dumps({'results': results}, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark: cost of the metrics instrumentation on the hot path
+
+Measures the added latency of the RPC metrics middleware and of a single
+histogram observation, single-threaded and with several threads contending
+for the same series. No chain is needed; the "RPC" is a no-op.
+
+Usage:
+    python benchmarks/bench_metrics_overhead.py --iterations 200000 --threads 8
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import metrics
+
+
+def noop_request(method, params):
+    return {'jsonrpc': '2.0', 'id': 1, 'result': '0x1'}
+
+
+def time_per_call(fn, iterations):
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=200000)
+    parser.add_argument('--threads', type=int, default=8)
+    args = parser.parse_args()
+
+    instrumented = metrics.rpc_metrics_middleware(noop_request, None)
+    histogram = metrics.MetricsRegistry().histogram('bench_seconds', 'Benchmark histogram', ('method',))
+
+    bare = time_per_call(lambda: noop_request('eth_call', []), args.iterations)
+    wrapped = time_per_call(lambda: instrumented('eth_call', []), args.iterations)
+    observe = time_per_call(lambda: histogram.observe(0.004, 'eth_call'), args.iterations)
+
+    per_thread = args.iterations // args.threads
+    with ThreadPoolExecutor(max_workers=args.threads) as pool:
+        contended = list(pool.map(
+            lambda _: time_per_call(lambda: instrumented('eth_call', []), per_thread),
+            range(args.threads)
+        ))
+
+    print(json.dumps({
+        'iterations': args.iterations,
+        'threads': args.threads,
+        'bare_call_ns': round(bare * 1e9, 1),
+        'middleware_overhead_ns': round((wrapped - bare) * 1e9, 1),
+        'histogram_observe_ns': round(observe * 1e9, 1),
+        'middleware_contended_ns': round(max(contended) * 1e9, 1)
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+"""
+Benchmark: verification tail latency over one endpoint vs. an RPC pool
+
+Deploys CertificateVerifier to a local chain (Ganache or `npx hardhat node`)
+and puts stand-in endpoints in front of it, each adding the same latency
+profile: a base delay with jitter plus an occasional slow request. Random
+IDs are then verified at fixed concurrency through:
+
+  - single:        one endpoint, as before RPCPool
+  - pool:          all endpoints, load balanced, hedging disabled
+  - pool_hedged:   all endpoints with hedged reads
+  - pool_failing:  hedged pool with one more endpoint that always fails,
+                   exercising failover and the circuit breaker
+
+Result caches are disabled so every verification reaches an endpoint.
+
+Usage:
+    npx hardhat compile
+    python benchmarks/bench_rpc_pool.py --endpoints 3 --requests 2000 --slow-rate 0.05
+"""
+import argparse
+import contextlib
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from blockchain_handler import BlockchainHandler
+from local_chain import DEFAULT_ARTIFACT, deploy, populate
+from rpc_pool import RPCPool
+from rpc_standin import StandInNode
+
+
+def percentile(sorted_values, pct):
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run(handler, cert_ids, concurrency):
+    def verify(cert_id):
+        started = time.perf_counter()
+        handler.verify_certificate_by_id(cert_id)
+        return time.perf_counter() - started
+
+    # Warm up the pool's latency estimate and hedge delay before measuring
+    for cert_id in cert_ids[:50]:
+        verify(cert_id)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = sorted(pool.map(verify, cert_ids))
+    elapsed = time.perf_counter() - started
+
+    return {
+        'requests': len(latencies),
+        'p50_ms': round(percentile(latencies, 50) * 1000, 2),
+        'p95_ms': round(percentile(latencies, 95) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 2),
+        'max_ms': round(latencies[-1] * 1000, 2),
+        'throughput_rps': round(len(latencies) / elapsed, 1)
+    }
+
+
+def pooled_handler(urls, address, abi, **pool_kwargs):
+    provider = RPCPool(urls, **pool_kwargs)
+    handler = BlockchainHandler(provider=provider, contract_address=address, contract_abi=abi, cache_max_bytes=0)
+    return handler, provider
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--provider-url', default='http://127.0.0.1:7545', help='Upstream node')
+    parser.add_argument('--artifact', default=DEFAULT_ARTIFACT)
+    parser.add_argument('--count', type=int, default=200)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--endpoints', type=int, default=3)
+    parser.add_argument('--delay', type=float, default=0.005, help='Base seconds added per request')
+    parser.add_argument('--jitter', type=float, default=0.005, help='Up to this many seconds more')
+    parser.add_argument('--slow-rate', type=float, default=0.05, help='Share of requests hitting the tail')
+    parser.add_argument('--slow-delay', type=float, default=0.2, help='Seconds added to tail requests')
+    args = parser.parse_args()
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        upstream = BlockchainHandler(provider_url=args.provider_url, cache_max_bytes=0)
+        deploy(upstream, args.artifact)
+        populate(upstream, args.count)
+
+    with open(args.artifact, 'r') as f:
+        abi = json.load(f)['abi']
+
+    nodes = [
+        StandInNode(args.provider_url, delay=args.delay, jitter=args.jitter, slow_rate=args.slow_rate,
+                    slow_delay=args.slow_delay, seed=i).start()
+        for i in range(args.endpoints)
+    ]
+    failing = StandInNode(args.provider_url, failure_rate=1.0).start()
+    urls = [node.url for node in nodes]
+
+    cert_ids = [f"BENCH-{random.randrange(args.count):07d}" for _ in range(args.requests)]
+    results = {}
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        single = BlockchainHandler(provider_url=urls[0], contract_address=upstream.contract_address,
+                                   contract_abi=abi, cache_max_bytes=0)
+        results['single'] = run(single, cert_ids, args.concurrency)
+
+        scenarios = [
+            ('pool', urls, {'max_hedge_ratio': 0}),
+            ('pool_hedged', urls, {}),
+            # The failing endpoint goes second so it is never the primary
+            ('pool_failing', urls[:1] + [failing.url] + urls[1:], {})
+        ]
+        for name, scenario_urls, pool_kwargs in scenarios:
+            handler, provider = pooled_handler(scenario_urls, upstream.contract_address, abi, **pool_kwargs)
+            results[name] = run(handler, cert_ids, args.concurrency)
+            stats = provider.stats()
+            results[name].update({
+                'hedges': stats['hedges'],
+                'hedge_wins': stats['hedgeWins'],
+                'failovers': stats['failovers'],
+                'hedge_delay_ms': stats['hedgeDelayMs'],
+                'endpoint_states': [endpoint['state'] for endpoint in stats['endpoints']]
+            })
+            provider.close()
+
+    for node in nodes + [failing]:
+        node.stop()
+
+    print(json.dumps({
+        'certificates': args.count,
+        'endpoints': args.endpoints,
+        'latency_profile': {
+            'delay_ms': args.delay * 1000,
+            'jitter_ms': args.jitter * 1000,
+            'slow_rate': args.slow_rate,
+            'slow_delay_ms': args.slow_delay * 1000
+        },
+        'results': results
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+"""
+Benchmark: search index memory per record and query latency
+
+Builds a CertificateSearchIndex from synthetic registry records (no chain
+involved), reports the memory it holds per record and latency percentiles
+for typical queries, and checks every query against a linear scan.
+
+Usage:
+    python benchmarks/bench_search.py --records 1000000 --queries 200
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from certificate_search import CertificateSearchIndex, fold
+
+FIRST_NAMES = ['Alice', 'Bob', 'Carlos', 'Dana', 'Elif', 'Farah', 'Goran', 'Hana', 'Ivan', 'Jun',
+               'Kofi', 'Lena', 'Mateo', 'Nadia', 'Omar', 'Priya', 'Quinn', 'Rosa', 'Sven', 'Tariq']
+LAST_NAMES = ['Anders', 'Becker', 'Chen', 'Diallo', 'Evans', 'Fischer', 'Garcia', 'Haddad', 'Ito',
+              'Jensen', 'Kowalski', 'Lopez', 'Moreau', 'Nakamura', 'Okafor', 'Petrov', 'Rossi', 'Singh']
+TYPES = ['Bachelor of Science', 'Master of Arts', 'Diploma', 'Doctorate', 'Certificate of Completion']
+
+
+def synthetic_record(i, rng, institutions):
+    return {
+        'certificateId': f"CERT-{i:011d}",
+        'holderName': f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+        'certificateType': rng.choice(TYPES),
+        'institution': rng.choice(institutions),
+        'issueDate': 1500000000 + rng.randrange(300000000)
+    }
+
+
+def make_queries(rng, institutions, count):
+    shapes = [
+        lambda: {'holder': rng.choice(FIRST_NAMES)[:3].lower()},
+        lambda: {'holder': f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"},
+        lambda: {'institution': rng.choice(institutions)[:6].upper()},
+        lambda: {'cert_type': rng.choice(TYPES)},
+        lambda: {'issued_from': 1600000000, 'issued_to': 1600000000 + rng.randrange(1, 86400 * 30)},
+        lambda: {'cert_type': rng.choice(TYPES), 'institution': rng.choice(institutions)[:4]},
+        lambda: {'holder': rng.choice(FIRST_NAMES)[:2], 'issued_from': 1700000000},
+        lambda: {'holder': rng.choice(FIRST_NAMES), 'cert_type': rng.choice(TYPES),
+                 'issued_from': 1550000000, 'issued_to': 1650000000}
+    ]
+    return [(i % len(shapes), shapes[i % len(shapes)]()) for i in range(count)]
+
+
+def brute_force(records, query, limit):
+    def matches(r):
+        return ((not query.get('holder') or fold(r['holderName']).startswith(fold(query['holder']))) and
+                (not query.get('institution') or fold(r['institution']).startswith(fold(query['institution']))) and
+                (query.get('cert_type') is None or r['certificateType'] == query['cert_type']) and
+                (query.get('issued_from') is None or r['issueDate'] >= query['issued_from']) and
+                (query.get('issued_to') is None or r['issueDate'] <= query['issued_to']))
+
+    found = []
+    for r in records:
+        if matches(r):
+            found.append(r['certificateId'])
+            if len(found) == limit:
+                break
+    return found
+
+
+def percentile(sorted_values, pct):
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--records', type=int, default=1000000)
+    parser.add_argument('--institutions', type=int, default=2000)
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--limit', type=int, default=100)
+    parser.add_argument('--check', type=int, default=20000, help='Records checked against a linear scan')
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    institutions = [f"{rng.choice(LAST_NAMES)} {kind} {i}"
+                    for i, kind in enumerate(rng.choice(['University', 'Institute', 'College'])
+                                             for _ in range(args.institutions))]
+
+    # Correctness against a linear scan on a smaller registry
+    records = [synthetic_record(i, rng, institutions) for i in range(args.check)]
+    small = CertificateSearchIndex()
+    small.add(0, records[:args.check // 2])
+    small.flush()
+    for start in range(args.check // 2, args.check, 10):
+        small.add(start, records[start:start + 10])
+    for _, query in make_queries(rng, institutions, args.queries):
+        found, _ = small.search(limit=args.limit, **query)
+        assert [r['certificateId'] for r in found] == brute_force(records, query, args.limit), query
+    del records, small
+
+    tracemalloc.start()
+    index = CertificateSearchIndex()
+    started = time.perf_counter()
+    for start in range(0, args.records, 500):
+        index.add(start, [synthetic_record(i, rng, institutions)
+                          for i in range(start, min(args.records, start + 500))])
+    index.flush()
+    build_seconds = time.perf_counter() - started
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Leave the collection the build triggers out of the first query's timing
+    gc.collect()
+
+    latencies = {}
+    for shape, query in make_queries(rng, institutions, args.queries):
+        started = time.perf_counter()
+        index.search(limit=args.limit, **query)
+        latencies.setdefault(shape, []).append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    for i in range(100):
+        index.add(args.records + i, [synthetic_record(args.records + i, rng, institutions)])
+        index.search(holder='a', limit=1)
+    incremental_ms = (time.perf_counter() - started) * 10
+
+    print(json.dumps({
+        'records': args.records,
+        'build_seconds': round(build_seconds, 2),
+        'bytes_per_record': round(held / args.records),
+        'incremental_add_and_search_ms': round(incremental_ms, 3),
+        'queries': {
+            str(shape): {
+                'example': repr(make_queries(random.Random(0), institutions, shape + 1)[shape][1]),
+                'p50_ms': round(percentile(sorted(values), 50) * 1000, 3),
+                'p99_ms': round(percentile(sorted(values), 99) * 1000, 3)
+            }
+            for shape, values in sorted(latencies.items())
+        }
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+"""
+In-process local chain for benchmarks
+
+Deploys CertificateVerifier (or CertificateVerifierV2) to an eth-tester (py-evm) chain running inside
+the benchmark process, so no Ganache process or network is involved.
+
+Requires:
+    pip install "web3[tester]"
+and either a Hardhat artifact (`npx hardhat compile`) or py-solc-x.
+"""
+import hashlib
+import json
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from web3 import EthereumTesterProvider
+
+from blockchain_handler import BlockchainHandler
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+
+def artifact_path(contract_name='CertificateVerifier'):
+    """Path of a contract's Hardhat build artifact"""
+    return os.path.join(ROOT, 'artifacts', 'contracts', f'{contract_name}.sol', f'{contract_name}.json')
+
+
+DEFAULT_ARTIFACT = artifact_path()
+
+
+class LocalChainProvider(EthereumTesterProvider):
+    """
+    EthereumTesterProvider that serialises access and counts RPC calls.
+
+    py-evm is not thread-safe, so concurrent benchmark clients take turns;
+    the counter lets benchmarks report RPC calls per request.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.calls_by_method = {}
+
+    def make_request(self, method, params):
+        with self._lock:
+            self.calls += 1
+            self.calls_by_method[method] = self.calls_by_method.get(method, 0) + 1
+            return super().make_request(method, params)
+
+    def reset_counters(self):
+        with self._lock:
+            self.calls = 0
+            self.calls_by_method = {}
+
+
+def load_contract_interface(artifact_path=DEFAULT_ARTIFACT, contract_name='CertificateVerifier'):
+    """
+    Load ABI and bytecode, from a Hardhat artifact or by compiling with solcx
+
+    Returns:
+        Tuple of (abi, bytecode)
+    """
+    if os.path.exists(artifact_path):
+        with open(artifact_path, 'r') as f:
+            artifact = json.load(f)
+        return artifact['abi'], artifact['bytecode']
+
+    import solcx
+
+    solcx.install_solc('0.8.20')
+    source = os.path.join(ROOT, 'contracts', f'{contract_name}.sol')
+    compiled = solcx.compile_files(
+        [source],
+        output_values=['abi', 'bin'],
+        solc_version='0.8.20',
+        optimize=True,
+        optimize_runs=200
+    )
+    interface = compiled[f'{source}:{contract_name}']
+    return interface['abi'], interface['bin']
+
+
+def deploy(handler, artifact_path=DEFAULT_ARTIFACT, contract_name='CertificateVerifier'):
+    """Deploy a fresh contract through a handler and point the handler at it"""
+    abi, bytecode = load_contract_interface(artifact_path, contract_name)
+    Contract = handler.web3.eth.contract(abi=abi, bytecode=bytecode)
+    tx_hash = Contract.constructor().transact({'from': handler.account, 'gas': 6000000})
+    receipt = handler.web3.eth.wait_for_transaction_receipt(tx_hash)
+
+    handler.contract_address = receipt.contractAddress
+    handler.contract = handler.web3.eth.contract(address=receipt.contractAddress, abi=abi)
+
+
+def deploy_local_handler(artifact_path=DEFAULT_ARTIFACT, contract_name='CertificateVerifier', **handler_kwargs):
+    """
+    Start an in-process chain, deploy the contract and return a handler for it
+
+    Returns:
+        Tuple of (handler, provider)
+    """
+    provider = LocalChainProvider()
+    handler = BlockchainHandler(provider=provider, **handler_kwargs)
+    deploy(handler, artifact_path, contract_name)
+    return handler, provider
+
+
+def synthetic_certificate(i):
+    """Deterministic certificate fixture number i"""
+    content = f"%PDF-1.4 benchmark certificate {i}\n".encode() * 64
+    return {
+        'content': content,
+        'certificateId': f"BENCH-{i:07d}",
+        'certificateHash': hashlib.sha256(content).hexdigest(),
+        'holderName': f"Holder {i}",
+        'certificateType': ('Bachelor of Science', 'Master of Arts', 'Diploma')[i % 3],
+        'institution': ('Benchmark University', 'Test Institute', 'Example College')[i % 3],
+        'issueDate': 1700000000 + i * 86400
+    }
+
+
+def populate(handler, count, batch_size=200):
+    """Store `count` synthetic certificates using the pipelined batch API"""
+    for start in range(0, count, batch_size):
+        batch = [synthetic_certificate(i) for i in range(start, min(count, start + batch_size))]
+        handler.store_certificates_batch([
+            {key: value for key, value in cert.items() if key != 'content'} for cert in batch
+        ])
@@ -0,0 +1,104 @@
+"""
+Stand-in RPC endpoints for benchmarks
+
+A StandInNode is a local HTTP server that forwards JSON-RPC requests to a
+real node while adding latency and failures, so several "endpoints" with
+different health can be simulated in front of one Ganache or Hardhat
+node. They all serve the same chain, as the endpoints of an RPCPool must.
+"""
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+
+class StandInNode:
+    """
+    JSON-RPC proxy with configurable latency and failures.
+
+    Every request waits delay seconds plus up to jitter seconds; a
+    slow_rate share of requests waits slow_delay seconds more (the latency
+    tail hedging is meant to cut), and a failure_rate share is answered
+    with HTTP 503 without reaching the upstream node.
+    """
+
+    def __init__(self, upstream_url, delay=0.0, jitter=0.0, slow_rate=0.0, slow_delay=0.0,
+                 failure_rate=0.0, seed=None):
+        self.upstream_url = upstream_url
+        self.delay = delay
+        self.jitter = jitter
+        self.slow_rate = slow_rate
+        self.slow_delay = slow_delay
+        self.failure_rate = failure_rate
+        self.requests = 0
+        self.failures = 0
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._sessions = threading.local()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _session(self):
+        session = getattr(self._sessions, 'session', None)
+        if session is None:
+            session = self._sessions.session = requests.Session()
+        return session
+
+    def _plan(self):
+        """Decide (wait seconds, fail) for the next request"""
+        with self._lock:
+            self.requests += 1
+            wait = self.delay + self._random.uniform(0, self.jitter)
+            if self._random.random() < self.slow_rate:
+                wait += self.slow_delay
+            fail = self._random.random() < self.failure_rate
+            if fail:
+                self.failures += 1
+        return wait, fail
+
+    def _handler_class(self):
+        node = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+                wait, fail = node._plan()
+                if wait:
+                    time.sleep(wait)
+                if fail:
+                    self.send_response(503)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                upstream = node._session().post(
+                    node.upstream_url, data=body, headers={'Content-Type': 'application/json'}
+                )
+                self.send_response(upstream.status_code)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(upstream.content)))
+                self.end_headers()
+                self.wfile.write(upstream.content)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name='rpc-standin', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
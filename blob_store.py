@@ -0,0 +1,123 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+
+class BlobStore:
+    """
+    Content-addressed, deduplicated storage for certificate files.
+
+    Each file is stored once under its SHA-256, sharded by the first two
+    bytes of the hash (``ab/cd/abcd...``) so no directory grows beyond a
+    few entries per file. Blobs are written once: a file whose content is
+    already stored is discarded. A SQLite index maps certificate IDs to
+    blobs together with the original filename.
+    """
+
+    def __init__(self, root, db_path=None):
+        """
+        Args:
+            root: Directory holding the blob shards
+            db_path: SQLite metadata index (default: <root>/blob_index.db)
+        """
+        self.root = root
+        self.db_path = db_path or os.path.join(root, 'blob_index.db')
+        self.tmp_dir = os.path.join(root, 'tmp')
+        os.makedirs(self.tmp_dir, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = None
+        self._conn_pid = None
+
+    def _db(self):
+        # Opened lazily and per process, so the store can be created before fork
+        if self._conn is None or self._conn_pid != os.getpid():
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS certificate_files (
+                    certificate_id TEXT PRIMARY KEY,
+                    blob_hash TEXT NOT NULL,
+                    filename TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at INTEGER NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_certificate_files_blob ON certificate_files (blob_hash);
+            """)
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    def path_for(self, blob_hash):
+        """Absolute location of a blob in the sharded layout"""
+        blob_hash = blob_hash.lower()
+        if len(blob_hash) != 64 or not all(c in '0123456789abcdef' for c in blob_hash):
+            raise ValueError('Blob hash must be a hex SHA-256 digest')
+        return os.path.join(self.root, blob_hash[:2], blob_hash[2:4], blob_hash)
+
+    def create_temp(self):
+        """
+        Create a temporary file on the store's filesystem to stream an upload into
+
+        Returns:
+            Tuple of (fd, path) as returned by tempfile.mkstemp
+        """
+        return tempfile.mkstemp(dir=self.tmp_dir, suffix='.part')
+
+    def commit(self, tmp_path, blob_hash):
+        """
+        Move a fully written temporary file into the store unless the blob exists
+
+        The temporary file is consumed either way.
+
+        Returns:
+            True if a new blob was written, False if the content was already stored
+        """
+        path = self.path_for(blob_hash)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            # link() fails if the target exists, so concurrent writers of the
+            # same content cannot replace a blob that is being served
+            os.link(tmp_path, path)
+            created = True
+        except FileExistsError:
+            created = False
+        finally:
+            os.unlink(tmp_path)
+        return created
+
+    def attach(self, cert_id, blob_hash, filename):
+        """Record that a certificate's file is the given blob"""
+        size = os.path.getsize(self.path_for(blob_hash))
+        with self._lock:
+            conn = self._db()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO certificate_files VALUES (?, ?, ?, ?, ?)",
+                    (cert_id, blob_hash.lower(), filename, size, int(time.time()))
+                )
+
+    def get(self, cert_id):
+        """
+        Look up the file stored for a certificate
+
+        Returns:
+            Dict with blobHash, filename, size and path, or None
+        """
+        with self._lock:
+            row = self._db().execute(
+                "SELECT blob_hash, filename, size FROM certificate_files WHERE certificate_id = ?",
+                (cert_id,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        blob_hash, filename, size = row
+        return {
+            'blobHash': blob_hash,
+            'filename': filename,
+            'size': size,
+            'path': self.path_for(blob_hash)
+        }
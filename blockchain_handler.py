@@ -1,8 +1,28 @@
 from web3 import Web3
+from web3.exceptions import TransactionNotFound
+from hexbytes import HexBytes
+import requests
+from requests.adapters import HTTPAdapter
 import json
 import hashlib
 from datetime import datetime
 import os
+import threading
+import time
+import metrics
+from certificate_codec import (
+    decode_certificate_hash, decode_certificate_id, encode_certificate_hash, encode_certificate_id,
+    uses_compact_layout
+)
+from certificate_index import CertificateIndex
+from certificate_search import CertificateSearchIndex
+from change_feed import ChangeFeed
+from existence_filter import CertificateExistenceFilter
+from merkle import MerkleProofStore, MerkleTree, compute_root, normalize_hash
+from receipt_poller import ReceiptPoller
+from rpc_pool import RPCPool
+from transaction_submitter import TransactionSubmitter
+from verification_cache import VerificationCache
 
 class BlockchainHandler:
     """
@@ -10,41 +30,109 @@ class BlockchainHandler:
     Connects to Ganache and interacts with the deployed smart contract.
     """
 
-    def __init__(self, provider_url="http://127.0.0.1:7545", contract_address=None, contract_abi_path=None):
+    def __init__(self, provider_url="http://127.0.0.1:7545", contract_address=None, contract_abi_path=None,
+                 read_chunk_size=500, cache_max_bytes=16 * 1024 * 1024, block_refresh_interval=1.0,
+                 pool_size=20, request_timeout=30, health_check_interval=5.0, provider=None, contract_abi=None):
         """
         Initialize connection to Ganache blockchain
 
         Args:
-            provider_url: URL of the Ganache RPC server (default: http://127.0.0.1:7545)
+            provider_url: URL of the Ganache RPC server (default: http://127.0.0.1:7545),
+                or a list of URLs serving the same chain: reads are then balanced
+                over all of them and transactions go to the first (see RPCPool)
             contract_address: Address of the deployed contract
             contract_abi_path: Path to the contract ABI JSON file
+            read_chunk_size: Number of certificates fetched per RPC round trip
+                when listing the registry (default: 500)
+            cache_max_bytes: Memory budget of the verification result cache,
+                0 disables caching (default: 16 MB)
+            block_refresh_interval: Seconds a known block number is reused
+                before asking the node again (default: 1.0)
+            pool_size: Keep-alive HTTP connections kept open to the node (default: 20)
+            request_timeout: Seconds before an RPC request times out (default: 30)
+            health_check_interval: Seconds a connection check result is reused
+                by is_connected (default: 5.0)
+            provider: Web3 provider to use instead of an HTTP connection to
+                provider_url, e.g. an in-process EthereumTesterProvider
+            contract_abi: Already parsed contract ABI, used instead of
+                reading contract_abi_path
         """
-        self.web3 = Web3(Web3.HTTPProvider(provider_url))
+        if isinstance(provider_url, (list, tuple)) and len(provider_url) == 1:
+            provider_url = provider_url[0]
+        self.provider_url = provider_url
+        self.read_chunk_size = read_chunk_size
+        self.cache = VerificationCache(cache_max_bytes) if cache_max_bytes else None
+        self.block_refresh_interval = block_refresh_interval
+        self.request_timeout = request_timeout
+        self.health_check_interval = health_check_interval
+        self._block_number = None
+        self._block_checked_at = 0.0
+        self._balance = None
+        self._balance_block = None
+
+        # One pooled keep-alive session shared by web3 and batched reads
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        if provider is None and isinstance(provider_url, (list, tuple)):
+            provider = RPCPool(provider_url, session=self.session, request_timeout=request_timeout)
+        elif provider is None:
+            provider = Web3.HTTPProvider(
+                provider_url,
+                request_kwargs={'timeout': request_timeout},
+                session=self.session
+            )
+        self.web3 = Web3(provider)
+        self.web3.middleware_onion.add(metrics.rpc_metrics_middleware, 'rpc_metrics')
 
         # Check connection
         if not self.web3.is_connected():
             raise Exception(f"Failed to connect to Ganache at {provider_url}")
+        self._connected = True
+        self._health_checked_at = time.monotonic()
+
+        # Chain ID and accounts never change for a running node, fetch them once
+        self.chain_id = self.web3.eth.chain_id
+        self.accounts = self.web3.eth.accounts
 
         print(f"✓ Connected to Ganache blockchain")
-        print(f"  Chain ID: {self.web3.eth.chain_id}")
-        print(f"  Latest Block: {self.web3.eth.block_number}")
+        print(f"  Chain ID: {self.chain_id}")
+        print(f"  Latest Block: {self._current_block()}")
 
         # Set default account (first account from Ganache)
-        self.web3.eth.default_account = self.web3.eth.accounts[0]
-        self.account = self.web3.eth.accounts[0]
+        self.web3.eth.default_account = self.accounts[0]
+        self.account = self.accounts[0]
+
+        # Tracks transactions submitted without waiting for them to be mined
+        self.receipt_poller = ReceiptPoller(self.web3, rpc_batch=self._rpc_batch)
+
+        # Local nonces and cached gas limits for every transaction we send
+        self.submitter = TransactionSubmitter(self.web3, self.account, self.receipt_poller)
 
         # Load contract if address and ABI provided
         self.contract = None
         self.contract_address = contract_address
-
-        if contract_address and contract_abi_path:
-            self.load_contract(contract_address, contract_abi_path)
-
-    def load_contract(self, contract_address, contract_abi_path):
-        """Load the smart contract using address and ABI"""
+        self._layout_contract = None
+        self._compact_layout = False
+        self.index = None
+        self.merkle_store = None
+        self.existence_filter = None
+        self.change_feed = None
+        self.search_index = None
+        self._search_synced_block = None
+        self._search_sync_lock = threading.Lock()
+
+        if contract_address and (contract_abi_path or contract_abi):
+            self.load_contract(contract_address, contract_abi_path, contract_abi=contract_abi)
+
+    def load_contract(self, contract_address, contract_abi_path=None, contract_abi=None):
+        """Load the smart contract using address and ABI (file path or parsed list)"""
         try:
-            with open(contract_abi_path, 'r') as f:
-                contract_abi = json.load(f)
+            if contract_abi is None:
+                with open(contract_abi_path, 'r') as f:
+                    contract_abi = json.load(f)
 
             self.contract_address = Web3.to_checksum_address(contract_address)
             self.contract = self.web3.eth.contract(
@@ -57,6 +145,228 @@ class BlockchainHandler:
             print(f"✗ Error loading contract: {str(e)}")
             return False
 
+    @property
+    def compact_layout(self):
+        """True if the loaded contract keys certificates by bytes32 (CertificateVerifierV2)"""
+        if self._layout_contract is not self.contract:
+            self._compact_layout = self.contract is not None and uses_compact_layout(self.contract)
+            self._layout_contract = self.contract
+        return self._compact_layout
+
+    def _id_arg(self, cert_id):
+        """Certificate ID in the form the loaded contract expects"""
+        return encode_certificate_id(cert_id) if self.compact_layout else cert_id
+
+    def _hash_arg(self, cert_hash):
+        """Certificate hash in the form the loaded contract expects"""
+        return encode_certificate_hash(cert_hash) if self.compact_layout else cert_hash
+
+    def _canonical_hash(self, cert_hash):
+        """
+        Hash as the registry reports it back: compact deployments store bytes,
+        so any hex spelling of a hash (0x prefix, upper case) is the same key
+        """
+        return encode_certificate_hash(cert_hash).hex() if self.compact_layout else cert_hash
+
+    def enable_index(self, db_path, start_block=0, confirmations=0, poll_interval=2.0):
+        """
+        Serve verification reads from a local event-sourced SQLite index
+
+        Args:
+            db_path: Path to the SQLite index database
+            start_block: Block the contract was deployed in
+            confirmations: Confirmations required before a certificate is indexed
+            poll_interval: Seconds between background index syncs
+
+        Returns:
+            True if the index was enabled, False otherwise
+        """
+        if not self.contract:
+            print("✗ Contract not loaded")
+            return False
+
+        try:
+            self.index = CertificateIndex(
+                self.web3,
+                self.contract,
+                db_path,
+                start_block=start_block,
+                confirmations=confirmations
+            )
+            added = self.index.sync()
+            self.index.start(poll_interval)
+            print(f"✓ Certificate index enabled ({added} new, synced to block {self.index.last_block})")
+            return True
+        except Exception as e:
+            print(f"✗ Error enabling certificate index: {str(e)}")
+            self.index = None
+            return False
+
+    def enable_existence_filter(self, start_block=0, capacity=100000, error_rate=0.001):
+        """
+        Answer lookups for certificates that were never stored without an RPC
+
+        The filter is built from CertificateStored events and caught up to
+        the current block before each use, so it never misses a certificate
+        stored by another issuer.
+
+        Args:
+            start_block: Block the contract was deployed in
+            capacity: Certificates expected before the filter grows
+            error_rate: Target false positive rate
+
+        Returns:
+            True if the filter was enabled, False otherwise
+        """
+        if not self.contract:
+            print("✗ Contract not loaded")
+            return False
+
+        try:
+            self.existence_filter = CertificateExistenceFilter(
+                self.contract,
+                start_block=start_block,
+                capacity=capacity,
+                error_rate=error_rate
+            )
+            added = self.existence_filter.sync_to(self._current_block())
+            print(f"✓ Existence filter enabled ({added} certificates, synced to block "
+                  f"{self.existence_filter.synced_block})")
+            return True
+        except Exception as e:
+            print(f"✗ Error enabling existence filter: {str(e)}")
+            self.existence_filter = None
+            return False
+
+    def enable_change_feed(self, start_block=0, confirmations=0, poll_interval=2.0):
+        """
+        Serve "certificates stored since block N" and live updates from events
+
+        Args:
+            start_block: Block the contract was deployed in
+            confirmations: Confirmations required before a certificate is published
+            poll_interval: Seconds between polls while there are live subscribers
+
+        Returns:
+            True if the feed was enabled, False otherwise
+        """
+        if not self.contract:
+            print("✗ Contract not loaded")
+            return False
+
+        self.change_feed = ChangeFeed(
+            self.web3,
+            self.contract,
+            start_block=start_block,
+            confirmations=confirmations,
+            poll_interval=poll_interval
+        )
+        print(f"✓ Change feed enabled from block {start_block}")
+        return True
+
+    def enable_search_index(self):
+        """
+        Answer certificate searches from an in-memory index of the registry
+
+        The index is read from the registry once and extended with new
+        registry entries whenever a search sees a new block.
+
+        Returns:
+            True if the index was enabled, False otherwise
+        """
+        if not self.contract:
+            print("✗ Contract not loaded")
+            return False
+
+        try:
+            self.search_index = CertificateSearchIndex()
+            added = self._sync_search_index(self._current_block())
+            print(f"✓ Search index enabled ({added} certificates)")
+            return True
+        except Exception as e:
+            print(f"✗ Error enabling search index: {str(e)}")
+            self.search_index = None
+            return False
+
+    def _sync_search_index(self, block):
+        """Add registry entries stored since the last sync; returns how many"""
+        with self._search_sync_lock:
+            if self._search_synced_block == block:
+                return 0
+
+            registry_block = self._registry_block()
+            count = self.contract.functions.getCertificateCount().call(block_identifier=registry_block)
+            added = 0
+            for start in range(len(self.search_index), count, self.read_chunk_size):
+                added += self.search_index.add(start, self._fetch_certificate_range(
+                    start, min(self.read_chunk_size, count - start), registry_block
+                ))
+            self.search_index.flush()
+            self._search_synced_block = block
+            return added
+
+    def search_certificates(self, holder=None, institution=None, cert_type=None, issued_from=None,
+                            issued_to=None, cursor=0, limit=100):
+        """
+        Search the registry by holder, institution, type and issue date
+
+        Args:
+            holder: Case-insensitive prefix of the holder name
+            institution: Case-insensitive prefix of the institution
+            cert_type: Exact certificate type
+            issued_from: Earliest issue date (inclusive, Unix seconds)
+            issued_to: Latest issue date (inclusive, Unix seconds)
+            cursor: Registry index to resume from
+            limit: Maximum number of certificates in the page
+
+        Returns:
+            Tuple of (certificates, next_cursor); next_cursor is None on the
+            last page
+        """
+        if self.search_index is None:
+            raise RuntimeError('Search index not enabled')
+
+        # One certificate count call per new block keeps the index current
+        block = self._current_block()
+        if block != self._search_synced_block:
+            self._sync_search_index(block)
+
+        return self.search_index.search(
+            holder=holder,
+            institution=institution,
+            cert_type=cert_type,
+            issued_from=issued_from,
+            issued_to=issued_to,
+            cursor=cursor,
+            limit=limit
+        )
+
+    def _definitely_absent(self, kind, value, min_block=None):
+        """
+        Check the existence filter for a certificate ID or hash
+
+        Returns:
+            True only if the certificate is certainly not stored as of the
+            current block (and min_block); False means "ask the chain"
+        """
+        if self.existence_filter is None:
+            return False
+
+        current_block = self._current_block()
+        if min_block is not None and min_block > current_block:
+            return False
+
+        try:
+            if self.existence_filter.synced_block < current_block:
+                self.existence_filter.sync_to(current_block)
+        except Exception as e:
+            print(f"✗ Error syncing existence filter: {str(e)}")
+            return False
+
+        if kind == 'id':
+            return not self.existence_filter.might_contain_id(value)
+        return not self.existence_filter.might_contain_hash(value)
+
     def deploy_contract(self, contract_json_path, contract_name="CertificateVerifier"):
         """
         Deploy the smart contract to Ganache
@@ -130,6 +440,54 @@ class BlockchainHandler:
         """
         return hashlib.sha256(file_data).hexdigest()
 
+    def generate_certificate_hash_from_stream(self, stream, sink=None, chunk_size=64 * 1024):
+        """
+        Generate SHA-256 hash of a certificate file read incrementally
+
+        Args:
+            stream: Readable binary file-like object
+            sink: Optional writable file-like object that receives a copy
+                of every chunk, so the file can be saved in the same pass
+            chunk_size: Bytes read per iteration
+
+        Returns:
+            Hex string of the hash
+        """
+        digest = hashlib.sha256()
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            digest.update(chunk)
+            if sink is not None:
+                sink.write(chunk)
+        return digest.hexdigest()
+
+    def _submit_certificate(self, cert_id, cert_hash, holder_name, cert_type, institution, issue_date):
+        """
+        Send a storeCertificate transaction without waiting for it to be mined
+
+        Returns:
+            Transaction hash, or None if the certificate already exists
+        """
+        # Check if certificate already exists (skipped when the filter rules it out)
+        exists = not self._definitely_absent('id', cert_id) and \
+            self.contract.functions.certificateExists(self._id_arg(cert_id)).call()
+        if exists:
+            print(f"✗ Certificate with ID {cert_id} already exists on blockchain")
+            return None
+
+        # Build transaction
+        print(f"Storing certificate {cert_id} on blockchain...")
+        return self.submitter.send(self.contract.functions.storeCertificate(
+            self._id_arg(cert_id),
+            self._hash_arg(cert_hash),
+            holder_name,
+            cert_type,
+            institution,
+            issue_date
+        ))
+
     def store_certificate(self, cert_id, cert_hash, holder_name, cert_type, institution, issue_date):
         """
         Store certificate on blockchain
@@ -150,28 +508,19 @@ class BlockchainHandler:
             return None
 
         try:
-            # Check if certificate already exists
-            exists = self.contract.functions.certificateExists(cert_id).call()
-            if exists:
-                print(f"✗ Certificate with ID {cert_id} already exists on blockchain")
+            tx_hash = self._submit_certificate(
+                cert_id, cert_hash, holder_name, cert_type, institution, issue_date
+            )
+            if tx_hash is None:
                 return None
 
-            # Build transaction
-            print(f"Storing certificate {cert_id} on blockchain...")
-            tx_hash = self.contract.functions.storeCertificate(
-                cert_id,
-                cert_hash,
-                holder_name,
-                cert_type,
-                institution,
-                issue_date
-            ).transact({
-                'from': self.account,
-                'gas': 500000
-            })
-
             # Wait for transaction to be mined
-            tx_receipt = self.web3.eth.wait_for_transaction_receipt(tx_hash)
+            tx_receipt = self.submitter.wait(tx_hash)
+            if tx_receipt.status != 1:
+                # Gas is no longer estimated per call, so a duplicate or raced ID surfaces here
+                print(f"✗ Transaction {tx_hash.hex()} failed: {self._store_failure(tx_receipt)}")
+                return None
+            self._on_certificate_mined(cert_id, cert_hash, tx_receipt)
 
             print(f"✓ Certificate stored successfully!")
             print(f"  Transaction Hash: {tx_hash.hex()}")
@@ -184,12 +533,321 @@ class BlockchainHandler:
             print(f"✗ Error storing certificate: {str(e)}")
             return None
 
-    def verify_certificate_by_id(self, cert_id):
+    def store_certificate_async(self, cert_id, cert_hash, holder_name, cert_type, institution, issue_date,
+                                on_stored=None):
+        """
+        Submit a certificate and return as soon as the transaction hash is known
+
+        The transaction is tracked by the shared receipt poller; use
+        get_transaction_status to follow it.
+
+        Args:
+            Same as store_certificate, plus
+            on_stored: Optional callback(receipt) run on the receipt poller's
+                thread once the certificate is mined successfully
+
+        Returns:
+            Job status dict if submitted, None otherwise
+        """
+        if not self.contract:
+            print("✗ Contract not loaded. Please deploy or load contract first.")
+            return None
+
+        try:
+            tx_hash = self._submit_certificate(
+                cert_id, cert_hash, holder_name, cert_type, institution, issue_date
+            )
+            if tx_hash is None:
+                return None
+
+            print(f"✓ Certificate {cert_id} submitted, transaction {tx_hash.hex()} pending")
+
+            return self.receipt_poller.track(
+                tx_hash,
+                metadata={'certificateId': cert_id, 'certificateHash': cert_hash},
+                on_mined=lambda job, receipt: self._on_certificate_mined(cert_id, cert_hash, receipt, on_stored)
+            )
+
+        except Exception as e:
+            print(f"✗ Error submitting certificate: {str(e)}")
+            return None
+
+    def get_transaction_status(self, tx_hash):
+        """
+        Get the status of a submitted transaction
+
+        Transactions submitted by this process are answered by the receipt
+        poller; others are looked up on the node directly.
+
+        Args:
+            tx_hash: Transaction hash as a hex string
+
+        Returns:
+            Job status dict, or None if the node does not know the transaction
+
+        Raises:
+            ValueError: If tx_hash is not 0x followed by 64 hex digits
+        """
+        if len(tx_hash) != 66 or not tx_hash.startswith('0x') or \
+                not all(c in '0123456789abcdefABCDEF' for c in tx_hash[2:]):
+            raise ValueError('Transaction hash must be 0x followed by 64 hex digits')
+
+        job = self.receipt_poller.get(tx_hash)
+        if job is not None:
+            return job
+
+        try:
+            receipt = self.web3.eth.get_transaction_receipt(tx_hash)
+            return {
+                'transactionHash': tx_hash,
+                'status': 'mined' if receipt.status == 1 else 'failed',
+                'blockNumber': receipt.blockNumber,
+                'gasUsed': receipt.gasUsed,
+                'error': None if receipt.status == 1 else 'Transaction reverted'
+            }
+        except TransactionNotFound:
+            pass
+
+        # Pending transactions are only known to the node they were sent to,
+        # which is where an RPCPool sends lookups by transaction hash
+        try:
+            self.web3.eth.get_transaction(tx_hash)
+        except TransactionNotFound:
+            return None
+
+        return {
+            'transactionHash': tx_hash,
+            'status': 'pending',
+            'blockNumber': None,
+            'gasUsed': None,
+            'error': None
+        }
+
+    def store_certificates_batch(self, certificates):
+        """
+        Store many certificates with pipelined transaction submission
+
+        All transactions are sent back to back through the transaction
+        submitter (local nonces, cached gas limits), then receipts are
+        collected by the shared receipt poller, so a batch costs roughly one
+        block time instead of one mining round trip per certificate.
+
+        Args:
+            certificates: List of dicts with certificateId, certificateHash,
+                holderName, certificateType, institution and issueDate keys
+
+        Returns:
+            List of per-item result dicts in input order
+        """
+        if not self.contract:
+            print("✗ Contract not loaded. Please deploy or load contract first.")
+            return [{'success': False, 'error': 'Contract not loaded'} for _ in certificates]
+
+        results = [None] * len(certificates)
+        pending = []
+        seen_ids = set()
+
+        print(f"Submitting {len(certificates)} certificates...")
+
+        for i, cert in enumerate(certificates):
+            cert_id = cert['certificateId']
+            if cert_id in seen_ids:
+                results[i] = {
+                    'success': False,
+                    'certificateId': cert_id,
+                    'error': 'Duplicate certificate ID in batch'
+                }
+                continue
+            seen_ids.add(cert_id)
+
+            try:
+                tx_hash = self.submitter.send(self.contract.functions.storeCertificate(
+                    self._id_arg(cert_id),
+                    self._hash_arg(cert['certificateHash']),
+                    cert['holderName'],
+                    cert['certificateType'],
+                    cert['institution'],
+                    cert['issueDate']
+                ))
+                pending.append((i, tx_hash))
+            except Exception as e:
+                results[i] = {
+                    'success': False,
+                    'certificateId': cert_id,
+                    'error': str(e)
+                }
+
+        for i, tx_hash in pending:
+            cert = certificates[i]
+            try:
+                tx_receipt = self.submitter.wait(tx_hash)
+                if tx_receipt.status != 1:
+                    results[i] = {
+                        'success': False,
+                        'certificateId': cert['certificateId'],
+                        'transactionHash': tx_hash.hex(),
+                        'error': self._store_failure(tx_receipt)
+                    }
+                    continue
+
+                self._on_certificate_mined(cert['certificateId'], cert['certificateHash'], tx_receipt)
+                results[i] = {
+                    'success': True,
+                    'certificateId': cert['certificateId'],
+                    'certificateHash': cert['certificateHash'],
+                    'transactionHash': tx_hash.hex(),
+                    'blockNumber': tx_receipt.blockNumber,
+                    'gasUsed': tx_receipt.gasUsed
+                }
+            except Exception as e:
+                results[i] = {
+                    'success': False,
+                    'certificateId': cert['certificateId'],
+                    'transactionHash': tx_hash.hex(),
+                    'error': str(e)
+                }
+
+        stored = sum(1 for r in results if r['success'])
+        print(f"✓ Stored {stored}/{len(certificates)} certificates in batch")
+
+        return results
+
+    def _current_block(self):
+        """Latest block number, refreshed at most every block_refresh_interval seconds"""
+        now = time.monotonic()
+        if self._block_number is None or now - self._block_checked_at >= self.block_refresh_interval:
+            self._block_number = self.web3.eth.block_number
+            self._block_checked_at = now
+        return self._block_number
+
+    def _store_failure(self, tx_receipt):
+        """Error message for a storeCertificate transaction that did not succeed"""
+        if self.submitter.ran_out_of_gas(tx_receipt):
+            return 'Transaction ran out of gas'
+        # storeCertificate only reverts on duplicate IDs or empty fields
+        return 'Transaction reverted (certificate may already exist)'
+
+    def _on_certificate_mined(self, cert_id, cert_hash, tx_receipt, on_stored=None):
+        """Bookkeeping after a storeCertificate transaction is mined"""
+        if tx_receipt.status != 1:
+            return
+
+        if on_stored is not None:
+            on_stored(tx_receipt)
+
+        metrics.store_gas_used.observe(tx_receipt.gasUsed)
+
+        if self.existence_filter is not None:
+            self.existence_filter.add(cert_id, cert_hash)
+
+        # Make our own stores searchable on the next search, even within the same block refresh
+        self._search_synced_block = None
+
+        # Drop cached negative results for the certificate that was just stored
+        if self.cache is not None:
+            self.cache.invalidate(('id', cert_id))
+            self.cache.invalidate(('hash', self._canonical_hash(cert_hash)))
+
+    @staticmethod
+    def _cert_from_id_result(result):
+        """Map a verifyCertificateById result tuple to a certificate dict"""
+        return {
+            'exists': result[0],
+            'certificateHash': decode_certificate_hash(result[1]),
+            'holderName': result[2],
+            'certificateType': result[3],
+            'institution': result[4],
+            'issueDate': result[5],
+            'timestamp': result[6],
+            'issuer': result[7],
+            'verified': True
+        }
+
+    @staticmethod
+    def _cert_from_hash_result(result):
+        """Map a verifyCertificateByHash result tuple to a certificate dict"""
+        return {
+            'exists': result[0],
+            'certificateId': decode_certificate_id(result[1]),
+            'holderName': result[2],
+            'certificateType': result[3],
+            'institution': result[4],
+            'verified': True
+        }
+
+    def _cached_lookup(self, key, min_block, lookup):
+        """
+        Run a verification lookup through the result cache
+
+        Args:
+            key: Cache key, e.g. ('id', cert_id)
+            min_block: Oldest block the answer must reflect (optional)
+            lookup: Callable returning the certificate dict or None; raises on errors
+
+        Returns:
+            Tuple of (cert_data, from_cache)
+        """
+        if self.cache is None:
+            return lookup(), False
+
+        current_block = self._current_block()
+        found, cert_data = self.cache.get(key, current_block, min_block)
+        if found:
+            return cert_data, True
+
+        cert_data = lookup()
+        self._cache_result(key, cert_data, current_block)
+        return cert_data, False
+
+    def _cache_result(self, key, cert_data, observed_block):
+        """Remember a lookup result; misses are only valid for observed_block"""
+        if self.cache is None:
+            return
+        if cert_data is not None:
+            self.cache.put_hit(key, cert_data)
+        else:
+            self.cache.put_miss(key, observed_block)
+
+    def _lookup_by_id(self, cert_id, min_block):
+        if self._definitely_absent('id', cert_id, min_block):
+            return None
+
+        if self.index is not None and self.index.is_synced_to(min_block):
+            cert_data = self.index.get_by_id(cert_id)
+            if cert_data is not None or min_block is not None:
+                return cert_data
+
+        result = self.contract.functions.verifyCertificateById(self._id_arg(cert_id)).call()
+        if not result[0]:  # exists flag
+            return None
+        return self._cert_from_id_result(result)
+
+    def _lookup_by_hash(self, cert_hash, min_block):
+        if self._definitely_absent('hash', cert_hash, min_block):
+            return None
+
+        if self.index is not None and self.index.is_synced_to(min_block):
+            cert_data = self.index.get_by_hash(cert_hash)
+            if cert_data is not None or min_block is not None:
+                return cert_data
+
+        result = self.contract.functions.verifyCertificateByHash(self._hash_arg(cert_hash)).call()
+        if not result[0]:  # exists flag
+            return None
+        return self._cert_from_hash_result(result)
+
+    def verify_certificate_by_id(self, cert_id, min_block=None):
         """
         Verify certificate by ID
 
+        Results are served from the verification cache when possible. When
+        the local index is enabled, hits are answered from it; misses are
+        only answered locally when min_block is given and the index has
+        caught up to it, otherwise the contract is queried.
+
         Args:
             cert_id: Certificate ID to verify
+            min_block: Oldest block the answer must reflect (optional)
 
         Returns:
             Dictionary with certificate details if found, None otherwise
@@ -199,28 +857,19 @@ class BlockchainHandler:
             return None
 
         try:
-            result = self.contract.functions.verifyCertificateById(cert_id).call()
+            cert_data, from_cache = self._cached_lookup(
+                ('id', cert_id), min_block, lambda: self._lookup_by_id(cert_id, min_block)
+            )
 
-            if not result[0]:  # exists flag
+            if cert_data is None:
                 print(f"✗ Certificate {cert_id} not found on blockchain")
                 return None
 
-            cert_data = {
-                'exists': result[0],
-                'certificateHash': result[1],
-                'holderName': result[2],
-                'certificateType': result[3],
-                'institution': result[4],
-                'issueDate': result[5],
-                'timestamp': result[6],
-                'issuer': result[7],
-                'verified': True
-            }
-
-            print(f"✓ Certificate verified successfully!")
-            print(f"  Holder: {cert_data['holderName']}")
-            print(f"  Type: {cert_data['certificateType']}")
-            print(f"  Institution: {cert_data['institution']}")
+            if not from_cache:
+                print(f"✓ Certificate verified successfully!")
+                print(f"  Holder: {cert_data['holderName']}")
+                print(f"  Type: {cert_data['certificateType']}")
+                print(f"  Institution: {cert_data['institution']}")
 
             return cert_data
 
@@ -228,12 +877,16 @@ class BlockchainHandler:
             print(f"✗ Error verifying certificate: {str(e)}")
             return None
 
-    def verify_certificate_by_hash(self, cert_hash):
+    def verify_certificate_by_hash(self, cert_hash, min_block=None):
         """
         Verify certificate by hash
 
+        Uses the verification cache and local index with the same
+        consistency rules as verify_certificate_by_id.
+
         Args:
             cert_hash: Certificate hash to verify
+            min_block: Oldest block the answer must reflect (optional)
 
         Returns:
             Dictionary with certificate details if found, None otherwise
@@ -243,24 +896,19 @@ class BlockchainHandler:
             return None
 
         try:
-            result = self.contract.functions.verifyCertificateByHash(cert_hash).call()
+            cert_hash = self._canonical_hash(cert_hash)
+            cert_data, from_cache = self._cached_lookup(
+                ('hash', cert_hash), min_block, lambda: self._lookup_by_hash(cert_hash, min_block)
+            )
 
-            if not result[0]:  # exists flag
+            if cert_data is None:
                 print(f"✗ Certificate with hash {cert_hash[:16]}... not found")
                 return None
 
-            cert_data = {
-                'exists': result[0],
-                'certificateId': result[1],
-                'holderName': result[2],
-                'certificateType': result[3],
-                'institution': result[4],
-                'verified': True
-            }
-
-            print(f"✓ Certificate verified by hash!")
-            print(f"  Certificate ID: {cert_data['certificateId']}")
-            print(f"  Holder: {cert_data['holderName']}")
+            if not from_cache:
+                print(f"✓ Certificate verified by hash!")
+                print(f"  Certificate ID: {cert_data['certificateId']}")
+                print(f"  Holder: {cert_data['holderName']}")
 
             return cert_data
 
@@ -268,10 +916,422 @@ class BlockchainHandler:
             print(f"✗ Error verifying certificate by hash: {str(e)}")
             return None
 
+    def verify_certificates_bulk(self, keys, min_block=None):
+        """
+        Verify many certificates by ID and/or hash with as few round trips as possible
+
+        Keys are deduplicated, answered from the verification cache and local
+        index where possible, and the remainder is sent to the node as batched
+        JSON-RPC eth_calls.
+
+        Args:
+            keys: List of ('id', cert_id) or ('hash', cert_hash) tuples
+            min_block: Oldest block the answers must reflect (optional)
+
+        Returns:
+            Dict mapping each distinct key to a certificate dict, None if not
+            found, or an Exception if that lookup failed (a ValueError if the
+            key cannot be represented by the contract)
+        """
+        if not self.contract:
+            print("✗ Contract not loaded")
+            return {key: Exception('Contract not loaded') for key in keys}
+
+        results = {}
+        pending = {'id': [], 'hash': []}
+        current_block = self._current_block() if self.cache is not None else None
+        use_index = self.index is not None and self.index.is_synced_to(min_block)
+
+        for key in dict.fromkeys(keys):
+            kind, value = key
+            if kind == 'hash':
+                try:
+                    value = self._canonical_hash(value)
+                except ValueError as e:
+                    results[key] = e
+                    continue
+            lookup_key = (kind, value)
+
+            if self.cache is not None:
+                found, cert_data = self.cache.get(lookup_key, current_block, min_block)
+                if found:
+                    results[key] = cert_data
+                    continue
+
+            if self._definitely_absent(kind, value, min_block):
+                results[key] = None
+                self._cache_result(lookup_key, None, current_block)
+                continue
+
+            if use_index:
+                cert_data = self.index.get_by_id(value) if kind == 'id' else self.index.get_by_hash(value)
+                if cert_data is not None or min_block is not None:
+                    results[key] = cert_data
+                    self._cache_result(lookup_key, cert_data, current_block)
+                    continue
+
+            pending[kind].append((key, value))
+
+        lookups = (
+            ('id', 'verifyCertificateById', self._cert_from_id_result, self._id_arg),
+            ('hash', 'verifyCertificateByHash', self._cert_from_hash_result, self._hash_arg)
+        )
+        for kind, fn_name, to_cert, to_arg in lookups:
+            encoded = []
+            for key, value in pending[kind]:
+                try:
+                    encoded.append((key, value, to_arg(value)))
+                except ValueError as e:
+                    results[key] = e
+            if not encoded:
+                continue
+
+            try:
+                batch_results = self.batch_call(fn_name, [[arg] for _, _, arg in encoded])
+            except Exception as e:
+                print(f"✗ Error in bulk verification: {str(e)}")
+                batch_results = [e] * len(encoded)
+
+            for (key, value, _), result in zip(encoded, batch_results):
+                if isinstance(result, Exception):
+                    results[key] = result
+                    continue
+
+                cert_data = to_cert(result) if result[0] else None
+                results[key] = cert_data
+                self._cache_result((kind, value), cert_data, current_block)
+
+        found = sum(1 for value in results.values() if isinstance(value, dict))
+        print(f"✓ Bulk verification: {found}/{len(results)} distinct certificates found")
+
+        return results
+
+    def enable_merkle_store(self, db_path):
+        """Persist Merkle inclusion proofs for batch anchoring in a SQLite file"""
+        self.merkle_store = MerkleProofStore(db_path)
+        print(f"✓ Merkle proof store opened at {db_path}")
+
+    def anchor_certificate_batch(self, cert_hashes):
+        """
+        Anchor many certificate hashes on chain with a single transaction
+
+        A Merkle tree is built over the hashes and only its root is stored
+        on chain; inclusion proofs are kept in the local proof store.
+
+        Args:
+            cert_hashes: List of SHA-256 certificate hashes (hex strings)
+
+        Returns:
+            Dictionary with the root and transaction details if successful,
+            None otherwise
+        """
+        if not self.contract:
+            print("✗ Contract not loaded. Please deploy or load contract first.")
+            return None
+
+        if self.merkle_store is None:
+            print("✗ Merkle proof store not enabled")
+            return None
+
+        try:
+            tree = MerkleTree(cert_hashes)
+            root = tree.root
+
+            print(f"Anchoring Merkle root of {tree.leaf_count} certificates...")
+            tx_hash = self.submitter.send(self.contract.functions.anchorMerkleRoot(root, tree.leaf_count))
+            tx_receipt = self.submitter.wait(tx_hash)
+
+            if tx_receipt.status != 1:
+                print("✗ Anchoring transaction reverted (root may already be anchored)")
+                return None
+
+            self.merkle_store.save_batch(tree, cert_hashes, tx_hash.hex(), tx_receipt.blockNumber)
+
+            print("✓ Merkle root anchored!")
+            print(f"  Root: 0x{root.hex()}")
+            print(f"  Transaction Hash: {tx_hash.hex()}")
+            print(f"  Gas Used: {tx_receipt.gasUsed}")
+
+            return {
+                'merkleRoot': '0x' + root.hex(),
+                'leafCount': tree.leaf_count,
+                'transactionHash': tx_hash.hex(),
+                'blockNumber': tx_receipt.blockNumber,
+                'gasUsed': tx_receipt.gasUsed
+            }
+
+        except Exception as e:
+            print(f"✗ Error anchoring certificate batch: {str(e)}")
+            return None
+
+    def get_merkle_anchor(self, root):
+        """
+        Look up an anchored Merkle root (positive results are cached forever)
+
+        Args:
+            root: Root as 32 bytes
+
+        Returns:
+            Dictionary with leafCount, timestamp and issuer if anchored, None otherwise
+        """
+        def lookup():
+            leaf_count, timestamp, issuer, exists = self.contract.functions.merkleAnchors(root).call()
+            if not exists:
+                return None
+            return {'leafCount': leaf_count, 'timestamp': timestamp, 'issuer': issuer}
+
+        anchor, _ = self._cached_lookup(('root', root.hex()), None, lookup)
+        return anchor
+
+    def verify_certificate_by_merkle_proof(self, cert_hash, proof=None):
+        """
+        Verify a certificate hash against an anchored Merkle root
+
+        Args:
+            cert_hash: Certificate hash to verify
+            proof: Optional dict with siblings (list of hex strings) and path;
+                looked up in the local proof store when omitted
+
+        Returns:
+            Dictionary with the anchoring details if verified, None otherwise
+        """
+        if not self.contract:
+            print("✗ Contract not loaded")
+            return None
+
+        try:
+            leaf_index = None
+            if proof is None:
+                if self.merkle_store is None:
+                    print("✗ Merkle proof store not enabled")
+                    return None
+                stored = self.merkle_store.get_proof(cert_hash)
+                if stored is None:
+                    print(f"✗ No inclusion proof for hash {cert_hash[:16]}...")
+                    return None
+                siblings, path, leaf_index = stored['siblings'], stored['path'], stored['leafIndex']
+            else:
+                siblings = [normalize_hash(sibling) for sibling in proof['siblings']]
+                path = int(proof['path'])
+
+            root = compute_root(cert_hash, siblings, path)
+            anchor = self.get_merkle_anchor(root)
+
+            if anchor is None:
+                print(f"✗ Merkle root 0x{root.hex()[:16]}... is not anchored")
+                return None
+
+            print("✓ Certificate verified by Merkle proof!")
+            print(f"  Root: 0x{root.hex()}")
+
+            return {
+                'exists': True,
+                'certificateHash': normalize_hash(cert_hash).hex(),
+                'merkleRoot': '0x' + root.hex(),
+                'leafIndex': leaf_index,
+                'proof': {
+                    'siblings': ['0x' + sibling.hex() for sibling in siblings],
+                    'path': path
+                },
+                'leafCount': anchor['leafCount'],
+                'timestamp': anchor['timestamp'],
+                'issuer': anchor['issuer'],
+                'verified': True
+            }
+
+        except Exception as e:
+            print(f"✗ Error verifying Merkle proof: {str(e)}")
+            return None
+
+    def has_contract_function(self, fn_name):
+        """Check whether the loaded contract ABI exposes a function"""
+        if not self.contract:
+            return False
+        return any(
+            entry.get('type') == 'function' and entry.get('name') == fn_name
+            for entry in self.contract.abi
+        )
+
+    def _rpc_batch(self, calls):
+        """
+        Send several JSON-RPC calls to the node in one HTTP round trip
+
+        Args:
+            calls: List of (method, params) tuples
+
+        Returns:
+            List of JSON-RPC response objects in the same order as calls
+        """
+        provider = self.web3.provider
+        if not isinstance(provider, (Web3.HTTPProvider, RPCPool)):
+            # In-process providers have no HTTP transport to batch over
+            return [provider.make_request(method, params) for method, params in calls]
+
+        started = time.perf_counter()
+        try:
+            if isinstance(provider, RPCPool):
+                body = provider.make_batch_request(calls)
+            else:
+                payload = [
+                    {'jsonrpc': '2.0', 'id': i, 'method': method, 'params': params}
+                    for i, (method, params) in enumerate(calls)
+                ]
+                response = self.session.post(self.provider_url, json=payload, timeout=self.request_timeout)
+                response.raise_for_status()
+                body = response.json()
+        finally:
+            metrics.observe_rpc(time.perf_counter() - started, 'batch')
+
+        replies = {reply['id']: reply for reply in body}
+        return [replies.get(i, {'error': {'message': 'Missing response'}}) for i in range(len(calls))]
+
+    def batch_call(self, fn_name, args_list, chunk_size=None, block='latest'):
+        """
+        Execute many read-only contract calls using JSON-RPC batches
+
+        Args:
+            fn_name: Name of the contract view function
+            args_list: List of argument lists, one per call
+            chunk_size: Calls per batch request (default: read_chunk_size)
+            block: Block number or tag the calls read state at
+
+        Returns:
+            List of decoded result tuples, or Exception instances for
+            calls that failed, in the same order as args_list
+        """
+        chunk_size = chunk_size or self.read_chunk_size
+        fn_abi = self.contract.get_function_by_name(fn_name).abi
+        output_types = [output['type'] for output in fn_abi['outputs']]
+        block = hex(block) if isinstance(block, int) else block
+
+        results = []
+        for start in range(0, len(args_list), chunk_size):
+            calls = [
+                ('eth_call', [{
+                    'to': self.contract_address,
+                    'data': self.contract.encodeABI(fn_name=fn_name, args=list(args))
+                }, block])
+                for args in args_list[start:start + chunk_size]
+            ]
+
+            for reply in self._rpc_batch(calls):
+                if 'error' in reply:
+                    results.append(Exception(reply['error'].get('message', 'RPC error')))
+                else:
+                    results.append(self.web3.codec.decode(output_types, HexBytes(reply['result'])))
+
+        return results
+
+    def _fetch_range_via_getter(self, start, count, block='latest'):
+        """Fetch certificates [start, start + count) with getCertificatesRange"""
+        ids, holders, types, institutions, issue_dates = \
+            self.contract.functions.getCertificatesRange(start, count).call(block_identifier=block)
+        return [
+            {
+                'certificateId': decode_certificate_id(ids[i]),
+                'holderName': holders[i],
+                'certificateType': types[i],
+                'institution': institutions[i],
+                'issueDate': issue_dates[i]
+            }
+            for i in range(len(ids))
+        ]
+
+    def _fetch_range_via_batch(self, start, count, block='latest'):
+        """Fetch certificates [start, start + count) as one JSON-RPC batch"""
+        certificates = []
+        for result in self.batch_call('getCertificateByIndex', [[i] for i in range(start, start + count)],
+                                      chunk_size=count, block=block):
+            if isinstance(result, Exception):
+                raise result
+            certificates.append({
+                'certificateId': decode_certificate_id(result[0]),
+                'holderName': result[1],
+                'certificateType': result[2],
+                'institution': result[3],
+                'issueDate': result[4]
+            })
+        return certificates
+
+    def _fetch_certificate_range(self, start, count, block='latest'):
+        """Fetch a range of certificates with the cheapest available read path"""
+        if self.has_contract_function('getCertificatesRange'):
+            return self._fetch_range_via_getter(start, count, block)
+        return self._fetch_range_via_batch(start, count, block)
+
+    def _registry_block(self):
+        """
+        Block to pin a count-then-range registry read to
+
+        The registry only grows, so on one node a range read after the count
+        always finds the counted entries. Behind an RPCPool the two reads may
+        reach endpoints at different heights, so both are pinned to one block
+        number, which the pool only sends to endpoints that have reached it.
+        """
+        if isinstance(self.web3.provider, RPCPool):
+            return self.web3.eth.block_number
+        return 'latest'
+
+    def iter_certificates(self, start=0, limit=None):
+        """
+        Lazily yield certificates from the blockchain, one chunk at a time
+
+        Only read_chunk_size certificates are held in memory at once, so
+        callers can stream the registry regardless of its size.
+
+        Args:
+            start: Index of the first certificate to yield
+            limit: Maximum number of certificates to yield (default: all)
+
+        Yields:
+            Certificate dictionaries in registry order
+        """
+        if not self.contract:
+            print("✗ Contract not loaded")
+            return
+
+        block = self._registry_block()
+        count = self.contract.functions.getCertificateCount().call(block_identifier=block)
+        end = count if limit is None else min(count, start + limit)
+
+        for chunk_start in range(start, end, self.read_chunk_size):
+            yield from self._fetch_certificate_range(
+                chunk_start, min(self.read_chunk_size, end - chunk_start), block
+            )
+
+    def get_certificates_page(self, cursor=0, limit=100):
+        """
+        Get one page of certificates for cursor-based pagination
+
+        Args:
+            cursor: Registry index to start from
+            limit: Maximum number of certificates in the page
+
+        Returns:
+            Tuple of (certificates, next_cursor, total); next_cursor is None
+            on the last page
+        """
+        if not self.contract:
+            print("✗ Contract not loaded")
+            return [], None, 0
+
+        block = self._registry_block()
+        total = self.contract.functions.getCertificateCount().call(block_identifier=block)
+        end = min(total, cursor + limit)
+        certificates = self._fetch_certificate_range(cursor, end - cursor, block) if cursor < end else []
+        next_cursor = end if end < total else None
+
+        return certificates, next_cursor, total
+
     def get_all_certificates(self):
         """
         Get all certificates from blockchain
 
+        Certificates are read in chunks of read_chunk_size, either through
+        the contract's getCertificatesRange getter or, for older deployments,
+        as batched eth_calls, so listing costs O(N / chunk) round trips.
+        Prefer iter_certificates for large registries.
+
         Returns:
             List of certificate dictionaries
         """
@@ -280,27 +1340,25 @@ class BlockchainHandler:
             return []
 
         try:
-            count = self.contract.functions.getCertificateCount().call()
-            certificates = []
-
-            for i in range(count):
-                result = self.contract.functions.getCertificateByIndex(i).call()
-                cert = {
-                    'certificateId': result[0],
-                    'holderName': result[1],
-                    'certificateType': result[2],
-                    'institution': result[3],
-                    'issueDate': result[4]
-                }
-                certificates.append(cert)
-
-            print(f"✓ Retrieved {count} certificates from blockchain")
+            certificates = list(self.iter_certificates())
+            print(f"✓ Retrieved {len(certificates)} certificates from blockchain")
             return certificates
 
         except Exception as e:
             print(f"✗ Error retrieving certificates: {str(e)}")
             return []
 
+    def is_connected(self):
+        """Connection status, re-checked against the node at most every health_check_interval seconds"""
+        now = time.monotonic()
+        if now - self._health_checked_at >= self.health_check_interval:
+            try:
+                self._connected = self.web3.is_connected()
+            except Exception:
+                self._connected = False
+            self._health_checked_at = now
+        return self._connected
+
     def get_account_balance(self, account=None):
         """Get ETH balance of an account"""
         if account is None:
@@ -310,15 +1368,29 @@ class BlockchainHandler:
         return float(balance_eth)
 
     def get_blockchain_info(self):
-        """Get general blockchain information"""
-        return {
-            'connected': self.web3.is_connected(),
-            'chainId': self.web3.eth.chain_id,
-            'latestBlock': self.web3.eth.block_number,
-            'accounts': self.web3.eth.accounts,
+        """
+        Get general blockchain information
+
+        Chain ID and accounts are cached for the handler's lifetime; the
+        block number is refreshed every block_refresh_interval seconds and
+        the default account's balance only when a new block is seen.
+        """
+        latest_block = self._current_block()
+        if self._balance_block != latest_block:
+            self._balance = self.get_account_balance()
+            self._balance_block = latest_block
+
+        info = {
+            'connected': self.is_connected(),
+            'chainId': self.chain_id,
+            'latestBlock': latest_block,
+            'accounts': self.accounts,
             'defaultAccount': self.account,
-            'balance': self.get_account_balance()
+            'balance': self._balance
         }
+        if isinstance(self.web3.provider, RPCPool):
+            info['rpcPool'] = self.web3.provider.stats()
+        return info
 
 
 # Example usage
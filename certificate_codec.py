@@ -0,0 +1,45 @@
+from merkle import normalize_hash
+
+ID_BYTES = 32
+
+
+def uses_compact_layout(contract):
+    """True if the contract keys certificates by bytes32 (CertificateVerifierV2)"""
+    for entry in contract.abi:
+        if entry.get('type') == 'function' and entry.get('name') == 'verifyCertificateById':
+            return entry['inputs'][0]['type'] == 'bytes32'
+    return False
+
+
+def encode_certificate_id(cert_id):
+    """
+    Pack a certificate ID into bytes32 (UTF-8, right-padded with zeros)
+
+    Raises:
+        ValueError: If the ID is longer than 32 bytes or ends in a NUL byte
+    """
+    raw = cert_id.encode('utf-8')
+    if len(raw) > ID_BYTES:
+        raise ValueError(f'Certificate ID must be at most {ID_BYTES} bytes')
+    if raw.endswith(b'\x00'):
+        raise ValueError('Certificate ID must not end with a NUL byte')
+    return raw.ljust(ID_BYTES, b'\x00')
+
+
+def decode_certificate_id(value):
+    """Return a certificate ID as text, whichever layout it was read from"""
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value).rstrip(b'\x00').decode('utf-8')
+    return value
+
+
+def encode_certificate_hash(cert_hash):
+    """Convert a hex certificate hash (with or without 0x) to bytes32"""
+    return normalize_hash(cert_hash)
+
+
+def decode_certificate_hash(value):
+    """Return a certificate hash as hex text, whichever layout it was read from"""
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value).hex()
+    return value
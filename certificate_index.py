@@ -0,0 +1,323 @@
+import sqlite3
+import threading
+
+from certificate_codec import decode_certificate_hash, decode_certificate_id
+from log_reader import AdaptiveLogReader
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS certificates (
+    certificate_id TEXT PRIMARY KEY,
+    certificate_hash TEXT NOT NULL,
+    holder_name TEXT NOT NULL,
+    certificate_type TEXT NOT NULL,
+    institution TEXT NOT NULL,
+    issue_date INTEGER NOT NULL,
+    timestamp INTEGER NOT NULL,
+    issuer TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    block_hash TEXT NOT NULL,
+    transaction_hash TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_certificates_hash ON certificates (certificate_hash);
+CREATE INDEX IF NOT EXISTS idx_certificates_block ON certificates (block_number);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def certificate_from_log(web3, contract, log):
+    """
+    Rebuild a full certificate record from a CertificateStored log
+
+    The event only carries the keccak hash of the (indexed) certificate ID and
+    a subset of the fields, so the remaining values are recovered by decoding
+    the storeCertificate call that emitted it. Logs emitted through another
+    contract (or by a bulk import) fall back to reading the certificate at the
+    log's block. IDs and hashes are returned as text for either contract layout.
+
+    Args:
+        web3: Web3 instance
+        contract: CertificateVerifier contract object
+        log: Decoded CertificateStored event log
+
+    Returns:
+        Dictionary with the certificate fields plus block and transaction info
+    """
+    args = log['args']
+    record = {
+        'certificateHash': decode_certificate_hash(args['certificateHash']),
+        'holderName': args['holderName'],
+        'issuer': args['issuer'],
+        'timestamp': args['timestamp'],
+        'blockNumber': log['blockNumber'],
+        'blockHash': log['blockHash'].hex(),
+        'transactionHash': log['transactionHash'].hex()
+    }
+
+    # Addressed by block, so an RPCPool asks an endpoint that has the log's block
+    tx = web3.eth.get_transaction_by_block(log['blockNumber'], log['transactionIndex'])
+    try:
+        func, params = contract.decode_function_input(tx['input'])
+    except ValueError:
+        func, params = None, {}
+
+    if func is not None and func.fn_name == 'storeCertificate' \
+            and params['_certificateHash'] == args['certificateHash']:
+        record['certificateId'] = decode_certificate_id(params['_certificateId'])
+        record['certificateType'] = params['_certificateType']
+        record['institution'] = params['_institution']
+        record['issueDate'] = params['_issueDate']
+        return record
+
+    by_hash = contract.functions.verifyCertificateByHash(args['certificateHash']).call(
+        block_identifier=log['blockNumber']
+    )
+    by_id = contract.functions.verifyCertificateById(by_hash[1]).call(
+        block_identifier=log['blockNumber']
+    )
+    record['certificateId'] = decode_certificate_id(by_hash[1])
+    record['certificateType'] = by_hash[3]
+    record['institution'] = by_hash[4]
+    record['issueDate'] = by_id[5]
+    return record
+
+
+class CertificateIndex:
+    """
+    Local SQLite index of certificates, kept in sync from CertificateStored events.
+
+    Verification reads are answered from the index instead of a live eth_call.
+    The hash of the last indexed block is recorded on every sync so chain
+    reorganisations are detected and the affected certificates re-indexed.
+    """
+
+    def __init__(self, web3, contract, db_path, start_block=0, confirmations=0, log_chunk_size=2000):
+        """
+        Open (or create) the index database
+
+        Args:
+            web3: Web3 instance
+            contract: CertificateVerifier contract object
+            db_path: Path to the SQLite database file
+            start_block: First block to scan for events (contract deployment block)
+            confirmations: Blocks to stay behind the chain head, so only
+                certificates with this many confirmations are indexed
+            log_chunk_size: Initial block range per eth_getLogs request,
+                adapted to the node's limits as the index syncs
+        """
+        self.web3 = web3
+        self.contract = contract
+        self.db_path = db_path
+        self.start_block = start_block
+        self.confirmations = confirmations
+        self.log_reader = AdaptiveLogReader(contract.events.CertificateStored, initial_chunk=log_chunk_size)
+
+        self._lock = threading.RLock()
+        self._sync_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+
+        # An index built for another deployment is useless, start over
+        if self._get_state('contract_address') != contract.address:
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM certificates")
+                self._conn.execute("DELETE FROM sync_state")
+                self._set_state('contract_address', contract.address)
+
+    def _get_state(self, key):
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_state(self, key, value):
+        self._conn.execute(
+            "INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)", (key, str(value))
+        )
+
+    @property
+    def last_block(self):
+        """Highest block number fully reflected in the index, or start_block - 1"""
+        value = self._get_state('last_block')
+        return int(value) if value is not None else self.start_block - 1
+
+    def is_synced_to(self, min_block=None):
+        """Check whether the index covers every block up to min_block"""
+        if min_block is None:
+            return True
+        return self.last_block >= min_block
+
+    def _rollback_reorg(self):
+        """
+        Detect a reorg below the last indexed block and discard orphaned data
+
+        Returns:
+            True if a reorg was detected and rolled back
+        """
+        last_block = self.last_block
+        last_hash = self._get_state('last_block_hash')
+        if last_hash is None or last_block < self.start_block:
+            return False
+
+        if self.web3.eth.get_block(last_block)['hash'].hex() == last_hash:
+            return False
+
+        # Walk back through blocks that contain certificates until the stored
+        # hash agrees with the canonical chain again
+        ancestor = self.start_block - 1
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT block_number, block_hash FROM certificates ORDER BY block_number DESC"
+            ).fetchall()
+        for block_number, block_hash in rows:
+            if self.web3.eth.get_block(block_number)['hash'].hex() == block_hash:
+                ancestor = block_number
+                break
+
+        ancestor_hash = None
+        if ancestor >= self.start_block:
+            ancestor_hash = self.web3.eth.get_block(ancestor)['hash'].hex()
+
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM certificates WHERE block_number > ?", (ancestor,))
+            self._set_state('last_block', ancestor)
+            if ancestor_hash is not None:
+                self._set_state('last_block_hash', ancestor_hash)
+            else:
+                self._conn.execute("DELETE FROM sync_state WHERE key = 'last_block_hash'")
+
+        print(f"⚠ Reorg detected, certificate index rolled back to block {ancestor}")
+        return True
+
+    def sync(self):
+        """
+        Index all CertificateStored events up to the confirmed chain head
+
+        Returns:
+            Number of certificates added to the index
+        """
+        with self._sync_lock:
+            self._rollback_reorg()
+
+            head = self.web3.eth.block_number - self.confirmations
+            added = 0
+
+            for _, to_block, logs in self.log_reader.read(self.last_block + 1, head):
+                records = [certificate_from_log(self.web3, self.contract, log) for log in logs]
+                tip_hash = self.web3.eth.get_block(to_block)['hash'].hex()
+
+                with self._lock, self._conn:
+                    self._conn.executemany(
+                        """INSERT OR REPLACE INTO certificates (
+                            certificate_id, certificate_hash, holder_name, certificate_type,
+                            institution, issue_date, timestamp, issuer,
+                            block_number, block_hash, transaction_hash
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                        [
+                            (r['certificateId'], r['certificateHash'], r['holderName'],
+                             r['certificateType'], r['institution'], r['issueDate'],
+                             r['timestamp'], r['issuer'], r['blockNumber'],
+                             r['blockHash'], r['transactionHash'])
+                            for r in records
+                        ]
+                    )
+                    self._set_state('last_block', to_block)
+                    self._set_state('last_block_hash', tip_hash)
+
+                added += len(records)
+
+            return added
+
+    def start(self, poll_interval=2.0):
+        """Keep the index in sync from a background thread"""
+        if self._thread is not None:
+            return
+
+        def run():
+            while not self._stop.wait(poll_interval):
+                try:
+                    self.sync()
+                except Exception as e:
+                    print(f"✗ Error syncing certificate index: {str(e)}")
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=run, name='certificate-index-sync', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background sync thread"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def get_by_id(self, cert_id):
+        """
+        Look up a certificate by ID
+
+        Returns:
+            Dictionary shaped like BlockchainHandler.verify_certificate_by_id
+            output if indexed, None otherwise
+        """
+        with self._lock:
+            row = self._conn.execute(
+                """SELECT certificate_hash, holder_name, certificate_type, institution,
+                          issue_date, timestamp, issuer
+                   FROM certificates WHERE certificate_id = ?""",
+                (cert_id,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return {
+            'exists': True,
+            'certificateHash': row[0],
+            'holderName': row[1],
+            'certificateType': row[2],
+            'institution': row[3],
+            'issueDate': row[4],
+            'timestamp': row[5],
+            'issuer': row[6],
+            'verified': True
+        }
+
+    def get_by_hash(self, cert_hash):
+        """
+        Look up a certificate by hash
+
+        Returns:
+            Dictionary shaped like BlockchainHandler.verify_certificate_by_hash
+            output if indexed, None otherwise
+        """
+        with self._lock:
+            row = self._conn.execute(
+                """SELECT certificate_id, holder_name, certificate_type, institution
+                   FROM certificates WHERE certificate_hash = ?
+                   ORDER BY block_number DESC, rowid DESC LIMIT 1""",
+                (cert_hash,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return {
+            'exists': True,
+            'certificateId': row[0],
+            'holderName': row[1],
+            'certificateType': row[2],
+            'institution': row[3],
+            'verified': True
+        }
+
+    def close(self):
+        """Stop syncing and close the database"""
+        self.stop()
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,283 @@
+import bisect
+import functools
+import heapq
+import itertools
+import threading
+from array import array
+
+# Sorts after any character a key can continue with, closing prefix ranges
+PREFIX_END = '\U0010ffff'
+
+
+def fold(text):
+    """Case-insensitive form of a name, as matched by prefix queries"""
+    return text.casefold()
+
+
+class CertificateSearchIndex:
+    """
+    In-memory search index over the certificate registry.
+
+    Records are kept column-wise by registry index, with certificate
+    types and institutions interned since few distinct values repeat
+    across the registry. Holder names and issue dates are additionally
+    kept as sorted (key, registry index) columns, so prefix and range
+    filters are two bisections; types and case-folded institutions map to
+    posting arrays that are already in registry order because the
+    registry only grows.
+
+    A query drives off whichever filter is cheapest to walk and checks the
+    others per record. Filters posted in registry order (type, institution,
+    or none at all) stream matches and stop once a page is full; holder and
+    issue date ranges are sorted into registry order first, which is only
+    chosen when their range is small. Results come in registry order and
+    pages resume from a cursor like /api/certificates/list.
+
+    Memory per record is about 260 bytes on 64-bit CPython 3.11, measured
+    with benchmarks/bench_search.py for 16-character IDs and 12-character
+    holder names: the ID, holder name and case-folded holder key strings
+    (about 60 bytes each), five list slots and six 4 or 8 byte array
+    entries. Types and institutions cost a pointer per record plus one
+    copy per distinct value. A million certificates take roughly 260 MB.
+
+    Queries and updates are serialized by one lock.
+    """
+
+    def __init__(self, insort_limit=64):
+        """
+        Args:
+            insort_limit: Pending records inserted one by one into the sorted
+                columns; larger batches are merged in a single pass
+        """
+        self.insort_limit = insort_limit
+
+        # Columns, by registry index
+        self._ids = []
+        self._holders = []
+        self._types = []
+        self._institutions = []
+        self._issue_dates = array('q')
+        self._interned = {}
+
+        # Sorted columns, covering records [0, self._indexed)
+        self._holder_keys = []
+        self._holder_positions = array('I')
+        self._date_keys = array('q')
+        self._date_positions = array('I')
+        self._indexed = 0
+
+        # Posting arrays in registry order
+        self._type_postings = {}
+        self._institution_postings = {}
+        self._institution_keys = []  # sorted distinct folded institutions
+
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._ids)
+
+    def _intern(self, value):
+        return self._interned.setdefault(value, value)
+
+    def add(self, start, records):
+        """
+        Append certificates read from the registry
+
+        Records the index already holds (an overlapping range) are skipped.
+        They become searchable immediately; the sorted columns are brought
+        up to date by the next flush() or search().
+
+        Args:
+            start: Registry index of the first record
+            records: Certificate dicts with certificateId, holderName,
+                certificateType, institution and issueDate
+
+        Returns:
+            Number of certificates added
+
+        Raises:
+            ValueError: If start leaves a gap after the last indexed record
+        """
+        with self._lock:
+            if start > len(self._ids):
+                raise ValueError(f"Records start at {start}, but the index only holds {len(self._ids)}")
+
+            added = 0
+            for record in itertools.islice(records, len(self._ids) - start, None):
+                position = len(self._ids)
+                cert_type = self._intern(record['certificateType'])
+                institution = self._intern(record['institution'])
+
+                self._ids.append(record['certificateId'])
+                self._holders.append(record['holderName'])
+                self._types.append(cert_type)
+                self._institutions.append(institution)
+                self._issue_dates.append(record['issueDate'])
+
+                self._type_postings.setdefault(cert_type, array('I')).append(position)
+                key = fold(institution)
+                postings = self._institution_postings.get(key)
+                if postings is None:
+                    postings = self._institution_postings[key] = array('I')
+                    bisect.insort(self._institution_keys, key)
+                postings.append(position)
+                added += 1
+
+            return added
+
+    def flush(self):
+        """Merge pending records into the sorted holder and issue date columns"""
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        pending = range(self._indexed, len(self._ids))
+        if not pending:
+            return
+
+        if len(pending) <= self.insort_limit:
+            for position in pending:
+                key = fold(self._holders[position])
+                i = bisect.bisect_right(self._holder_keys, key)
+                self._holder_keys.insert(i, key)
+                self._holder_positions.insert(i, position)
+
+                issue_date = self._issue_dates[position]
+                i = bisect.bisect_right(self._date_keys, issue_date)
+                self._date_keys.insert(i, issue_date)
+                self._date_positions.insert(i, position)
+        else:
+            # One linear merge instead of an O(n) insert per record
+            holder_keys, holder_positions = [], array('I')
+            for key, position in heapq.merge(
+                zip(self._holder_keys, self._holder_positions),
+                sorted((fold(self._holders[p]), p) for p in pending)
+            ):
+                holder_keys.append(key)
+                holder_positions.append(position)
+
+            date_keys, date_positions = array('q'), array('I')
+            for issue_date, position in heapq.merge(
+                zip(self._date_keys, self._date_positions),
+                sorted((self._issue_dates[p], p) for p in pending)
+            ):
+                date_keys.append(issue_date)
+                date_positions.append(position)
+
+            self._holder_keys, self._holder_positions = holder_keys, holder_positions
+            self._date_keys, self._date_positions = date_keys, date_positions
+
+        self._indexed = len(self._ids)
+
+    @staticmethod
+    def _ordered_from(postings, cursor):
+        return itertools.islice(postings, bisect.bisect_left(postings, cursor), None)
+
+    @staticmethod
+    def _sorted_from(positions, cursor):
+        return sorted(p for p in positions if p >= cursor)
+
+    def _record(self, position):
+        return {
+            'certificateId': self._ids[position],
+            'holderName': self._holders[position],
+            'certificateType': self._types[position],
+            'institution': self._institutions[position],
+            'issueDate': self._issue_dates[position]
+        }
+
+    def search(self, holder=None, institution=None, cert_type=None, issued_from=None, issued_to=None,
+               cursor=0, limit=100):
+        """
+        Find certificates matching all given filters, in registry order
+
+        Args:
+            holder: Case-insensitive prefix of the holder name
+            institution: Case-insensitive prefix of the institution
+            cert_type: Exact certificate type
+            issued_from: Earliest issue date (inclusive, Unix seconds)
+            issued_to: Latest issue date (inclusive, Unix seconds)
+            cursor: Registry index to resume from
+            limit: Maximum number of certificates in the page
+
+        Returns:
+            Tuple of (certificates, next_cursor); next_cursor is None on the
+            last page
+        """
+        with self._lock:
+            self._flush()
+            total = len(self._ids)
+
+            # (candidates, in registry order, walk(cursor), predicate) per filter
+            filters = []
+
+            if holder:
+                prefix = fold(holder)
+                lo = bisect.bisect_left(self._holder_keys, prefix)
+                hi = bisect.bisect_right(self._holder_keys, prefix + PREFIX_END)
+                filters.append((
+                    hi - lo, False,
+                    lambda c, lo=lo, hi=hi: self._sorted_from(self._holder_positions[lo:hi], c),
+                    lambda p, prefix=prefix, holders=self._holders: holders[p].casefold().startswith(prefix)
+                ))
+
+            if institution:
+                prefix = fold(institution)
+                lo = bisect.bisect_left(self._institution_keys, prefix)
+                hi = bisect.bisect_right(self._institution_keys, prefix + PREFIX_END)
+                postings = [self._institution_postings[key] for key in self._institution_keys[lo:hi]]
+                filters.append((
+                    sum(len(p) for p in postings), True,
+                    lambda c, postings=postings: heapq.merge(*(self._ordered_from(p, c) for p in postings)),
+                    lambda p, prefix=prefix, institutions=self._institutions:
+                        institutions[p].casefold().startswith(prefix)
+                ))
+
+            if cert_type is not None:
+                postings = self._type_postings.get(cert_type, ())
+                filters.append((
+                    len(postings), True,
+                    lambda c, postings=postings: self._ordered_from(postings, c),
+                    lambda p, types=self._types: types[p] == cert_type
+                ))
+
+            if issued_from is not None or issued_to is not None:
+                lo = 0 if issued_from is None else bisect.bisect_left(self._date_keys, issued_from)
+                hi = len(self._date_keys) if issued_to is None else bisect.bisect_right(self._date_keys, issued_to)
+                low = float('-inf') if issued_from is None else issued_from
+                high = float('inf') if issued_to is None else issued_to
+                filters.append((
+                    max(0, hi - lo), False,
+                    lambda c, lo=lo, hi=hi: self._sorted_from(self._date_positions[lo:hi], c),
+                    lambda p, dates=self._issue_dates: low <= dates[p] <= high
+                ))
+
+            if any(candidates == 0 for candidates, _, _, _ in filters):
+                return [], None
+
+            # Walking in registry order stops once the page is full: with
+            # independent filters that takes about limit / selectivity steps.
+            # Unordered ranges are read in full, so they only win when small.
+            expected = total
+            for candidates, _, _, _ in filters:
+                expected *= candidates / total
+
+            def cost(candidates, in_order):
+                if not in_order:
+                    return candidates
+                return min(candidates, (limit + 1) * candidates / max(expected, 1))
+
+            plans = [(cost(total, True), -1)] + [
+                (cost(candidates, in_order), i) for i, (candidates, in_order, _, _) in enumerate(filters)
+            ]
+            _, driver = min(plans)
+
+            positions = range(cursor, total) if driver < 0 else filters[driver][2](cursor)
+            # Most selective check first, so most records fail on the first one
+            checks = [filters[i][3] for i in sorted(range(len(filters)), key=lambda i: filters[i][0]) if i != driver]
+            if checks:
+                positions = filter(functools.reduce(lambda a, b: lambda p: a(p) and b(p), checks), positions)
+            matches = list(itertools.islice(positions, limit + 1))
+
+            next_cursor = matches[limit - 1] + 1 if len(matches) > limit else None
+            return [self._record(p) for p in matches[:limit]], next_cursor
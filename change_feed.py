@@ -0,0 +1,168 @@
+import queue
+import threading
+
+from certificate_index import certificate_from_log
+from log_reader import AdaptiveLogReader
+
+
+class Subscription:
+    """Live change feed updates for one subscriber"""
+
+    def __init__(self, position, max_queue):
+        # Last block published before this subscription started; updates
+        # in the queue start at position + 1
+        self.position = position
+        self.queue = queue.Queue(max_queue)
+        # Set when the subscriber fell behind and was dropped
+        self.closed = False
+
+    def get(self, timeout=None):
+        """Next (to_block, records) update, or None if none arrived within timeout"""
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class ChangeFeed:
+    """
+    Incremental feed of stored certificates, built from CertificateStored logs.
+
+    since() answers "certificates stored from block N on" for mirrors that
+    poll with a resume cursor, and subscribe() hands out live updates from a
+    single shared poller thread, so any number of subscribers cost one log
+    read per new block range. Both only read logs for the blocks asked
+    about, so mirroring costs scale with new certificates rather than the
+    size of the registry. Only blocks with `confirmations` confirmations are
+    published.
+    """
+
+    def __init__(self, web3, contract, start_block=0, confirmations=0, poll_interval=2.0,
+                 log_chunk_size=2000, max_queue=1000):
+        """
+        Args:
+            web3: Web3 instance
+            contract: CertificateVerifier contract object
+            start_block: Block the contract was deployed in
+            confirmations: Blocks to stay behind the chain head
+            poll_interval: Seconds between polls while there are subscribers
+            log_chunk_size: Initial block range per eth_getLogs request
+            max_queue: Updates buffered per subscriber before it is dropped
+        """
+        self.web3 = web3
+        self.contract = contract
+        self.start_block = start_block
+        self.confirmations = confirmations
+        self.poll_interval = poll_interval
+        self.max_queue = max_queue
+        self.log_reader = AdaptiveLogReader(contract.events.CertificateStored, initial_chunk=log_chunk_size)
+
+        self._lock = threading.Lock()
+        self._subscribers = set()
+        self._published = None  # last block pushed to subscribers
+        self._thread = None
+        self._stop = threading.Event()
+
+    def head(self):
+        """Newest block with enough confirmations to be published"""
+        return self.web3.eth.block_number - self.confirmations
+
+    def _records(self, logs):
+        return [certificate_from_log(self.web3, self.contract, log) for log in logs]
+
+    def since(self, from_block, limit=None, to_block=None):
+        """
+        Certificates stored from from_block onwards, oldest first
+
+        Pages always end on a block boundary, so a page may hold a few more
+        than limit certificates when the last block has several.
+
+        Args:
+            from_block: First block to include
+            limit: Stop once this many certificates were read (default: no limit)
+            to_block: Last block to include (default: the confirmed head)
+
+        Returns:
+            Tuple of (certificates, next_block, to_block); read the next page
+            with from_block=next_block
+        """
+        if to_block is None:
+            to_block = self.head()
+        from_block = max(from_block, self.start_block)
+
+        records = []
+        next_block = max(from_block, to_block + 1)
+        for _, chunk_to, logs in self.log_reader.read(from_block, to_block):
+            records.extend(self._records(logs))
+            next_block = chunk_to + 1
+            if limit is not None and len(records) >= limit:
+                last_block = records[limit - 1]['blockNumber']
+                records = [r for r in records if r['blockNumber'] <= last_block]
+                next_block = last_block + 1
+                break
+
+        return records, next_block, to_block
+
+    def subscribe(self):
+        """
+        Start receiving live updates; starts the shared poller if needed
+
+        Returns:
+            Subscription whose queue receives (to_block, certificates) updates
+            for every block range after subscription.position
+        """
+        with self._lock:
+            if self._published is None:
+                self._published = self.head()
+            subscription = Subscription(self._published, self.max_queue)
+            self._subscribers.add(subscription)
+
+            if self._thread is None:
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name='change-feed', daemon=True)
+                self._thread.start()
+
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def subscriber_count(self):
+        with self._lock:
+            return len(self._subscribers)
+
+    def _publish(self, to_block, records):
+        with self._lock:
+            self._published = to_block
+            for subscription in list(self._subscribers):
+                try:
+                    subscription.queue.put_nowait((to_block, records))
+                except queue.Full:
+                    # A stalled client must not hold back the others; it
+                    # resumes from its last checkpoint when it reconnects
+                    subscription.closed = True
+                    self._subscribers.discard(subscription)
+
+    def _run(self):
+        while not self._stop.wait(self.poll_interval):
+            with self._lock:
+                if not self._subscribers:
+                    # Nobody listening: stop, the next subscriber restarts from the head
+                    self._thread = None
+                    self._published = None
+                    return
+                from_block = self._published + 1
+
+            try:
+                for _, chunk_to, logs in self.log_reader.read(from_block, self.head()):
+                    self._publish(chunk_to, self._records(logs))
+            except Exception as e:
+                print(f"✗ Error polling change feed: {str(e)}")
+
+        with self._lock:
+            self._thread = None
+
+    def stop(self):
+        """Stop the poller thread; existing subscriptions receive no more updates"""
+        self._stop.set()
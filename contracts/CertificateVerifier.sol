@@ -25,6 +25,16 @@ contract CertificateVerifier {
     // Array to store all certificate IDs
     string[] public certificateIds;
 
+    // Merkle roots anchoring batches of certificate hashes
+    struct MerkleAnchor {
+        uint256 leafCount;
+        uint256 timestamp;
+        address issuer;
+        bool exists;
+    }
+
+    mapping(bytes32 => MerkleAnchor) public merkleAnchors;
+
     // Events
     event CertificateStored(
         string indexed certificateId,
@@ -34,6 +44,13 @@ contract CertificateVerifier {
         uint256 timestamp
     );
 
+    event MerkleRootAnchored(
+        bytes32 indexed root,
+        uint256 leafCount,
+        address indexed issuer,
+        uint256 timestamp
+    );
+
     event CertificateVerified(
         string indexed certificateId,
         address indexed verifier,
@@ -159,6 +176,41 @@ contract CertificateVerifier {
         );
     }
 
+    // Get a contiguous range of certificates in a single call
+    function getCertificatesRange(uint256 start, uint256 count)
+        public
+        view
+        returns (
+            string[] memory ids,
+            string[] memory holderNames,
+            string[] memory certificateTypes,
+            string[] memory institutions,
+            uint256[] memory issueDates
+        )
+    {
+        uint256 total = certificateIds.length;
+        if (start >= total) {
+            count = 0;
+        } else if (count > total - start) {
+            count = total - start;
+        }
+
+        ids = new string[](count);
+        holderNames = new string[](count);
+        certificateTypes = new string[](count);
+        institutions = new string[](count);
+        issueDates = new uint256[](count);
+
+        for (uint256 i = 0; i < count; i++) {
+            Certificate storage cert = certificates[certificateIds[start + i]];
+            ids[i] = cert.certificateId;
+            holderNames[i] = cert.holderName;
+            certificateTypes[i] = cert.certificateType;
+            institutions[i] = cert.institution;
+            issueDates[i] = cert.issueDate;
+        }
+    }
+
     // Check if certificate exists by ID
     function certificateExists(string memory _certificateId) public view returns (bool) {
         return certificates[_certificateId].exists;
@@ -169,4 +221,38 @@ contract CertificateVerifier {
         string memory certId = hashToCertId[_hash];
         return certificates[certId].exists;
     }
+
+    // Anchor the Merkle root of a batch of certificate hashes
+    function anchorMerkleRoot(bytes32 _root, uint256 _leafCount) public {
+        require(_root != bytes32(0), "Merkle root cannot be empty");
+        require(_leafCount > 0, "Batch cannot be empty");
+        require(!merkleAnchors[_root].exists, "Merkle root already anchored");
+
+        merkleAnchors[_root] = MerkleAnchor({
+            leafCount: _leafCount,
+            timestamp: block.timestamp,
+            issuer: msg.sender,
+            exists: true
+        });
+
+        emit MerkleRootAnchored(_root, _leafCount, msg.sender, block.timestamp);
+    }
+
+    // Verify a certificate hash against an anchored root using its inclusion proof.
+    // Bit i of _path is set when _proof[i] is the left-hand sibling.
+    function verifyMerkleInclusion(bytes32 _certificateHash, bytes32[] memory _proof, uint256 _path)
+        public
+        view
+        returns (bool anchored, bytes32 root)
+    {
+        bytes32 node = sha256(abi.encodePacked(bytes1(0x00), _certificateHash));
+        for (uint256 i = 0; i < _proof.length; i++) {
+            if ((_path >> i) & 1 == 1) {
+                node = sha256(abi.encodePacked(bytes1(0x01), _proof[i], node));
+            } else {
+                node = sha256(abi.encodePacked(bytes1(0x01), node, _proof[i]));
+            }
+        }
+        return (merkleAnchors[node].exists, node);
+    }
 }
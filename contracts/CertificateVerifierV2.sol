@@ -0,0 +1,303 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.0;
+
+// Compact layout of CertificateVerifier: certificate IDs (UTF-8, right-padded)
+// and SHA-256 hashes are bytes32 instead of strings, and the issuer, issue date
+// and timestamp share one storage slot. Function names and return shapes match
+// CertificateVerifier so clients only convert bytes32 values.
+contract CertificateVerifierV2 {
+
+    struct Certificate {
+        bytes32 certificateHash;
+        address issuer;
+        uint48 issueDate;
+        uint48 timestamp;
+        string holderName;
+        string certificateType;
+        string institution;
+    }
+
+    // One certificate copied by importCertificates
+    struct CertificateImport {
+        bytes32 certificateId;
+        bytes32 certificateHash;
+        string holderName;
+        string certificateType;
+        string institution;
+        uint48 issueDate;
+        uint48 timestamp;
+        address issuer;
+    }
+
+    address public owner;
+
+    // Mapping from certificate ID to Certificate
+    mapping(bytes32 => Certificate) private certificates;
+
+    // Mapping from hash to certificate ID
+    mapping(bytes32 => bytes32) public hashToCertId;
+
+    // Array to store all certificate IDs
+    bytes32[] public certificateIds;
+
+    // Merkle roots anchoring batches of certificate hashes
+    struct MerkleAnchor {
+        uint256 leafCount;
+        uint256 timestamp;
+        address issuer;
+        bool exists;
+    }
+
+    mapping(bytes32 => MerkleAnchor) public merkleAnchors;
+
+    // Events
+    event CertificateStored(
+        bytes32 indexed certificateId,
+        bytes32 certificateHash,
+        string holderName,
+        address indexed issuer,
+        uint256 timestamp
+    );
+
+    event MerkleRootAnchored(
+        bytes32 indexed root,
+        uint256 leafCount,
+        address indexed issuer,
+        uint256 timestamp
+    );
+
+    constructor() {
+        owner = msg.sender;
+    }
+
+    function _store(
+        bytes32 _certificateId,
+        bytes32 _certificateHash,
+        string memory _holderName,
+        string memory _certificateType,
+        string memory _institution,
+        uint48 _issueDate,
+        uint48 _timestamp,
+        address _issuer
+    ) private {
+        require(certificates[_certificateId].timestamp == 0, "Certificate already exists");
+        require(_certificateId != bytes32(0), "Certificate ID cannot be empty");
+        require(_certificateHash != bytes32(0), "Certificate hash cannot be empty");
+
+        Certificate storage cert = certificates[_certificateId];
+        cert.certificateHash = _certificateHash;
+        cert.issuer = _issuer;
+        cert.issueDate = _issueDate;
+        cert.timestamp = _timestamp;
+        cert.holderName = _holderName;
+        cert.certificateType = _certificateType;
+        cert.institution = _institution;
+
+        hashToCertId[_certificateHash] = _certificateId;
+        certificateIds.push(_certificateId);
+
+        emit CertificateStored(_certificateId, _certificateHash, _holderName, _issuer, _timestamp);
+    }
+
+    // Store a new certificate
+    function storeCertificate(
+        bytes32 _certificateId,
+        bytes32 _certificateHash,
+        string memory _holderName,
+        string memory _certificateType,
+        string memory _institution,
+        uint48 _issueDate
+    ) public {
+        _store(
+            _certificateId,
+            _certificateHash,
+            _holderName,
+            _certificateType,
+            _institution,
+            _issueDate,
+            uint48(block.timestamp),
+            msg.sender
+        );
+    }
+
+    // Copy certificates from an existing CertificateVerifier deployment,
+    // keeping their original timestamps and issuers
+    function importCertificates(CertificateImport[] calldata _certificates) public {
+        require(msg.sender == owner, "Only the owner can import certificates");
+
+        for (uint256 i = 0; i < _certificates.length; i++) {
+            CertificateImport calldata cert = _certificates[i];
+            require(cert.timestamp != 0, "Timestamp cannot be zero");
+            _store(
+                cert.certificateId,
+                cert.certificateHash,
+                cert.holderName,
+                cert.certificateType,
+                cert.institution,
+                cert.issueDate,
+                cert.timestamp,
+                cert.issuer
+            );
+        }
+    }
+
+    // Verify certificate by ID
+    function verifyCertificateById(bytes32 _certificateId)
+        public
+        view
+        returns (
+            bool exists,
+            bytes32 certificateHash,
+            string memory holderName,
+            string memory certificateType,
+            string memory institution,
+            uint256 issueDate,
+            uint256 timestamp,
+            address issuer
+        )
+    {
+        Certificate storage cert = certificates[_certificateId];
+        return (
+            cert.timestamp != 0,
+            cert.certificateHash,
+            cert.holderName,
+            cert.certificateType,
+            cert.institution,
+            cert.issueDate,
+            cert.timestamp,
+            cert.issuer
+        );
+    }
+
+    // Verify certificate by hash
+    function verifyCertificateByHash(bytes32 _hash)
+        public
+        view
+        returns (
+            bool exists,
+            bytes32 certificateId,
+            string memory holderName,
+            string memory certificateType,
+            string memory institution
+        )
+    {
+        bytes32 certId = hashToCertId[_hash];
+        Certificate storage cert = certificates[certId];
+        return (
+            cert.timestamp != 0,
+            certId,
+            cert.holderName,
+            cert.certificateType,
+            cert.institution
+        );
+    }
+
+    // Get certificate count
+    function getCertificateCount() public view returns (uint256) {
+        return certificateIds.length;
+    }
+
+    // Get certificate by index
+    function getCertificateByIndex(uint256 index)
+        public
+        view
+        returns (
+            bytes32 certificateId,
+            string memory holderName,
+            string memory certificateType,
+            string memory institution,
+            uint256 issueDate
+        )
+    {
+        require(index < certificateIds.length, "Index out of bounds");
+        bytes32 certId = certificateIds[index];
+        Certificate storage cert = certificates[certId];
+        return (
+            certId,
+            cert.holderName,
+            cert.certificateType,
+            cert.institution,
+            cert.issueDate
+        );
+    }
+
+    // Get a contiguous range of certificates in a single call
+    function getCertificatesRange(uint256 start, uint256 count)
+        public
+        view
+        returns (
+            bytes32[] memory ids,
+            string[] memory holderNames,
+            string[] memory certificateTypes,
+            string[] memory institutions,
+            uint256[] memory issueDates
+        )
+    {
+        uint256 total = certificateIds.length;
+        if (start >= total) {
+            count = 0;
+        } else if (count > total - start) {
+            count = total - start;
+        }
+
+        ids = new bytes32[](count);
+        holderNames = new string[](count);
+        certificateTypes = new string[](count);
+        institutions = new string[](count);
+        issueDates = new uint256[](count);
+
+        for (uint256 i = 0; i < count; i++) {
+            bytes32 certId = certificateIds[start + i];
+            Certificate storage cert = certificates[certId];
+            ids[i] = certId;
+            holderNames[i] = cert.holderName;
+            certificateTypes[i] = cert.certificateType;
+            institutions[i] = cert.institution;
+            issueDates[i] = cert.issueDate;
+        }
+    }
+
+    // Check if certificate exists by ID
+    function certificateExists(bytes32 _certificateId) public view returns (bool) {
+        return certificates[_certificateId].timestamp != 0;
+    }
+
+    // Check if hash exists
+    function hashExists(bytes32 _hash) public view returns (bool) {
+        return certificates[hashToCertId[_hash]].timestamp != 0;
+    }
+
+    // Anchor the Merkle root of a batch of certificate hashes
+    function anchorMerkleRoot(bytes32 _root, uint256 _leafCount) public {
+        require(_root != bytes32(0), "Merkle root cannot be empty");
+        require(_leafCount > 0, "Batch cannot be empty");
+        require(!merkleAnchors[_root].exists, "Merkle root already anchored");
+
+        merkleAnchors[_root] = MerkleAnchor({
+            leafCount: _leafCount,
+            timestamp: block.timestamp,
+            issuer: msg.sender,
+            exists: true
+        });
+
+        emit MerkleRootAnchored(_root, _leafCount, msg.sender, block.timestamp);
+    }
+
+    // Verify a certificate hash against an anchored root using its inclusion proof.
+    // Bit i of _path is set when _proof[i] is the left-hand sibling.
+    function verifyMerkleInclusion(bytes32 _certificateHash, bytes32[] memory _proof, uint256 _path)
+        public
+        view
+        returns (bool anchored, bytes32 root)
+    {
+        bytes32 node = sha256(abi.encodePacked(bytes1(0x00), _certificateHash));
+        for (uint256 i = 0; i < _proof.length; i++) {
+            if ((_path >> i) & 1 == 1) {
+                node = sha256(abi.encodePacked(bytes1(0x01), _proof[i], node));
+            } else {
+                node = sha256(abi.encodePacked(bytes1(0x01), node, _proof[i]));
+            }
+        }
+        return (merkleAnchors[node].exists, node);
+    }
+}
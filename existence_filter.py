@@ -0,0 +1,182 @@
+import hashlib
+import math
+import threading
+
+from web3 import Web3
+
+from certificate_codec import encode_certificate_hash, encode_certificate_id, uses_compact_layout
+from log_reader import AdaptiveLogReader
+
+
+class BloomFilter:
+    """
+    Scalable Bloom filter over byte strings.
+
+    When the current slice reaches its capacity a new slice twice the size
+    is added, with a tighter error rate so the overall false positive rate
+    stays below the configured one. Items can never be removed.
+    """
+
+    def __init__(self, capacity=100000, error_rate=0.001):
+        """
+        Args:
+            capacity: Items expected before the first slice is full
+            error_rate: Target false positive rate
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.count = 0
+        self._slices = []
+        self._add_slice(capacity, error_rate / 2)
+
+    def _add_slice(self, capacity, error_rate):
+        bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        hashes = max(1, int(round(bits / capacity * math.log(2))))
+        self._slices.append({
+            'capacity': capacity,
+            'errorRate': error_rate,
+            'bits': bits,
+            'hashes': hashes,
+            'count': 0,
+            'array': bytearray((bits + 7) // 8)
+        })
+
+    @staticmethod
+    def _positions(item, bits, hashes):
+        # Kirsch-Mitzenmacher double hashing from one 128-bit digest
+        digest = hashlib.blake2b(item, digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % bits for i in range(hashes)]
+
+    def add(self, item):
+        if item in self:
+            return
+
+        current = self._slices[-1]
+        if current['count'] >= current['capacity']:
+            self._add_slice(current['capacity'] * 2, current['errorRate'] / 2)
+            current = self._slices[-1]
+
+        array = current['array']
+        for pos in self._positions(item, current['bits'], current['hashes']):
+            array[pos >> 3] |= 1 << (pos & 7)
+        current['count'] += 1
+        self.count += 1
+
+    def __contains__(self, item):
+        for s in self._slices:
+            array = s['array']
+            if all(array[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item, s['bits'], s['hashes'])):
+                return True
+        return False
+
+    @property
+    def size_bytes(self):
+        return sum(len(s['array']) for s in self._slices)
+
+
+class CertificateExistenceFilter:
+    """
+    In-memory filter of every certificate ID and hash stored on chain.
+
+    Built from CertificateStored events and caught up incrementally, it
+    answers "definitely not stored" without an RPC. A positive answer only
+    means "possibly stored" and must be confirmed against the chain. IDs are
+    keyed by what the indexed event topic holds: the keccak hash of the ID
+    string, or the bytes32 ID itself for the compact contract layout.
+    """
+
+    def __init__(self, contract, start_block=0, capacity=100000, error_rate=0.001, log_chunk_size=2000):
+        """
+        Args:
+            contract: CertificateVerifier contract object
+            start_block: Block the contract was deployed in
+            capacity: Certificates expected before the filter grows
+            error_rate: Target false positive rate
+            log_chunk_size: Initial block range per eth_getLogs request
+        """
+        self.contract = contract
+        self.compact = uses_compact_layout(contract)
+        self.log_reader = AdaptiveLogReader(contract.events.CertificateStored, initial_chunk=log_chunk_size)
+        self.synced_block = start_block - 1
+
+        self._ids = BloomFilter(capacity, error_rate)
+        self._hashes = BloomFilter(capacity, error_rate)
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+
+        self.checks = 0
+        self.negatives = 0
+
+    def _id_key(self, cert_id):
+        if self.compact:
+            return encode_certificate_id(cert_id)
+        return bytes(Web3.keccak(text=cert_id))
+
+    def _hash_key(self, cert_hash):
+        if self.compact:
+            return encode_certificate_hash(cert_hash)
+        return cert_hash.encode()
+
+    def sync_to(self, block_number):
+        """
+        Add every certificate stored up to block_number
+
+        Returns:
+            Number of certificates added
+        """
+        with self._sync_lock:
+            added = 0
+
+            for _, to_block, logs in self.log_reader.read(self.synced_block + 1, block_number):
+                with self._lock:
+                    for log in logs:
+                        # Indexed strings are delivered as their keccak topic, bytes32 IDs as-is
+                        self._ids.add(bytes(log['args']['certificateId']))
+                        cert_hash = log['args']['certificateHash']
+                        self._hashes.add(bytes(cert_hash) if self.compact else cert_hash.encode())
+                    self.synced_block = to_block
+
+                added += len(logs)
+
+            return added
+
+    def add(self, cert_id, cert_hash):
+        """Record a certificate stored by this process without waiting for a sync"""
+        with self._lock:
+            self._ids.add(self._id_key(cert_id))
+            self._hashes.add(self._hash_key(cert_hash))
+
+    def might_contain_id(self, cert_id):
+        try:
+            key = self._id_key(cert_id)
+        except ValueError:
+            key = None  # Not representable on chain, so never stored
+        return self._check(self._ids, key)
+
+    def might_contain_hash(self, cert_hash):
+        try:
+            key = self._hash_key(cert_hash)
+        except ValueError:
+            key = None
+        return self._check(self._hashes, key)
+
+    def _check(self, bloom, key):
+        with self._lock:
+            found = key is not None and key in bloom
+            self.checks += 1
+            if not found:
+                self.negatives += 1
+        return found
+
+    def stats(self):
+        with self._lock:
+            return {
+                'syncedBlock': self.synced_block,
+                'ids': self._ids.count,
+                'hashes': self._hashes.count,
+                'sizeBytes': self._ids.size_bytes + self._hashes.size_bytes,
+                'checks': self.checks,
+                'definiteNegatives': self.negatives
+            }
@@ -0,0 +1,72 @@
+import threading
+
+from requests.exceptions import Timeout
+
+# Node error messages meaning an eth_getLogs request covered too much
+RANGE_ERRORS = ('query returned more than', 'block range', 'range is too', 'too many',
+                'limit exceeded', 'response size', 'query timeout', 'timed out')
+
+
+class AdaptiveLogReader:
+    """
+    Reads an event's logs over a block range in adaptively sized chunks.
+
+    The chunk size halves whenever the node rejects a request as too large
+    (result limits, range limits, timeouts) and grows again while chunks
+    come back well under target_logs, so sparse history is covered in a
+    few requests and busy stretches never exceed the node's limits. The
+    learned size is kept between calls.
+    """
+
+    def __init__(self, event, initial_chunk=2000, min_chunk=1, max_chunk=100000, target_logs=1000):
+        """
+        Args:
+            event: Contract event class, e.g. contract.events.CertificateStored
+            initial_chunk: Block range of the first request
+            min_chunk: Smallest block range tried before giving up
+            max_chunk: Largest block range ever requested
+            target_logs: Logs per request the chunk size is tuned towards
+        """
+        self.event = event
+        self.min_chunk = min_chunk
+        self.max_chunk = max_chunk
+        self.target_logs = target_logs
+        self.chunk_size = max(min_chunk, min(initial_chunk, max_chunk))
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _range_too_large(error):
+        if isinstance(error, Timeout):
+            return True
+        message = str(error).lower()
+        return any(text in message for text in RANGE_ERRORS)
+
+    def _resize(self, factor):
+        with self._lock:
+            self.chunk_size = max(self.min_chunk, min(self.max_chunk, int(self.chunk_size * factor)))
+
+    def read(self, from_block, to_block):
+        """
+        Yield (chunk_from, chunk_to, logs) covering from_block..to_block in order
+
+        Raises:
+            Exception: If a request fails for another reason, or still
+                fails at min_chunk blocks
+        """
+        while from_block <= to_block:
+            chunk_to = min(from_block + self.chunk_size - 1, to_block)
+            try:
+                logs = self.event.get_logs(fromBlock=from_block, toBlock=chunk_to)
+            except Exception as e:
+                if chunk_to > from_block and self.chunk_size > self.min_chunk and self._range_too_large(e):
+                    self._resize(0.5)
+                    continue
+                raise
+
+            if len(logs) > self.target_logs:
+                self._resize(0.5)
+            elif len(logs) < self.target_logs // 4 and chunk_to - from_block + 1 >= self.chunk_size:
+                self._resize(2)
+
+            yield from_block, chunk_to, logs
+            from_block = chunk_to + 1
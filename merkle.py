@@ -0,0 +1,173 @@
+import hashlib
+import sqlite3
+import threading
+import time
+
+
+# Domain separation keeps a leaf from ever being mistaken for an inner node
+LEAF_PREFIX = b'\x00'
+NODE_PREFIX = b'\x01'
+
+
+def normalize_hash(cert_hash):
+    """Return a certificate hash as 32 raw bytes (accepts hex with or without 0x)"""
+    if cert_hash.startswith(('0x', '0X')):
+        cert_hash = cert_hash[2:]
+    digest = bytes.fromhex(cert_hash)
+    if len(digest) != 32:
+        raise ValueError('Certificate hash must be 32 bytes')
+    return digest
+
+
+def hash_leaf(digest):
+    return hashlib.sha256(LEAF_PREFIX + digest).digest()
+
+
+def hash_node(left, right):
+    return hashlib.sha256(NODE_PREFIX + left + right).digest()
+
+
+class MerkleTree:
+    """
+    Binary SHA-256 Merkle tree over certificate hashes.
+
+    An unpaired node at the end of a level is promoted to the next level
+    unchanged rather than hashed with itself, so proofs carry one sibling
+    per level where one exists and a bitmask saying which side it is on.
+    The same construction is implemented by the contract's
+    verifyMerkleInclusion.
+    """
+
+    def __init__(self, cert_hashes):
+        """
+        Args:
+            cert_hashes: Certificate hashes (hex strings), in leaf order
+        """
+        if not cert_hashes:
+            raise ValueError('Cannot build a Merkle tree without leaves')
+
+        level = [hash_leaf(normalize_hash(h)) for h in cert_hashes]
+        self.levels = [level]
+
+        while len(level) > 1:
+            next_level = [hash_node(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+            if len(level) % 2:
+                next_level.append(level[-1])
+            level = next_level
+            self.levels.append(level)
+
+    @property
+    def leaf_count(self):
+        return len(self.levels[0])
+
+    @property
+    def root(self):
+        return self.levels[-1][0]
+
+    def proof(self, index):
+        """
+        Build the inclusion proof for the leaf at index
+
+        Returns:
+            Tuple of (siblings, path); path bit i is set when siblings[i]
+            is the left-hand node
+        """
+        siblings = []
+        path = 0
+        for level in self.levels[:-1]:
+            sibling = index ^ 1
+            if sibling < len(level):
+                if sibling < index:
+                    path |= 1 << len(siblings)
+                siblings.append(level[sibling])
+            index //= 2
+        return siblings, path
+
+
+def compute_root(cert_hash, siblings, path):
+    """Fold a leaf and its proof back up to the root it commits to"""
+    node = hash_leaf(normalize_hash(cert_hash))
+    for i, sibling in enumerate(siblings):
+        if path >> i & 1:
+            node = hash_node(sibling, node)
+        else:
+            node = hash_node(node, sibling)
+    return node
+
+
+def verify_proof(cert_hash, siblings, path, root):
+    """Check that cert_hash is included under root"""
+    return compute_root(cert_hash, siblings, path) == root
+
+
+class MerkleProofStore:
+    """
+    SQLite store of anchored batches and per-certificate inclusion proofs.
+
+    Proofs are kept off chain; only batch roots are anchored on chain.
+    Siblings are stored as one concatenated blob of 32-byte hashes.
+    """
+
+    def __init__(self, db_path):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS batches (
+                root TEXT PRIMARY KEY,
+                leaf_count INTEGER NOT NULL,
+                transaction_hash TEXT,
+                block_number INTEGER,
+                created_at INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS proofs (
+                certificate_hash TEXT NOT NULL,
+                root TEXT NOT NULL,
+                leaf_index INTEGER NOT NULL,
+                siblings BLOB NOT NULL,
+                path INTEGER NOT NULL,
+                PRIMARY KEY (certificate_hash, root)
+            );
+        """)
+
+    def save_batch(self, tree, cert_hashes, transaction_hash=None, block_number=None):
+        """Persist a batch and the inclusion proof of every leaf"""
+        root = tree.root.hex()
+        rows = []
+        for index, cert_hash in enumerate(cert_hashes):
+            siblings, path = tree.proof(index)
+            rows.append((normalize_hash(cert_hash).hex(), root, index, b''.join(siblings), path))
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO batches VALUES (?, ?, ?, ?, ?)",
+                (root, tree.leaf_count, transaction_hash, block_number, int(time.time()))
+            )
+            self._conn.executemany("INSERT OR REPLACE INTO proofs VALUES (?, ?, ?, ?, ?)", rows)
+
+    def get_proof(self, cert_hash):
+        """
+        Look up the most recent inclusion proof for a certificate hash
+
+        Returns:
+            Dict with root, leafIndex, siblings (list of bytes) and path, or None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                """SELECT p.root, p.leaf_index, p.siblings, p.path
+                   FROM proofs p JOIN batches b ON b.root = p.root
+                   WHERE p.certificate_hash = ?
+                   ORDER BY b.created_at DESC LIMIT 1""",
+                (normalize_hash(cert_hash).hex(),)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        root, leaf_index, blob, path = row
+        return {
+            'root': bytes.fromhex(root),
+            'leafIndex': leaf_index,
+            'siblings': [blob[i:i + 32] for i in range(0, len(blob), 32)],
+            'path': int(path)
+        }
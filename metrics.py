@@ -0,0 +1,394 @@
+import bisect
+import json
+import os
+import threading
+import time
+
+
+# Latency buckets in seconds, from sub-millisecond cache hits to slow RPCs
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Gas buckets for storeCertificate transactions
+GAS_BUCKETS = (50000, 100000, 150000, 200000, 250000, 300000, 400000, 500000, 750000, 1000000)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(label_names, label_values, extra=None):
+    pairs = list(zip(label_names, label_values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter with optional labels"""
+
+    type = 'counter'
+
+    def __init__(self, name, documentation, label_names=()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount=1):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def snapshot(self):
+        with self._lock:
+            return [[list(label_values), value] for label_values, value in self._values.items()]
+
+    def merge(self, values):
+        """Add values from another process's snapshot"""
+        for label_values, value in values:
+            self.inc(*label_values, amount=value)
+
+    def samples(self):
+        with self._lock:
+            values = dict(self._values)
+        for label_values, value in sorted(values.items()):
+            yield self.name + _format_labels(self.label_names, label_values), value
+
+
+class Histogram:
+    """Histogram with fixed buckets and optional labels"""
+
+    type = 'histogram'
+
+    def __init__(self, name, documentation, label_names=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}  # label values -> [bucket counts..., +Inf count, sum]
+        self._lock = threading.Lock()
+
+    def observe(self, value, *label_values):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    def time(self, *label_values):
+        """Context manager observing the duration of a block in seconds"""
+        return _Timer(self, label_values)
+
+    def snapshot(self):
+        with self._lock:
+            return [[list(label_values), list(series)] for label_values, series in self._series.items()]
+
+    def merge(self, values):
+        """Add series from another process's snapshot (same buckets)"""
+        with self._lock:
+            for label_values, other in values:
+                series = self._series.setdefault(tuple(label_values), [0] * (len(self.buckets) + 2))
+                for i, value in enumerate(other):
+                    series[i] += value
+
+    def samples(self):
+        with self._lock:
+            series_items = [(labels, list(series)) for labels, series in self._series.items()]
+
+        for label_values, series in sorted(series_items):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), series[:-1]):
+                cumulative += count
+                yield (
+                    self.name + '_bucket'
+                    + _format_labels(self.label_names, label_values, ('le', _format_value(float(bound)))),
+                    cumulative
+                )
+            yield self.name + '_sum' + _format_labels(self.label_names, label_values), series[-1]
+            yield self.name + '_count' + _format_labels(self.label_names, label_values), cumulative
+
+
+class _Timer:
+    def __init__(self, histogram, label_values):
+        self.histogram = histogram
+        self.label_values = label_values
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.histogram.observe(time.perf_counter() - self.started, *self.label_values)
+
+
+class MetricsRegistry:
+    """
+    Collection of metrics rendered in the Prometheus text exposition format.
+
+    Besides counters and histograms, collectors can be registered to report
+    values that are owned elsewhere (e.g. cache statistics) at scrape time.
+
+    Metrics live in the process that records them. With several worker
+    processes behind one address, enable_multiprocess makes every worker
+    write its metrics to a shared directory, so whichever worker answers a
+    scrape renders the totals of all of them.
+    """
+
+    def __init__(self):
+        self._metrics = {}
+        self._collectors = []
+        self._lock = threading.Lock()
+        self._directory = None
+        self._live_seconds = None
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name, documentation, label_names=()):
+        return self._register(Counter(name, documentation, label_names))
+
+    def histogram(self, name, documentation, label_names=(), buckets=LATENCY_BUCKETS):
+        return self._register(Histogram(name, documentation, label_names, buckets))
+
+    def register_collector(self, collector):
+        """
+        Register a callable returning a list of (name, type, help, value) tuples
+        """
+        with self._lock:
+            self._collectors.append(collector)
+
+    def enable_multiprocess(self, directory, flush_interval=1.0):
+        """
+        Share this process's metrics with sibling processes through a directory
+
+        The process writes a snapshot of its metrics to the directory every
+        flush_interval seconds and whenever it renders. Rendering sums the
+        counters and histograms of every snapshot, including those of
+        processes that have exited, so totals never go backwards when a
+        worker is replaced. Collector values belong to live objects, so they
+        are reported per process with a worker label, for processes that
+        wrote a snapshot recently. Call it after fork, in each worker.
+
+        Args:
+            directory: Directory shared by the worker processes, cleared with
+                clear_multiprocess_directory before they start
+            flush_interval: Seconds between snapshots
+        """
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._live_seconds = max(10.0, 5 * flush_interval)
+        threading.Thread(target=self._flush_loop, args=(flush_interval,), name='metrics-flush', daemon=True).start()
+
+    def _collect(self, collectors):
+        collected = []
+        for collector in collectors:
+            try:
+                collected.extend(collector())
+            except Exception as e:
+                print(f"✗ Error collecting metrics: {str(e)}")
+        return collected
+
+    def _write_snapshot(self):
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+
+        snapshot = {
+            'metrics': {metric.name: metric.snapshot() for metric in metrics},
+            'collected': self._collect(collectors)
+        }
+        path = os.path.join(self._directory, f'metrics-{os.getpid()}.json')
+        with open(path + '.tmp', 'w') as f:
+            json.dump(snapshot, f)
+        os.replace(path + '.tmp', path)
+
+    def _flush_loop(self, flush_interval):
+        while True:
+            time.sleep(flush_interval)
+            try:
+                self._write_snapshot()
+            except Exception as e:
+                print(f"✗ Error writing metrics snapshot: {str(e)}")
+
+    def _read_snapshots(self):
+        """Yield (pid, live, snapshot) for every process that wrote to the directory"""
+        now = time.time()
+        for name in os.listdir(self._directory):
+            if not (name.startswith('metrics-') and name.endswith('.json')):
+                continue
+            path = os.path.join(self._directory, name)
+            try:
+                live = now - os.path.getmtime(path) <= self._live_seconds
+                with open(path, 'r') as f:
+                    snapshot = json.load(f)
+            except (OSError, ValueError):
+                # Removed or replaced while listing
+                continue
+            yield name[len('metrics-'):-len('.json')], live, snapshot
+
+    @staticmethod
+    def _render_lines(metrics, collected):
+        """
+        Args:
+            metrics: Counter and Histogram objects
+            collected: (name, type, help, value, worker) tuples; worker is
+                None in single-process mode
+        """
+        lines = []
+        for metric in metrics:
+            lines.append(f'# HELP {metric.name} {metric.documentation}')
+            lines.append(f'# TYPE {metric.name} {metric.type}')
+            for sample_name, value in metric.samples():
+                lines.append(f'{sample_name} {_format_value(value)}')
+
+        described = set()
+        for name, metric_type, documentation, value, worker in collected:
+            if name not in described:
+                described.add(name)
+                lines.append(f'# HELP {name} {documentation}')
+                lines.append(f'# TYPE {name} {metric_type}')
+            labels = _format_labels(('worker',), (worker,)) if worker is not None else ''
+            lines.append(f'{name}{labels} {_format_value(value)}')
+
+        return '\n'.join(lines) + '\n'
+
+    def render(self):
+        """Render every metric in the Prometheus text format"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+
+        if self._directory is None:
+            collected = [sample + (None,) for sample in self._collect(collectors)]
+            return self._render_lines(metrics, collected)
+
+        self._write_snapshot()
+        merged = {
+            metric.name: (Histogram(metric.name, metric.documentation, metric.label_names, metric.buckets)
+                          if isinstance(metric, Histogram)
+                          else Counter(metric.name, metric.documentation, metric.label_names))
+            for metric in metrics
+        }
+        collected = []
+        for worker, live, snapshot in sorted(self._read_snapshots()):
+            for name, values in snapshot['metrics'].items():
+                if name in merged:
+                    merged[name].merge(values)
+            if live:
+                collected.extend(tuple(sample) + (worker,) for sample in snapshot['collected'])
+
+        # Group each collected metric's per-worker samples under one HELP/TYPE
+        collected.sort(key=lambda sample: sample[0])
+        return self._render_lines(merged.values(), collected)
+
+
+def clear_multiprocess_directory(directory):
+    """Remove snapshots left by an earlier server run, before workers start"""
+    os.makedirs(directory, exist_ok=True)
+    for name in os.listdir(directory):
+        if name.startswith('metrics-'):
+            os.remove(os.path.join(directory, name))
+
+
+# Process-wide registry shared by the API and the blockchain handler
+registry = MetricsRegistry()
+
+rpc_duration = registry.histogram(
+    'rpc_request_duration_seconds',
+    'Latency of JSON-RPC requests to the Ethereum node',
+    ('method',)
+)
+rpc_errors = registry.counter(
+    'rpc_request_errors_total',
+    'JSON-RPC requests that raised or returned an error',
+    ('method',)
+)
+http_duration = registry.histogram(
+    'http_request_duration_seconds',
+    'Latency of API requests by route',
+    ('endpoint', 'method', 'status')
+)
+store_gas_used = registry.histogram(
+    'certificate_store_gas_used',
+    'Gas used by mined storeCertificate transactions',
+    buckets=GAS_BUCKETS
+)
+slow_requests = registry.counter(
+    'http_slow_requests_total',
+    'API requests slower than the slow request threshold',
+    ('endpoint',)
+)
+
+# RPCs made by the current thread while its request is being profiled
+_rpc_trace = threading.local()
+
+
+def start_rpc_trace():
+    """Start recording (method, seconds) of every RPC made by this thread"""
+    _rpc_trace.calls = []
+
+
+def stop_rpc_trace():
+    """Stop recording and return this thread's RPCs since start_rpc_trace"""
+    calls = getattr(_rpc_trace, 'calls', None)
+    _rpc_trace.calls = None
+    return calls or []
+
+
+def observe_rpc(seconds, method):
+    """Record an RPC's latency, and add it to the thread's trace if one is running"""
+    rpc_duration.observe(seconds, method)
+    calls = getattr(_rpc_trace, 'calls', None)
+    if calls is not None:
+        calls.append((method, seconds))
+
+
+def rpc_metrics_middleware(make_request, w3):
+    """Web3 middleware recording count and latency of every RPC method"""
+    def middleware(method, params):
+        started = time.perf_counter()
+        try:
+            response = make_request(method, params)
+        except Exception:
+            rpc_errors.inc(method)
+            raise
+        finally:
+            observe_rpc(time.perf_counter() - started, method)
+        if 'error' in response:
+            rpc_errors.inc(method)
+        return response
+    return middleware
+
+
+async def async_rpc_metrics_middleware(make_request, w3):
+    """AsyncWeb3 counterpart of rpc_metrics_middleware"""
+    async def middleware(method, params):
+        started = time.perf_counter()
+        try:
+            response = await make_request(method, params)
+        except Exception:
+            rpc_errors.inc(method)
+            raise
+        finally:
+            rpc_duration.observe(time.perf_counter() - started, method)
+        if 'error' in response:
+            rpc_errors.inc(method)
+        return response
+    return middleware
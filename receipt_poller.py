@@ -0,0 +1,251 @@
+import threading
+import time
+from collections import OrderedDict
+
+from web3._utils.method_formatters import receipt_formatter
+from web3.datastructures import AttributeDict
+from web3.exceptions import TimeExhausted, TransactionNotFound
+
+
+class ReceiptPoller:
+    """
+    Tracks submitted transactions from a single background polling thread.
+
+    Callers register a transaction hash and get back immediately; one loop
+    polls receipts for every pending transaction and records whether it was
+    mined or failed, so request threads never block on mining. Given a
+    JSON-RPC batch function, each round asks for all pending receipts in
+    batch_size calls per round trip.
+
+    Completed jobs beyond max_finished are forgotten oldest first, except
+    while a wait() caller is blocked on them or their receipt has not been
+    collected by wait_for_receipt yet.
+    """
+
+    def __init__(self, web3, poll_interval=0.5, max_finished=10000, rpc_batch=None, batch_size=100):
+        """
+        Args:
+            web3: Web3 instance
+            poll_interval: Seconds between receipt polling rounds
+            max_finished: Number of completed jobs kept for status queries
+            rpc_batch: Optional callable taking a list of (method, params)
+                tuples and returning the JSON-RPC responses in order
+            batch_size: Receipt lookups per batch
+        """
+        self.web3 = web3
+        self.poll_interval = poll_interval
+        self.max_finished = max_finished
+        self.rpc_batch = rpc_batch
+        self.batch_size = batch_size
+
+        self._jobs = OrderedDict()  # tx hash -> job dict
+        self._callbacks = {}  # tx hash -> callable(job, receipt)
+        self._pending = set()
+        self._receipts = {}  # tx hash -> receipt, for wait_for_receipt callers
+        self._keep_receipts = set()
+        self._waiting = {}  # tx hash -> number of blocked wait() callers
+        self._finished = 0
+        self._cond = threading.Condition()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    @staticmethod
+    def _key(tx_hash):
+        if isinstance(tx_hash, str):
+            return tx_hash.lower() if tx_hash.startswith('0x') else '0x' + tx_hash.lower()
+        return '0x' + bytes(tx_hash).hex()
+
+    def track(self, tx_hash, metadata=None, on_mined=None, keep_receipt=False):
+        """
+        Start tracking a submitted transaction
+
+        Args:
+            tx_hash: Transaction hash (bytes or hex string)
+            metadata: Extra fields to report with the job status
+            on_mined: Optional callback(job, receipt) run once it is mined
+            keep_receipt: Hold on to the receipt for wait_for_receipt
+
+        Returns:
+            Snapshot of the job status dict
+        """
+        key = self._key(tx_hash)
+        job = {
+            'transactionHash': key,
+            'status': 'pending',
+            'blockNumber': None,
+            'gasUsed': None,
+            'submittedAt': int(time.time()),
+            'completedAt': None,
+            'error': None,
+            **(metadata or {})
+        }
+
+        with self._cond:
+            self._jobs[key] = job
+            self._pending.add(key)
+            if on_mined is not None:
+                self._callbacks[key] = on_mined
+            if keep_receipt:
+                self._keep_receipts.add(key)
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='receipt-poller', daemon=True)
+                self._thread.start()
+
+            snapshot = dict(job)
+
+        # Poll right away instead of at the next interval
+        self._wakeup.set()
+        return snapshot
+
+    def get(self, tx_hash):
+        """Return a snapshot of a tracked job, or None if unknown"""
+        with self._cond:
+            job = self._jobs.get(self._key(tx_hash))
+            return dict(job) if job is not None else None
+
+    def wait(self, tx_hash, timeout=120):
+        """
+        Block until a tracked transaction is mined or fails
+
+        Returns:
+            Final job status dict, or None if it is unknown or timed out
+        """
+        key = self._key(tx_hash)
+        with self._cond:
+            self._waiting[key] = self._waiting.get(key, 0) + 1
+            try:
+                finished = self._cond.wait_for(
+                    lambda: key not in self._pending,
+                    timeout=timeout
+                )
+            finally:
+                self._waiting[key] -= 1
+                if not self._waiting[key]:
+                    del self._waiting[key]
+            job = self._jobs.get(key)
+            if not finished or job is None:
+                return None
+            return dict(job)
+
+    def wait_for_receipt(self, tx_hash, timeout=120):
+        """
+        Track a transaction and block until its receipt arrives
+
+        Drop-in replacement for web3's wait_for_transaction_receipt that
+        shares the polling loop with every other pending transaction.
+
+        Returns:
+            Transaction receipt
+
+        Raises:
+            TimeExhausted: If no receipt arrives within timeout seconds
+        """
+        key = self._key(tx_hash)
+        self.track(tx_hash, keep_receipt=True)
+        job = self.wait(tx_hash, timeout=timeout)
+
+        with self._cond:
+            receipt = self._receipts.pop(key, None)
+            if job is None:
+                self._keep_receipts.discard(key)
+
+        if job is None:
+            raise TimeExhausted(f"Transaction {key} is not in the chain after {timeout} seconds")
+        if receipt is None:
+            raise Exception(job['error'] or 'Transaction failed')
+        return receipt
+
+    def _complete(self, key, receipt=None, error=None):
+        with self._cond:
+            job = self._jobs.get(key)
+            if job is None:
+                return None, None
+
+            if receipt is not None:
+                job['status'] = 'mined' if receipt.status == 1 else 'failed'
+                job['blockNumber'] = receipt.blockNumber
+                job['gasUsed'] = receipt.gasUsed
+                if receipt.status != 1:
+                    job['error'] = 'Transaction reverted'
+            else:
+                job['status'] = 'failed'
+                job['error'] = error
+
+            job['completedAt'] = int(time.time())
+            self._pending.discard(key)
+            if key in self._keep_receipts:
+                self._keep_receipts.discard(key)
+                if receipt is not None:
+                    self._receipts[key] = receipt
+            callback = self._callbacks.pop(key, None)
+
+            # Drop the oldest completed jobs once the history is full, but
+            # never one that a waiter has yet to read
+            self._finished += 1
+            if self._finished > self.max_finished:
+                for old_key in list(self._jobs):
+                    if self._finished <= self.max_finished:
+                        break
+                    if old_key not in self._pending and old_key not in self._waiting and \
+                            old_key not in self._receipts:
+                        del self._jobs[old_key]
+                        self._finished -= 1
+
+            self._cond.notify_all()
+            return dict(job), callback
+
+    def _fetch_receipts(self, keys):
+        """
+        Look up receipts for pending transactions
+
+        Returns:
+            Dict of tx hash -> receipt, or the Exception raised for it, for
+            every transaction that is mined or could not be looked up
+        """
+        found = {}
+        if self.rpc_batch is None:
+            for key in keys:
+                try:
+                    found[key] = self.web3.eth.get_transaction_receipt(key)
+                except TransactionNotFound:
+                    pass
+                except Exception as e:
+                    found[key] = e
+            return found
+
+        for start in range(0, len(keys), self.batch_size):
+            chunk = keys[start:start + self.batch_size]
+            try:
+                replies = self.rpc_batch([('eth_getTransactionReceipt', [key]) for key in chunk])
+            except Exception as e:
+                found.update((key, e) for key in chunk)
+                continue
+
+            for key, reply in zip(chunk, replies):
+                if 'error' in reply:
+                    found[key] = Exception(reply['error'].get('message', 'RPC error'))
+                elif reply.get('result') is not None:
+                    # Same shape as web3.eth.get_transaction_receipt returns
+                    found[key] = AttributeDict.recursive(receipt_formatter(reply['result']))
+        return found
+
+    def _run(self):
+        while True:
+            self._wakeup.clear()
+            with self._cond:
+                pending = list(self._pending)
+
+            for key, receipt in self._fetch_receipts(pending).items():
+                if isinstance(receipt, Exception):
+                    print(f"✗ Error polling receipt for {key}: {str(receipt)}")
+                    continue
+
+                job, callback = self._complete(key, receipt=receipt)
+                if callback is not None and job is not None:
+                    try:
+                        callback(job, receipt)
+                    except Exception as e:
+                        print(f"✗ Error in receipt callback for {key}: {str(e)}")
+
+            self._wakeup.wait(self.poll_interval)
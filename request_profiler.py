@@ -0,0 +1,177 @@
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+
+import metrics
+
+
+def collapse_stack(frame):
+    """Render a frame and its callers as a root-first 'a;b;c' collapsed stack"""
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ';'.join(reversed(names))
+
+
+class RequestProfile:
+    """Samples and RPC timings collected for one request"""
+
+    def __init__(self, name, selected):
+        self.name = name
+        self.selected = selected
+        self.started = time.perf_counter()
+        self.started_at = time.time()
+        self.stacks = Counter()
+        self.samples = 0
+
+
+class RequestProfiler:
+    """
+    Low-overhead sampling profiler for API requests.
+
+    A single sampler thread reads the stacks of the threads serving
+    requests from sys._current_frames() every `interval` seconds. Selected
+    requests (a `sample_rate` fraction, or ones carrying the profiling
+    header) are sampled from the start; every other request is only sampled
+    once it has run for `arm_after` seconds, so slow requests are caught in
+    the act while fast ones cost a dictionary insert. Requests slower than
+    `slow_threshold`, and all selected ones, are kept with their stacks and
+    RPC timings in a ring buffer of `capacity` entries.
+
+    The buffer is per process: under a prefork server each worker keeps
+    its own.
+    """
+
+    def __init__(self, sample_rate=0.0, slow_threshold=1.0, interval=0.005, capacity=100, arm_after=None):
+        """
+        Args:
+            sample_rate: Fraction of requests profiled from the start (0 to 1)
+            slow_threshold: Seconds after which a request is captured as slow
+            interval: Seconds between stack samples
+            capacity: Captured requests kept, oldest dropped first
+            arm_after: Seconds after which unselected requests are sampled
+                (default: half of slow_threshold)
+        """
+        self.sample_rate = sample_rate
+        self.slow_threshold = slow_threshold
+        self.interval = interval
+        self.arm_after = slow_threshold / 2 if arm_after is None else arm_after
+
+        self._active = {}  # thread id -> RequestProfile
+        self._captures = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._counter = 0
+
+    def _should_select(self):
+        # Deterministic spacing instead of random(): exactly the configured share
+        if self.sample_rate <= 0:
+            return False
+        with self._lock:
+            self._counter += 1
+            return int(self._counter * self.sample_rate) != int((self._counter - 1) * self.sample_rate)
+
+    def begin(self, name, force=False):
+        """
+        Start tracking the request served by the calling thread
+
+        Args:
+            name: Label for the request, e.g. 'GET /api/certificates/id/<path:cert_id>'
+            force: Profile from the start regardless of sample_rate
+        """
+        profile = RequestProfile(name, force or self._should_select())
+        metrics.start_rpc_trace()
+        with self._lock:
+            self._active[threading.get_ident()] = profile
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='request-profiler', daemon=True)
+                self._thread.start()
+        self._wakeup.set()
+        return profile
+
+    def end(self, profile, status):
+        """
+        Stop tracking the calling thread's request and keep it if slow or selected
+
+        Returns:
+            The capture dict if the request was kept, None otherwise
+        """
+        duration = time.perf_counter() - profile.started
+        rpc_calls = metrics.stop_rpc_trace()
+        with self._lock:
+            self._active.pop(threading.get_ident(), None)
+
+        slow = duration >= self.slow_threshold
+        if slow:
+            metrics.slow_requests.inc(profile.name)
+        if not (slow or profile.selected):
+            return None
+
+        capture = {
+            'request': profile.name,
+            'status': status,
+            'startedAt': profile.started_at,
+            'durationMs': round(duration * 1000, 3),
+            'slow': slow,
+            'selected': profile.selected,
+            'pid': os.getpid(),
+            'samples': profile.samples,
+            'sampleIntervalMs': self.interval * 1000,
+            'rpcCalls': [{'method': method, 'durationMs': round(seconds * 1000, 3)} for method, seconds in rpc_calls],
+            'rpcTotalMs': round(sum(seconds for _, seconds in rpc_calls) * 1000, 3),
+            'stacks': dict(profile.stacks.most_common())
+        }
+        with self._lock:
+            self._captures.append(capture)
+        return capture
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while True:
+            with self._lock:
+                idle = not self._active
+            if idle:
+                # Nothing in flight: sleep until the next request begins
+                self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+
+            time.sleep(self.interval)
+            now = time.perf_counter()
+            frames = sys._current_frames()
+            with self._lock:
+                for thread_id, profile in self._active.items():
+                    if thread_id == own_id:
+                        continue
+                    if not profile.selected and now - profile.started < self.arm_after:
+                        continue
+                    frame = frames.get(thread_id)
+                    if frame is not None:
+                        profile.stacks[collapse_stack(frame)] += 1
+                        profile.samples += 1
+            del frames
+
+    def captures(self):
+        """Captured requests, oldest first"""
+        with self._lock:
+            return list(self._captures)
+
+    def collapsed_stacks(self):
+        """
+        All captured samples as collapsed stacks ('frame;frame;frame count'
+        lines), rooted at the request name, ready for flamegraph.pl or speedscope
+        """
+        totals = Counter()
+        for capture in self.captures():
+            for stack, count in capture['stacks'].items():
+                totals[f"{capture['request']};{stack}"] += count
+        return ''.join(f"{stack} {count}\n" for stack, count in totals.most_common())
+
+    def clear(self):
+        with self._lock:
+            self._captures.clear()
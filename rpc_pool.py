@@ -0,0 +1,402 @@
+import json
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import requests
+from web3.providers import JSONBaseProvider
+
+# Methods that only read chain state, so any in-sync replica may answer them.
+# Everything else (transactions, eth_accounts, pending nonces, filters) goes
+# to the primary, which holds the sending accounts. Transactions looked up by
+# hash may still be pending, and only the primary has seen those.
+READ_METHODS = frozenset({
+    'eth_call', 'eth_getLogs', 'eth_blockNumber', 'eth_chainId', 'net_version', 'web3_clientVersion',
+    'eth_getBlockByNumber', 'eth_getBlockByHash', 'eth_getTransactionReceipt',
+    'eth_getTransactionByBlockNumberAndIndex', 'eth_getBalance', 'eth_getCode', 'eth_getStorageAt'
+})
+
+# Position of the block parameter of reads addressed by block number
+BLOCK_PARAMS = {
+    'eth_getBlockByNumber': 0, 'eth_getTransactionByBlockNumberAndIndex': 0,
+    'eth_call': 1, 'eth_getBalance': 1, 'eth_getCode': 1, 'eth_getStorageAt': 2
+}
+
+
+class EndpointUnavailable(Exception):
+    """An endpoint failed to return a JSON-RPC reply (connection error, timeout, HTTP error)"""
+
+
+class Endpoint:
+    """One RPC endpoint with a latency estimate and a circuit breaker"""
+
+    def __init__(self, url, failure_threshold=3, reset_timeout=10.0):
+        self.url = url
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.latency = None  # moving average of successful request latency, seconds
+        self.in_flight = 0
+        self.head = None  # latest block number seen by the health probe
+        self.requests = 0
+        self.failures = 0
+        self._consecutive_failures = 0
+        self._opened_at = None  # monotonic time the breaker opened, None while closed
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self._opened_at is None:
+            return 'closed'
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return 'half-open'
+        return 'open'
+
+    @property
+    def closed(self):
+        return self._opened_at is None
+
+    def started(self):
+        with self._lock:
+            self.in_flight += 1
+            self.requests += 1
+
+    def succeeded(self, seconds):
+        with self._lock:
+            self.in_flight -= 1
+            self.latency = seconds if self.latency is None else 0.8 * self.latency + 0.2 * seconds
+            self._consecutive_failures = 0
+            self._opened_at = None
+
+    def failed(self):
+        with self._lock:
+            self.in_flight -= 1
+            self.failures += 1
+            self._consecutive_failures += 1
+            # A failed trial while half-open re-opens the breaker for another reset_timeout
+            if self._consecutive_failures >= self.failure_threshold or self._opened_at is not None:
+                self._opened_at = time.monotonic()
+
+    def score(self):
+        """Lower is better: expected latency scaled by current load (unmeasured endpoints go first)"""
+        return (self.latency or 0.0) * (self.in_flight + 1)
+
+
+class RPCPool(JSONBaseProvider):
+    """
+    Web3 provider spreading JSON-RPC traffic over several node endpoints.
+
+    Reads (READ_METHODS) go to the better of two randomly picked healthy
+    endpoints, scored by latency and in-flight requests. A read still
+    unanswered after the pool's recent p95 latency is hedged: the same
+    request goes to a second endpoint and the first reply wins, within a
+    budget of max_hedge_ratio of all reads. Endpoints whose transport fails
+    failure_threshold times in a row are taken out by a circuit breaker.
+    A background probe retries them after reset_timeout, and also takes out
+    endpoints that lag more than max_block_lag blocks behind the others.
+    Reads fail over to the next endpoint on transport errors; JSON-RPC
+    error replies (e.g. reverts) are answers, not failures.
+
+    Reads addressed by block number (eth_getLogs up to a block, blocks,
+    transactions by block and index, state at a block) only go to endpoints
+    known to have reached that block. A caller that took the head from one
+    endpoint, or follows up on logs, then never hits a lagging one that has
+    not seen the block yet. Open-ended log ranges ('latest') go to the primary.
+
+    Writes and account-bound calls always go to the first (primary) endpoint,
+    since it holds the sending accounts and their nonces. All endpoints must
+    serve the same chain.
+    """
+
+    def __init__(self, endpoint_urls, session=None, request_timeout=30, hedge_quantile=0.95,
+                 min_hedge_delay=0.005, max_hedge_ratio=0.1, failure_threshold=3, reset_timeout=10.0,
+                 probe_interval=2.0, probe_timeout=2.0, max_block_lag=2, latency_window=500, workers=64):
+        """
+        Args:
+            endpoint_urls: Node URLs; the first is the primary
+            session: requests.Session to send through (default: a new one)
+            request_timeout: Seconds before a request to one endpoint times out
+            hedge_quantile: Latency quantile after which reads are hedged
+            min_hedge_delay: Never hedge reads sooner than this many seconds
+            max_hedge_ratio: Largest share of reads that may be hedged, 0 disables hedging
+            failure_threshold: Consecutive failures that open an endpoint's breaker
+            reset_timeout: Seconds an open breaker waits before a probe retries it
+            probe_interval: Seconds between health probes of every endpoint
+            probe_timeout: Seconds before a health probe times out
+            max_block_lag: Blocks an endpoint may trail the others and still serve reads
+            latency_window: Recent read latencies the hedge delay is computed from
+            workers: Threads sending requests (bounds concurrent reads in flight)
+        """
+        super().__init__()
+        if not endpoint_urls:
+            raise ValueError('At least one RPC endpoint is required')
+
+        self.endpoints = [Endpoint(url, failure_threshold, reset_timeout) for url in endpoint_urls]
+        self.primary = self.endpoints[0]
+        self.session = session or requests.Session()
+        self.request_timeout = request_timeout
+        self.hedge_quantile = hedge_quantile
+        self.min_hedge_delay = min_hedge_delay
+        self.max_hedge_ratio = max_hedge_ratio
+        self.probe_interval = probe_interval
+        self.probe_timeout = probe_timeout
+        self.max_block_lag = max_block_lag
+
+        self._latencies = deque(maxlen=latency_window)
+        self._hedge_delay = None
+        self._stats_lock = threading.Lock()
+        self.reads = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.failovers = 0
+
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='rpc-pool')
+        self._stop = threading.Event()
+        self._probe_thread = threading.Thread(target=self._probe_loop, name='rpc-pool-probe', daemon=True)
+        self._probe_thread.start()
+
+    def __str__(self):
+        return f"RPC pool of {len(self.endpoints)} endpoints (primary {self.primary.url})"
+
+    def _post(self, endpoint, data, timeout=None):
+        """Send an encoded request to one endpoint and decode its reply"""
+        endpoint.started()
+        started = time.perf_counter()
+        try:
+            response = self.session.post(
+                endpoint.url,
+                data=data,
+                headers={'Content-Type': 'application/json'},
+                timeout=timeout or self.request_timeout
+            )
+            response.raise_for_status()
+            reply = self.decode_rpc_response(response.content)
+        except (requests.RequestException, ValueError) as e:
+            endpoint.failed()
+            raise EndpointUnavailable(f"{endpoint.url}: {e}") from e
+        endpoint.succeeded(time.perf_counter() - started)
+        return reply
+
+    def _serving(self, endpoint, best_head, min_head=None):
+        if not endpoint.closed:
+            return False
+        if min_head is not None:
+            # Heads only move forward, so a probed head is a safe lower bound
+            return endpoint.head is not None and endpoint.head >= min_head
+        return best_head is None or endpoint.head is None or best_head - endpoint.head <= self.max_block_lag
+
+    def _choose(self, exclude=(), min_head=None):
+        """
+        Power of two choices among healthy endpoints not yet tried; None if there are none
+
+        With min_head, only endpoints known to have reached that block qualify.
+        """
+        heads = [e.head for e in self.endpoints if e.closed and e.head is not None]
+        best_head = max(heads) if heads else None
+        candidates = [e for e in self.endpoints if e not in exclude and self._serving(e, best_head, min_head)]
+        if len(candidates) <= 1:
+            return candidates[0] if candidates else None
+        a, b = random.sample(candidates, 2)
+        return a if a.score() <= b.score() else b
+
+    def _observe_read(self, seconds):
+        with self._stats_lock:
+            self._latencies.append(seconds)
+            # Re-derive the quantile every few dozen reads rather than on each one
+            if len(self._latencies) >= 20 and (self._hedge_delay is None or self.reads % 50 == 0):
+                ordered = sorted(self._latencies)
+                quantile = ordered[min(len(ordered) - 1, int(len(ordered) * self.hedge_quantile))]
+                self._hedge_delay = max(self.min_hedge_delay, quantile)
+
+    def _take_hedge(self):
+        with self._stats_lock:
+            if self.max_hedge_ratio <= 0 or self._hedge_delay is None:
+                return False
+            if self.hedges + 1 > self.max_hedge_ratio * self.reads + 1:
+                return False
+            self.hedges += 1
+            return True
+
+    def _probe_head(self, min_head):
+        """Probe endpoints' heads now until one has reached min_head; returns it or None"""
+        data = self.encode_rpc_request('eth_blockNumber', [])
+        for endpoint in sorted((e for e in self.endpoints if e.closed), key=Endpoint.score):
+            try:
+                endpoint.head = max(endpoint.head or 0, int(self._post(endpoint, data)['result'], 16))
+            except (EndpointUnavailable, KeyError, TypeError, ValueError):
+                continue
+            if endpoint.head >= min_head:
+                return endpoint
+        return None
+
+    def _read(self, data, min_head=None):
+        """
+        Send a read with load balancing, hedging and failover; returns the first reply
+
+        Args:
+            data: Encoded JSON-RPC request
+            min_head: Only send to endpoints that have reached this block
+        """
+        with self._stats_lock:
+            self.reads += 1
+            hedge_delay = self._hedge_delay if self.max_hedge_ratio > 0 else None
+
+        started = time.perf_counter()
+        if min_head is None:
+            # With no healthy endpoint left, the primary is still worth a try
+            first = self._choose() or self.primary
+        else:
+            # The probe may not have seen the block yet: ask the endpoints directly
+            first = self._choose(min_head=min_head) or self._probe_head(min_head)
+            if first is None:
+                raise EndpointUnavailable(f"No endpoint has reached block {min_head}")
+        pending = {self._executor.submit(self._post, first, data): first}
+        tried = [first]
+        errors = []
+        hedged = False
+
+        while True:
+            timeout = hedge_delay if not hedged and hedge_delay is not None else None
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            if not done:
+                # Slower than the hedge delay: race a second endpoint
+                hedged = True
+                other = self._choose(exclude=tried, min_head=min_head)
+                if other is not None and self._take_hedge():
+                    pending[self._executor.submit(self._post, other, data)] = other
+                    tried.append(other)
+                continue
+
+            for future in done:
+                endpoint = pending.pop(future)
+                try:
+                    reply = future.result()
+                except EndpointUnavailable as e:
+                    errors.append(str(e))
+                    continue
+                self._observe_read(time.perf_counter() - started)
+                if hedged and endpoint is not first:
+                    with self._stats_lock:
+                        self.hedge_wins += 1
+                return reply
+
+            if not pending:
+                other = self._choose(exclude=tried, min_head=min_head)
+                if other is None:
+                    raise EndpointUnavailable('; '.join(errors))
+                with self._stats_lock:
+                    self.failovers += 1
+                pending[self._executor.submit(self._post, other, data)] = other
+                tried.append(other)
+
+    @staticmethod
+    def _block_number(value):
+        """Block number of a block parameter, None for tags such as 'latest'"""
+        if isinstance(value, int):
+            return value
+        if isinstance(value, str) and value.startswith('0x'):
+            return int(value, 16)
+        return None
+
+    @classmethod
+    def _required_head(cls, method, params):
+        """
+        Block an endpoint must have reached to answer a read: None when any
+        endpoint will do, 'latest' for open-ended log ranges
+        """
+        if method == 'eth_getLogs':
+            log_filter = params[0] if params and isinstance(params[0], dict) else {}
+            if 'blockHash' in log_filter:
+                return None
+            to_block = cls._block_number(log_filter.get('toBlock', 'latest'))
+            return 'latest' if to_block is None else to_block
+
+        position = BLOCK_PARAMS.get(method)
+        if position is None or len(params) <= position:
+            return None
+        return cls._block_number(params[position])
+
+    def _send(self, data, calls):
+        """Route encoded calls: reads to the pool, block-addressed reads to endpoints that have the block"""
+        if not all(method in READ_METHODS for method, _ in calls):
+            return self._post(self.primary, data)
+
+        ends = [self._required_head(method, params) for method, params in calls]
+        if 'latest' in ends:
+            return self._post(self.primary, data)
+        min_head = max((end for end in ends if end is not None), default=None)
+        return self._read(data, min_head)
+
+    def make_request(self, method, params):
+        return self._send(self.encode_rpc_request(method, params), [(method, params)])
+
+    def make_batch_request(self, calls):
+        """
+        Send a JSON-RPC batch; read-only batches are balanced like single reads
+
+        Args:
+            calls: List of (method, params) tuples
+
+        Returns:
+            List of JSON-RPC response objects as returned by the node
+        """
+        payload = [
+            {'jsonrpc': '2.0', 'id': i, 'method': method, 'params': params}
+            for i, (method, params) in enumerate(calls)
+        ]
+        return self._send(json.dumps(payload).encode('utf-8'), calls)
+
+    def is_connected(self, show_traceback=False):
+        """True if any endpoint answers"""
+        try:
+            return 'result' in self.make_request('web3_clientVersion', [])
+        except EndpointUnavailable:
+            if show_traceback:
+                raise
+            return False
+
+    def _probe_loop(self):
+        data = self.encode_rpc_request('eth_blockNumber', [])
+        while not self._stop.wait(self.probe_interval):
+            for endpoint in self.endpoints:
+                # Open breakers are left alone until their reset timeout passes
+                if endpoint.state == 'open':
+                    continue
+                try:
+                    reply = self._post(endpoint, data, timeout=self.probe_timeout)
+                    endpoint.head = int(reply['result'], 16)
+                except (EndpointUnavailable, KeyError, TypeError, ValueError):
+                    pass
+
+    def stats(self):
+        """Counters and per-endpoint state, for metrics and diagnostics"""
+        with self._stats_lock:
+            totals = {
+                'reads': self.reads,
+                'hedges': self.hedges,
+                'hedgeWins': self.hedge_wins,
+                'failovers': self.failovers,
+                'hedgeDelayMs': round(self._hedge_delay * 1000, 3) if self._hedge_delay is not None else None
+            }
+        totals['endpoints'] = [
+            {
+                'url': e.url,
+                'primary': e is self.primary,
+                'state': e.state,
+                'latencyMs': round(e.latency * 1000, 3) if e.latency is not None else None,
+                'inFlight': e.in_flight,
+                'requests': e.requests,
+                'failures': e.failures,
+                'head': e.head
+            }
+            for e in self.endpoints
+        ]
+        return totals
+
+    def close(self):
+        """Stop the health probe and the sending threads"""
+        self._stop.set()
+        self._executor.shutdown(wait=False)
@@ -2,11 +2,15 @@ const hre = require("hardhat");
 const fs = require("fs");
 const path = require("path");
 
+// CONTRACT_NAME=CertificateVerifierV2 deploys the compact bytes32 layout
+const CONTRACT_NAME = process.env.CONTRACT_NAME || "CertificateVerifier";
+const COMPACT = CONTRACT_NAME === "CertificateVerifierV2";
+
 async function main() {
-  console.log("\n🚀 Starting deployment of CertificateVerifier contract...\n");
+  console.log(`\n🚀 Starting deployment of ${CONTRACT_NAME} contract...\n`);
 
   // Get the contract factory
-  const CertificateVerifier = await hre.ethers.getContractFactory("CertificateVerifier");
+  const CertificateVerifier = await hre.ethers.getContractFactory(CONTRACT_NAME);
 
   // Deploy the contract
   console.log("⏳ Deploying contract...");
@@ -15,6 +19,7 @@ async function main() {
   await certificateVerifier.waitForDeployment();
 
   const contractAddress = await certificateVerifier.getAddress();
+  const deploymentReceipt = await certificateVerifier.deploymentTransaction().wait();
 
   console.log("\n✅ Contract deployed successfully!");
   console.log("📍 Contract Address:", contractAddress);
@@ -22,8 +27,10 @@ async function main() {
   // Save contract address and ABI
   const contractInfo = {
     address: contractAddress,
+    contractName: CONTRACT_NAME,
     abi: JSON.parse(certificateVerifier.interface.formatJson()),
     network: hre.network.name,
+    deploymentBlock: deploymentReceipt.blockNumber,
     deploymentTime: new Date().toISOString()
   };
 
@@ -60,6 +67,8 @@ async function main() {
 
   // Test storing a certificate
   const testCertId = "CERT-2024-001";
+  // The compact layout takes the ID as bytes32 (UTF-8, right-padded)
+  const testCertIdArg = COMPACT ? hre.ethers.encodeBytes32String(testCertId) : testCertId;
   const testHash = "0x" + "a".repeat(64); // Mock hash
   const testHolder = "John Doe";
   const testType = "Bachelor of Computer Science";
@@ -68,7 +77,7 @@ async function main() {
 
   console.log("\n📝 Storing test certificate...");
   const tx = await certificateVerifier.storeCertificate(
-    testCertId,
+    testCertIdArg,
     testHash,
     testHolder,
     testType,
@@ -81,7 +90,7 @@ async function main() {
   console.log("  Transaction Hash:", tx.hash);
 
   // Verify the certificate
-  const certData = await certificateVerifier.verifyCertificateById(testCertId);
+  const certData = await certificateVerifier.verifyCertificateById(testCertIdArg);
   console.log("\n✅ Certificate verification successful!");
   console.log("  Certificate ID:", testCertId);
   console.log("  Holder:", certData[2]); // holderName
@@ -0,0 +1,122 @@
+"""
+Copy every certificate from a CertificateVerifier deployment into a
+CertificateVerifierV2 (compact bytes32 layout) deployment
+
+Certificates keep their original timestamps and issuers and are imported
+in chunks with importCertificates, which only the V2 contract's owner may
+call. Certificates already present in the target are skipped, so an
+interrupted migration can simply be run again. IDs longer than 32 bytes
+cannot be represented by V2 and are reported instead of imported.
+
+Deploy the target first:
+    CONTRACT_NAME=CertificateVerifierV2 npx hardhat run scripts/deploy.js --network ganache
+
+Usage:
+    python scripts/migrate_to_v2.py --source 0xOLD --source-abi old_abi.json \\
+        --target 0xNEW --target-abi deployments/contract_abi.json --chunk 25
+"""
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from blockchain_handler import BlockchainHandler
+from certificate_codec import ID_BYTES
+
+
+def read_source(source, chunk):
+    """Yield full certificate records from the source registry, chunk at a time"""
+    batch = []
+    for listed in source.iter_certificates():
+        batch.append(listed)
+        if len(batch) >= chunk:
+            yield complete_records(source, batch)
+            batch = []
+    if batch:
+        yield complete_records(source, batch)
+
+
+def complete_records(source, listed):
+    """Add the hash, timestamp and issuer that the registry listing leaves out"""
+    lookups = source.verify_certificates_bulk([('id', cert['certificateId']) for cert in listed])
+    records = []
+    for cert in listed:
+        details = lookups[('id', cert['certificateId'])]
+        if not isinstance(details, dict):
+            raise RuntimeError(f"Could not read certificate {cert['certificateId']}: {details}")
+        records.append({**cert, **details})
+    return records
+
+
+def import_chunk(target, records):
+    """Send one importCertificates transaction; returns its receipt"""
+    tx_hash = target.submitter.send(target.contract.functions.importCertificates([
+        (
+            target._id_arg(r['certificateId']),
+            target._hash_arg(r['certificateHash']),
+            r['holderName'],
+            r['certificateType'],
+            r['institution'],
+            r['issueDate'],
+            r['timestamp'],
+            r['issuer']
+        )
+        for r in records
+    ]))
+    return target.submitter.wait(tx_hash)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--provider', default=os.environ.get('BLOCKCHAIN_PROVIDER', 'http://127.0.0.1:7545'))
+    parser.add_argument('--source', required=True, help='CertificateVerifier address')
+    parser.add_argument('--source-abi', required=True)
+    parser.add_argument('--target', required=True, help='CertificateVerifierV2 address')
+    parser.add_argument('--target-abi', required=True)
+    parser.add_argument('--chunk', type=int, default=25, help='Certificates per import transaction')
+    args = parser.parse_args()
+
+    source = BlockchainHandler(args.provider, args.source, args.source_abi, cache_max_bytes=0)
+    target = BlockchainHandler(args.provider, args.target, args.target_abi, cache_max_bytes=0)
+
+    if source.compact_layout or not target.compact_layout:
+        sys.exit("✗ Source must be a CertificateVerifier and target a CertificateVerifierV2 deployment")
+    if target.contract.functions.owner().call() != target.account:
+        sys.exit(f"✗ Only the target contract's owner can import certificates, not {target.account}")
+
+    imported, skipped, unrepresentable, gas_used = 0, 0, [], 0
+    for records in read_source(source, args.chunk):
+        existing = target.verify_certificates_bulk([('id', r['certificateId']) for r in records])
+        to_import = []
+        for record in records:
+            cert_id = record['certificateId']
+            if len(cert_id.encode('utf-8')) > ID_BYTES:
+                unrepresentable.append(cert_id)
+            elif isinstance(existing.get(('id', cert_id)), dict):
+                skipped += 1
+            else:
+                to_import.append(record)
+
+        if not to_import:
+            continue
+
+        receipt = import_chunk(target, to_import)
+        if receipt.status != 1:
+            reason = 'ran out of gas' if target.submitter.ran_out_of_gas(receipt) else 'reverted'
+            sys.exit(f"✗ Import transaction {receipt.transactionHash.hex()} {reason}")
+        imported += len(to_import)
+        gas_used += receipt.gasUsed
+        print(f"✓ Imported {imported} certificates (block {receipt.blockNumber})")
+
+    print(json.dumps({
+        'imported': imported,
+        'alreadyPresent': skipped,
+        'gasUsed': gas_used,
+        'unrepresentableIds': unrepresentable
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Production server: gunicorn prefork workers with a preloaded app
+
+The app module (Flask, web3, the contract ABI and deployment record) is
+imported once in the master before forking, so workers start from a warm
+copy-on-write image instead of repeating the imports. Nothing that talks to
+the node runs before fork: each worker connects in the background with
+exponential backoff, so a slow or down node never stops the server from
+starting. Until a worker is connected, routes that need the chain answer
+"Blockchain not initialized".
+
+Cold-start timings are logged and exposed on /metrics
+(app_preload_seconds, blockchain_init_seconds).
+
+Each worker keeps its own metrics, so workers write them to a shared
+directory (METRICS_DIR, default a new temporary directory) and /metrics
+renders the totals of all workers, whichever one answers the scrape.
+Values owned by a worker's objects, such as cache and RPC pool statistics
+and cold-start timings, are reported per worker with a worker label.
+
+Usage:
+    python serve.py --bind 127.0.0.1:5000 --workers 4 --threads 8
+"""
+import argparse
+import os
+import tempfile
+import time
+
+STARTED = time.perf_counter()
+
+from gunicorn.app.base import BaseApplication
+
+
+def post_fork(server, worker):
+    import app as app_module
+    import metrics
+    metrics.registry.enable_multiprocess(os.environ['METRICS_DIR'])
+    app_module.start_blockchain_init()
+
+
+def when_ready(server):
+    print(f"✓ Server ready in {time.perf_counter() - STARTED:.3f}s, forking workers")
+
+
+class PreforkApplication(BaseApplication):
+    """Gunicorn application serving app.app with the given settings"""
+
+    def __init__(self, options):
+        self.options = options
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        started = time.perf_counter()
+        import app as app_module
+        try:
+            app_module.load_deployment()
+        except Exception as e:
+            # Workers retry when they connect
+            print(f"✗ Error reading deployment: {str(e)}")
+        app_module.startup_timings['preloadSeconds'] = time.perf_counter() - started
+        print(f"✓ App preloaded in {app_module.startup_timings['preloadSeconds']:.3f}s")
+        return app_module.app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--bind', default=os.environ.get('BIND', '127.0.0.1:5000'))
+    parser.add_argument('--workers', type=int, default=int(os.environ.get('WEB_CONCURRENCY', (os.cpu_count() or 1) * 2 + 1)))
+    parser.add_argument('--threads', type=int, default=int(os.environ.get('GUNICORN_THREADS', '8')))
+    parser.add_argument('--timeout', type=int, default=int(os.environ.get('GUNICORN_TIMEOUT', '60')))
+    args = parser.parse_args()
+
+    import metrics
+    os.environ['METRICS_DIR'] = os.environ.get('METRICS_DIR') or tempfile.mkdtemp(prefix='certificate-metrics-')
+    metrics.clear_multiprocess_directory(os.environ['METRICS_DIR'])
+
+    PreforkApplication({
+        'bind': args.bind,
+        'workers': args.workers,
+        'threads': args.threads,
+        'worker_class': 'gthread',
+        'timeout': args.timeout,
+        'preload_app': True,
+        'post_fork': post_fork,
+        'when_ready': when_ready
+    }).run()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+import heapq
+import threading
+import time
+
+# Node error messages meaning the nonce we sent no longer matches its view
+NONCE_ERRORS = ('nonce too low', 'nonce too high', 'already known', 'known transaction',
+                'replacement transaction underpriced', 'incorrect nonce', 'invalid nonce')
+
+
+class TransactionSubmitter:
+    """
+    Sends contract transactions from one account with locally managed nonces.
+
+    Nonces come from a local counter under a lock, so concurrent threads never
+    race for the same one. The counter is re-seeded from the node's pending
+    transaction count when no send is in progress and it has been idle for
+    resync_interval seconds, which also picks up transactions sent from the
+    account by other tools. A nonce whose send
+    never reached the node is released and handed to the next transaction,
+    so no gap is left that would stall every later one; nonce errors from the
+    node trigger a resync and one retry.
+
+    Gas limits come from eth_estimateGas, cached with a safety margin
+    instead of a fixed limit. The cache is keyed on the function and the
+    number of storage slots each string or bytes argument takes, which is
+    what a store's gas cost grows with, so a call is never sent with the
+    estimate of one writing fewer slots. Receipts are collected by the
+    shared ReceiptPoller.
+    """
+
+    def __init__(self, web3, account, receipt_poller, gas_margin=1.25, resync_interval=1.0):
+        """
+        Args:
+            web3: Web3 instance
+            account: Sending account address
+            receipt_poller: ReceiptPoller that tracks submitted transactions
+            gas_margin: Multiplier applied to gas estimates
+            resync_interval: Idle seconds after which the nonce counter is
+                re-seeded from the node
+        """
+        self.web3 = web3
+        self.account = account
+        self.receipt_poller = receipt_poller
+        self.gas_margin = gas_margin
+        self.resync_interval = resync_interval
+
+        self._lock = threading.Lock()
+        self._next_nonce = None
+        self._released = []  # min-heap of nonces to reuse first
+        self._sending = 0
+        self._last_used = 0.0
+
+        self._gas_lock = threading.Lock()
+        self._gas_limits = {}  # (function name, argument shape) -> gas limit
+
+    def _allocate_nonce(self):
+        with self._lock:
+            now = time.monotonic()
+            if self._next_nonce is None or \
+                    (self._sending == 0 and now - self._last_used >= self.resync_interval):
+                # Nothing of ours is mid-flight, so the node's count is exact
+                self._next_nonce = self.web3.eth.get_transaction_count(self.account, 'pending')
+                self._released = []
+            self._sending += 1
+            self._last_used = now
+
+            if self._released:
+                return heapq.heappop(self._released)
+
+            nonce = self._next_nonce
+            self._next_nonce += 1
+            return nonce
+
+    def _finish_send(self, nonce, consumed):
+        with self._lock:
+            self._sending -= 1
+            if not consumed:
+                heapq.heappush(self._released, nonce)
+
+    def _resync(self):
+        """Move the counter past nonces the node has seen from other senders"""
+        node_next = self.web3.eth.get_transaction_count(self.account, 'pending')
+        with self._lock:
+            self._released = [n for n in self._released if n >= node_next]
+            heapq.heapify(self._released)
+            if self._next_nonce is None or self._next_nonce < node_next:
+                self._next_nonce = node_next
+
+    def _nonce_consumed(self, nonce):
+        """Ask the node whether a failed send still used its nonce"""
+        try:
+            return self.web3.eth.get_transaction_count(self.account, 'pending') > nonce
+        except Exception:
+            # Unknown: assume it was used, the next resync corrects the counter
+            return True
+
+    @classmethod
+    def _arg_shape(cls, arg):
+        if isinstance(arg, str):
+            arg = arg.encode()
+        if isinstance(arg, (bytes, bytearray)):
+            # Storage slots of a Solidity string: empty, inline under 32
+            # bytes, otherwise a length slot plus one slot per 32-byte word
+            if not arg:
+                return 0
+            return 1 if len(arg) < 32 else 1 + -(-len(arg) // 32)
+        if isinstance(arg, (list, tuple)):
+            return tuple(cls._arg_shape(item) for item in arg)
+        return None
+
+    def _gas_key(self, fn_call):
+        return fn_call.fn_name, self._arg_shape(fn_call.args)
+
+    def gas_limit(self, fn_call):
+        """Cached gas limit for a contract call (estimates on first use)"""
+        key = self._gas_key(fn_call)
+        with self._gas_lock:
+            limit = self._gas_limits.get(key)
+        if limit is not None:
+            return limit
+
+        limit = int(fn_call.estimate_gas({'from': self.account}) * self.gas_margin)
+        with self._gas_lock:
+            limit = max(limit, self._gas_limits.get(key, 0))
+            self._gas_limits[key] = limit
+        return limit
+
+    def send(self, fn_call):
+        """
+        Send a contract transaction with a local nonce and cached gas limit
+
+        Args:
+            fn_call: Bound contract function, e.g. contract.functions.f(args)
+
+        Returns:
+            Transaction hash (HexBytes)
+
+        Raises:
+            Exception: If gas estimation fails (the call would revert) or
+                the node rejects the transaction
+        """
+        gas = self.gas_limit(fn_call)
+
+        for attempt in range(2):
+            nonce = self._allocate_nonce()
+            try:
+                tx_hash = fn_call.transact({'from': self.account, 'gas': gas, 'nonce': nonce})
+            except Exception as e:
+                self._finish_send(nonce, self._nonce_consumed(nonce))
+                if attempt == 0 and any(msg in str(e).lower() for msg in NONCE_ERRORS):
+                    self._resync()
+                    continue
+                raise
+            self._finish_send(nonce, True)
+            return tx_hash
+
+    def ran_out_of_gas(self, receipt):
+        """Whether a failed transaction used its whole gas limit rather than reverting"""
+        try:
+            return receipt.gasUsed >= self.web3.eth.get_transaction(receipt.transactionHash)['gas']
+        except Exception:
+            return False
+
+    def wait(self, tx_hash, timeout=120):
+        """Wait for a transaction's receipt through the shared receipt poller"""
+        return self.receipt_poller.wait_for_receipt(tx_hash, timeout=timeout)
@@ -0,0 +1,124 @@
+import json
+import sys
+import threading
+from collections import OrderedDict
+
+
+# Rough per-entry bookkeeping cost (OrderedDict node, tuple, key tuple)
+ENTRY_OVERHEAD = 200
+
+
+class VerificationCache:
+    """
+    Bounded LRU cache for certificate verification results.
+
+    Certificates are write-once on chain, so positive results never expire
+    and only leave the cache under memory pressure. Negative results are
+    tagged with the block number they were observed at and become stale as
+    soon as the chain moves past that block.
+    """
+
+    def __init__(self, max_bytes=16 * 1024 * 1024):
+        """
+        Args:
+            max_bytes: Upper bound on the estimated memory held by entries
+        """
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (value, observed_block, size)
+        self._lock = threading.Lock()
+        self._size = 0
+
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _estimate_size(key, value):
+        """Approximate memory footprint of one entry in bytes"""
+        size = ENTRY_OVERHEAD + sum(sys.getsizeof(part) for part in key)
+        if value is not None:
+            size += len(json.dumps(value, default=str))
+        return size
+
+    def get(self, key, current_block, min_block=None):
+        """
+        Look up a cached verification result
+
+        Args:
+            key: Cache key, e.g. ('id', cert_id)
+            current_block: Latest known block number
+            min_block: Oldest block a negative result may reflect (optional)
+
+        Returns:
+            Tuple of (found, value); value is None for a cached "not found"
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, observed_block, size = entry
+
+                if value is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, dict(value)
+
+                if observed_block >= current_block and (min_block is None or observed_block >= min_block):
+                    self._entries.move_to_end(key)
+                    self.negative_hits += 1
+                    return True, None
+
+                # A newer block may contain the certificate
+                del self._entries[key]
+                self._size -= size
+
+            self.misses += 1
+            return False, None
+
+    def _put(self, key, value, observed_block):
+        size = self._estimate_size(key, value)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= old[2]
+
+            self._entries[key] = (value, observed_block, size)
+            self._size += size
+
+            while self._size > self.max_bytes:
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self.evictions += 1
+
+    def put_hit(self, key, value):
+        """Cache a positive result; it stays valid forever"""
+        self._put(key, dict(value), None)
+
+    def put_miss(self, key, observed_block):
+        """Cache a negative result observed at the given block"""
+        self._put(key, None, observed_block)
+
+    def invalidate(self, key):
+        """Drop an entry, e.g. after storing the certificate it refers to"""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._size -= entry[2]
+
+    def stats(self):
+        """Return hit/miss counters and current occupancy"""
+        with self._lock:
+            lookups = self.hits + self.negative_hits + self.misses
+            return {
+                'hits': self.hits,
+                'negativeHits': self.negative_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hitRate': (self.hits + self.negative_hits) / lookups if lookups else 0.0,
+                'entries': len(self._entries),
+                'sizeBytes': self._size,
+                'maxBytes': self.max_bytes
+            }
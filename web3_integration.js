@@ -270,17 +270,18 @@ async function verifyCertificateByFile(file) {
     }
 }
 
-// Generate ZKP proof
-async function generateZKProof(certId) {
+// Generate ZKP proof of holding the certificate file
+async function generateZKProof(certId, file) {
     try {
         showNotification('Generating zero-knowledge proof...', 'info');
 
+        const formData = new FormData();
+        formData.append('certificateId', certId);
+        formData.append('file', file);
+
         const response = await fetch(`${API_BASE_URL}/zkp/generate`, {
             method: 'POST',
-            headers: {
-                'Content-Type': 'application/json'
-            },
-            body: JSON.stringify({ certificateId: certId })
+            body: formData
         });
 
         if (!response.ok) {
@@ -0,0 +1,276 @@
+import hashlib
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+
+# RFC 3526 group 14: 2048-bit safe prime p = 2q + 1. The generator 2 is a
+# quadratic residue mod p, so it generates the prime-order subgroup of size q.
+P = int(
+    'FFFFFFFFFFFFFFFFC90FDAA22168C234C4C6628B80DC1CD129024E088A67CC74'
+    '020BBEA63B139B22514A08798E3404DDEF9519B3CD3A431B302B0A6DF25F1437'
+    '4FE1356D6D51C245E485B576625E7EC6F44C42E9A637ED6B0BFF5CB6F406B7ED'
+    'EE386BFB5A899FA5AE9F24117C4B1FE649286651ECE45B3DC2007CB8A163BF05'
+    '98DA48361C55D39A69163FA8FD24CF5F83655D23DCA3AD961C62F356208552BB'
+    '9ED529077096966D670C354E4ABC9804F1746C08CA18217C32905E462E36CE3B'
+    'E39E772C180E86039B2783A2EC07A28FB5C55DF06F4C52C9DE2BCBF695581718'
+    '3995497CEA956AE515D2261898FA051015728E5A8AACAA68FFFFFFFFFFFFFFFF',
+    16
+)
+Q = (P - 1) // 2
+G = 2
+
+SCHEME = 'schnorr-nizk-rfc3526-2048'
+ELEMENT_BYTES = 256
+CHALLENGE_BYTES = 32
+PROOF_BYTES = CHALLENGE_BYTES + ELEMENT_BYTES
+
+# Fixed-base window size for exponentiations of G
+WINDOW_BITS = 8
+
+# Proving parameters, built once per worker process by _init_worker
+_G_TABLE = None
+
+
+def _build_g_table():
+    """Precompute G^(j * 2^(WINDOW_BITS * i)) for every window i and digit j"""
+    table = []
+    base = G
+    for _ in range((Q.bit_length() + WINDOW_BITS - 1) // WINDOW_BITS):
+        row = [1] * (1 << WINDOW_BITS)
+        for j in range(1, 1 << WINDOW_BITS):
+            row[j] = row[j - 1] * base % P
+        table.append(row)
+        base = row[-1] * base % P
+    return table
+
+
+def _init_worker():
+    global _G_TABLE
+    _G_TABLE = _build_g_table()
+
+
+def _pow_g(exponent):
+    """G^exponent mod P using the fixed-base table when it is loaded"""
+    if _G_TABLE is None:
+        return pow(G, exponent, P)
+
+    mask = (1 << WINDOW_BITS) - 1
+    result = 1
+    i = 0
+    while exponent:
+        digit = exponent & mask
+        if digit:
+            result = result * _G_TABLE[i][digit] % P
+        exponent >>= WINDOW_BITS
+        i += 1
+    return result
+
+
+def _int_to_bytes(value, length=ELEMENT_BYTES):
+    return value.to_bytes(length, 'big')
+
+
+def derive_secret(cert_id, document):
+    """
+    Witness bound to a certificate, derived from the certificate document
+
+    Only the document's SHA-256 is ever published, and this is a different
+    hash of the full content, so knowing it takes the document itself.
+    """
+    digest = hashlib.sha512(b'zkp-certificate-witness' + cert_id.encode() + b'\x00' + document).digest()
+    return int.from_bytes(digest, 'big') % Q
+
+
+def _read_secret(cert_id, document_path):
+    with open(document_path, 'rb') as f:
+        return derive_secret(cert_id, f.read())
+
+
+def _challenge(commitment, nonce_commitment, cert_id, timestamp):
+    """Fiat-Shamir challenge binding the statement and public inputs"""
+    digest = hashlib.sha256(
+        SCHEME.encode()
+        + _int_to_bytes(commitment)
+        + _int_to_bytes(nonce_commitment)
+        + cert_id.encode() + b'\x00'
+        + timestamp.to_bytes(8, 'big')
+    ).digest()
+    return int.from_bytes(digest, 'big') % Q
+
+
+def _prove(cert_id, x, timestamp):
+    """Produce a Schnorr proof of knowledge of the certificate witness x"""
+    started = time.perf_counter()
+
+    commitment = _pow_g(x)
+
+    k = secrets.randbelow(Q - 1) + 1
+    nonce_commitment = _pow_g(k)
+    c = _challenge(commitment, nonce_commitment, cert_id, timestamp)
+    s = (k + c * x) % Q
+
+    proof = _int_to_bytes(c, CHALLENGE_BYTES) + _int_to_bytes(s)
+    return {
+        'proof': proof.hex(),
+        'publicInputs': {
+            'certificateId': cert_id,
+            'commitment': _int_to_bytes(commitment).hex(),
+            'timestamp': timestamp
+        },
+        'proofSize': len(proof),
+        'scheme': SCHEME,
+        'generationMs': (time.perf_counter() - started) * 1000
+    }
+
+
+def _verify(proof_hex, public_inputs, document_path):
+    """
+    Check one proof against the certificate document on record
+
+    A valid Schnorr proof only shows knowledge of the discrete log of the
+    commitment it carries, so the commitment must also equal the one
+    derived from the certificate ID and the document on record.
+
+    Returns:
+        Tuple of (valid, error)
+    """
+    try:
+        proof = bytes.fromhex(proof_hex)
+        if len(proof) != PROOF_BYTES:
+            return False, 'Invalid proof length'
+
+        c = int.from_bytes(proof[:CHALLENGE_BYTES], 'big')
+        s = int.from_bytes(proof[CHALLENGE_BYTES:], 'big')
+        commitment = int(public_inputs['commitment'], 16)
+        cert_id = public_inputs['certificateId']
+        timestamp = int(public_inputs['timestamp'])
+    except (KeyError, TypeError, ValueError):
+        return False, 'Malformed proof or public inputs'
+
+    if not isinstance(cert_id, str):
+        return False, 'Malformed proof or public inputs'
+
+    # The challenge encodes the timestamp in 8 unsigned bytes
+    if not (1 < commitment < P - 1) or s >= Q or c >= Q or not 0 <= timestamp < 1 << 64:
+        return False, 'Proof values out of range'
+
+    if pow(commitment, Q, P) != 1:
+        return False, 'Commitment is not in the proof group'
+
+    try:
+        expected = _pow_g(_read_secret(cert_id, document_path))
+    except OSError:
+        return False, 'Certificate document could not be read'
+    if commitment != expected:
+        return False, 'Commitment does not match the certificate'
+
+    # g^s = t * y^c  =>  t = g^s * y^(-c)
+    nonce_commitment = _pow_g(s) * pow(commitment, Q - c, P) % P
+    if _challenge(commitment, nonce_commitment, cert_id, timestamp) != c:
+        return False, None
+    return True, None
+
+
+def _verify_many(items):
+    return [_verify(proof_hex, public_inputs, document_path) for proof_hex, public_inputs, document_path in items]
+
+
+class ProofEngine:
+    """
+    Zero-knowledge proof engine running in a pool of worker processes.
+
+    Proofs are non-interactive Schnorr proofs (Fiat-Shamir) over the RFC 3526
+    2048-bit group that the prover knows the witness derived from a
+    certificate's ID and full document, without revealing either the
+    witness or the document. The document is never published (the registry
+    only records its SHA-256), so a proof stands for possession of the
+    certificate itself. Verifying needs the document on record to recompute
+    the expected commitment. Each worker precomputes a fixed-base table for
+    the generator once at startup. Proofs are cached by certificate ID and
+    commitment.
+    """
+
+    def __init__(self, workers=None, cache_size=10000):
+        """
+        Args:
+            workers: Worker processes (default: CPU count)
+            cache_size: Number of generated proofs kept for reuse
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.cache_size = cache_size
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def _executor(self):
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+            return self._pool
+
+    def generate(self, cert_id, document):
+        """
+        Generate (or reuse) a proof for a certificate
+
+        Args:
+            cert_id: Certificate ID (public input)
+            document: Certificate document bytes (private, the witness is
+                derived from it)
+
+        Returns:
+            Proof dict with proof, publicInputs, proofSize, scheme,
+            generationMs and cached flag
+        """
+        x = derive_secret(cert_id, document)
+        key = (cert_id, x)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return {**cached, 'cached': True}
+
+        timestamp = int(time.time())
+        proof = self._executor().submit(_prove, cert_id, x, timestamp).result()
+
+        with self._cache_lock:
+            self._cache[key] = proof
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return {**proof, 'cached': False}
+
+    def verify_batch(self, proofs):
+        """
+        Verify several proofs, spread across the worker pool
+
+        Args:
+            proofs: List of (proof_hex, public_inputs, document_path) tuples,
+                where document_path is the certificate's document on record
+
+        Returns:
+            List of (valid, error) tuples in input order
+        """
+        if not proofs:
+            return []
+
+        chunk = max(1, (len(proofs) + self.workers - 1) // self.workers)
+        futures = [
+            self._executor().submit(_verify_many, proofs[i:i + chunk])
+            for i in range(0, len(proofs), chunk)
+        ]
+
+        results = []
+        for future in futures:
+            results.extend(future.result())
+        return results
+
+    def shutdown(self):
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None